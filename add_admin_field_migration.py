@@ -11,19 +11,16 @@ from sqlalchemy import text
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import app, db
+from migration_utils import introspect_columns
 
 def add_admin_field():
     """Add is_admin field to users table"""
     with app.app_context():
         try:
             # Check if column already exists
-            result = db.session.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'users' AND column_name = 'is_admin'
-            """))
+            existing = introspect_columns(db.session.connection(), ['users'])
             
-            if result.fetchone():
+            if 'is_admin' in existing['users']:
                 print("✅ is_admin column already exists")
                 return
             
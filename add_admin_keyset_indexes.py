@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Database migration to add the (timestamp DESC, id DESC) keyset pagination indexes
+used by the admin user list and admin action log
+"""
+
+import sys
+from migration_utils import create_indexes
+
+INDEXES = {
+    'ix_users_created_id': 'users (created_at DESC, id DESC)',
+    'ix_admin_action_log_timestamp_id': 'admin_action_log (timestamp DESC, id DESC)',
+}
+
+def add_admin_keyset_indexes():
+    """Add keyset pagination indexes to users and admin_action_log tables"""
+    return create_indexes(INDEXES)
+
+if __name__ == "__main__":
+    print("🔄 Running admin keyset index migration...")
+    success = add_admin_keyset_indexes()
+    
+    if success:
+        print("🎉 Migration completed successfully!")
+        sys.exit(0)
+    else:
+        print("❌ Migration failed!")
+        sys.exit(1)
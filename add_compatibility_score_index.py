@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Database migration to add the compatibility_matrix indexes: (user_a_id, overall_score DESC)
+for top-K matches and user_b_id for per-user deletes
+"""
+
+import sys
+from migration_utils import create_indexes
+
+INDEXES = {
+    'ix_compat_user_a_score': 'compatibility_matrix (user_a_id, overall_score DESC)',
+    'ix_compat_user_b': 'compatibility_matrix (user_b_id)',
+}
+
+def add_compatibility_score_index():
+    """Add top-K match and user_b_id indexes to compatibility_matrix table"""
+    return create_indexes(INDEXES)
+
+if __name__ == "__main__":
+    print("🔄 Running compatibility score index migration...")
+    success = add_compatibility_score_index()
+    
+    if success:
+        print("🎉 Migration completed successfully!")
+        sys.exit(0)
+    else:
+        print("❌ Migration failed!")
+        sys.exit(1)
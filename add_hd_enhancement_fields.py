@@ -6,7 +6,13 @@ Database migration to add HD enhancement fields to CompatibilityMatrix table
 import os
 import sys
 from sqlalchemy import create_engine, text
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+from migration_utils import introspect_columns
+
+HD_ENHANCEMENT_COLUMNS = {
+    'hd_enhancement_factor': 'FLOAT',
+    'compatibility_insights': 'TEXT'
+}
 
 def add_hd_enhancement_fields():
     """Add HD enhancement fields to compatibility_matrix table"""
@@ -19,56 +25,24 @@ def add_hd_enhancement_fields():
     
     try:
         # Create engine
-        engine = create_engine(database_url)
+        engine = create_engine(database_url, poolclass=NullPool)
         
-        # Check if fields already exist
-        with engine.connect() as conn:
-            # Check if hd_enhancement_factor column exists
-            try:
-                result = conn.execute(text("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'compatibility_matrix' 
-                    AND column_name = 'hd_enhancement_factor'
-                """))
-                
-                if result.fetchone():
-                    print("HD enhancement fields already exist in compatibility_matrix table")
-                    return True
-                    
-            except Exception as e:
-                print(f"Error checking existing columns: {e}")
+        # Check which fields already exist, then add the missing ones in one transaction
+        with engine.begin() as conn:
+            existing = introspect_columns(conn, ['compatibility_matrix'])['compatibility_matrix']
+            missing = [name for name in HD_ENHANCEMENT_COLUMNS if name not in existing]
             
-            # Add the new columns
-            try:
-                print("Adding hd_enhancement_factor column...")
-                conn.execute(text("""
-                    ALTER TABLE compatibility_matrix 
-                    ADD COLUMN hd_enhancement_factor FLOAT
-                """))
-                conn.commit()
-                print("✅ Added hd_enhancement_factor column")
-                
-            except OperationalError as e:
-                if "already exists" in str(e).lower():
-                    print("hd_enhancement_factor column already exists")
-                else:
-                    print(f"Error adding hd_enhancement_factor: {e}")
+            if not missing:
+                print("HD enhancement fields already exist in compatibility_matrix table")
+                return True
             
-            try:
-                print("Adding compatibility_insights column...")
-                conn.execute(text("""
+            for name in missing:
+                print(f"Adding {name} column...")
+                conn.execute(text(f"""
                     ALTER TABLE compatibility_matrix 
-                    ADD COLUMN compatibility_insights TEXT
+                    ADD COLUMN {name} {HD_ENHANCEMENT_COLUMNS[name]}
                 """))
-                conn.commit()
-                print("✅ Added compatibility_insights column")
-                
-            except OperationalError as e:
-                if "already exists" in str(e).lower():
-                    print("compatibility_insights column already exists")
-                else:
-                    print(f"Error adding compatibility_insights: {e}")
+                print(f"✅ Added {name} column")
         
         print("✅ HD enhancement fields migration completed successfully")
         return True
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Database migration to index user_sessions.expires_at so expired sessions are purged with
+an index range DELETE (flask purge-sessions) instead of a full table scan
+"""
+
+import sys
+from migration_utils import create_indexes
+
+INDEXES = {
+    'ix_user_sessions_expires_at': 'user_sessions (expires_at)',
+}
+
+def add_session_expiry_index():
+    """Add the expires_at index to the user_sessions table"""
+    return create_indexes(INDEXES)
+
+if __name__ == "__main__":
+    print("🔄 Running session expiry index migration...")
+    success = add_session_expiry_index()
+    
+    if success:
+        print("🎉 Migration completed successfully!")
+        sys.exit(0)
+    else:
+        print("❌ Migration failed!")
+        sys.exit(1)
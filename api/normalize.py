@@ -8,6 +8,18 @@ from typing import Dict, List, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Field mapping: camelCase → snake_case + short aliases
+_FIELD_MAPPING = {
+    'birthDate': 'birth_date',
+    'birthTime': 'birth_time',
+    'birthLocation': 'birth_location',
+    'date': 'birth_date',
+    'time': 'birth_time'
+}
+
+# Optional fields that should be dropped if empty
+_OPTIONAL_FIELDS = frozenset({'timezone', 'latitude', 'longitude', 'birth_location'})
+
 def normalize_birth_data_request(data: Dict[str, Any], route: str) -> Dict[str, Any]:
     """
     Normalize birth data request payload
@@ -20,50 +32,43 @@ def normalize_birth_data_request(data: Dict[str, Any], route: str) -> Dict[str,
         Normalized data dictionary
     """
     # Handle wrapper patterns
+    wrapper_detected = True
     if 'birth_data' in data:
         data = data['birth_data']
     elif 'birthData' in data:
         data = data['birthData']
-    
-    # Field mapping: camelCase → snake_case + short aliases
-    field_mapping = {
-        'birthDate': 'birth_date',
-        'birthTime': 'birth_time',
-        'birthLocation': 'birth_location',
-        'date': 'birth_date',
-        'time': 'birth_time'
-    }
-    
-    # Optional fields that should be dropped if empty
-    optional_fields = {'timezone', 'latitude', 'longitude', 'birth_location'}
+    else:
+        wrapper_detected = False
     
     normalized = {}
     dropped_empty = []
     alias_detected = False
-    wrapper_detected = 'birth_data' in data or 'birthData' in data
     
     for key, value in data.items():
-        canonical_key = field_mapping.get(key, key)
+        canonical_key = _FIELD_MAPPING.get(key)
         
         # Track if we used an alias
-        if key != canonical_key:
+        if canonical_key is None:
+            canonical_key = key
+        else:
             alias_detected = True
         
         # Drop empty optional fields
-        if canonical_key in optional_fields and (value == '' or value is None):
+        if canonical_key in _OPTIONAL_FIELDS and (value == '' or value is None):
             dropped_empty.append(canonical_key)
             continue
             
         normalized[canonical_key] = value
     
-    # Log save attempt
-    logger.info("save_attempt", extra={
-        'route': route,
-        'normalized_keys': list(normalized.keys()),
-        'dropped_empty': dropped_empty,
-        'alias_detected': alias_detected,
-        'wrapper_detected': wrapper_detected
-    })
+    # Log save attempt (skip building the extra payload when INFO is off)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("save_attempt", extra={
+            'route': route,
+            'normalized_keys': tuple(normalized),
+            'dropped_empty': dropped_empty,
+            'alias_detected': alias_detected,
+            'wrapper_detected': wrapper_detected
+        })
     
     return normalized
 
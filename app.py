@@ -10,29 +10,58 @@ Single-file architecture optimized for Railway deployment
 import os
 import json
 import hashlib
+import base64
 import secrets
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import re
+import itertools
+import queue
+import atexit
+import threading
+import random
+import io
+import csv
+import click
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import time as time_module
 from datetime import datetime, timedelta, date, time
 from decimal import Decimal
-from flask import Flask, request, jsonify, session, make_response, g
+from flask import Flask, request, jsonify, session, make_response, g, has_request_context
+from flask.logging import default_handler
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_session import Session
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from sqlalchemy import text, event
+from sqlalchemy import text, event, select, and_, or_, inspect as sa_inspect
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session as SASession, load_only, deferred, undefer, undefer_group
 from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.ext.compiler import compiles
 from flask_cors import CORS
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
 from werkzeug.middleware.proxy_fix import ProxyFix
 from argon2 import PasswordHasher
 from rate_limit import login_rate_limiter
 from argon2.exceptions import VerifyMismatchError
 import redis
+import numpy as np
+import orjson
+
+# Optional JIT for the all-pairs compatibility recompute; NumPy path is used without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Import Resonance Ten configuration
 from resonance_config import (
@@ -85,25 +114,88 @@ from audit.writer_contract_audit import audit_writer_response, create_writer_aud
 # API Contract Version
 SCHEMA_VERSION = "v1"
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; falls back to Flask's default() for dates/Decimal/UUID"""
+    
+    # Sorted keys and HTTP-date datetimes match DefaultJSONProvider output
+    OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS |
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY
+    )
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """jsonify() path: hand orjson's bytes straight to the Response (no str decode/re-encode)"""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype
+        )
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Logging: request threads only enqueue records; a listener thread does the stderr I/O.
+# gunicorn --preload forks after import and threads don't survive a fork, so the listener is
+# drained before forking and each worker starts its own with a fresh queue.
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s in %(module)s: %(message)s'))
+_log_queue_handler = QueueHandler(queue.SimpleQueue())
+log_listener = None
+
+def _start_log_listener(new_queue=False):
+    global log_listener
+    if new_queue:
+        _log_queue_handler.queue = queue.SimpleQueue()
+    log_listener = QueueListener(_log_queue_handler.queue, _log_stream_handler, respect_handler_level=True)
+    log_listener.start()
+
+def _stop_log_listener():
+    # Flushes pending records and joins the thread
+    if log_listener is not None and log_listener._thread is not None:
+        log_listener.stop()
+
+app.logger.removeHandler(default_handler)
+app.logger.addHandler(_log_queue_handler)
+# INFO by default so the status lines that used to be print()s still reach the logs;
+# lines carrying raw session ids log at DEBUG (LOG_LEVEL=DEBUG to see them)
+app.logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+_start_log_listener()
+os.register_at_fork(
+    before=_stop_log_listener,
+    after_in_parent=_start_log_listener,
+    after_in_child=lambda: _start_log_listener(new_queue=True)
+)
+atexit.register(_stop_log_listener)
 
 # Configure ProxyFix for proper HTTPS detection behind Vercel/Railway proxy
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
-# Enable SQL logging for debugging
-app.config["SQLALCHEMY_ECHO"] = True
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-
-# SQL timing and debugging events
-@event.listens_for(Engine, "before_cursor_execute")
-def _before_execute(conn, cursor, statement, parameters, context, executemany):
-    conn.info.setdefault("query_start_time", []).append(time_module.time())
-    app.logger.info("SQL_START: %s ; params=%s", statement, parameters)
+# SQL logging for debugging: off unless SQL_ECHO=1 (echo plus per-statement timing costs
+# two log calls and formatting on every query)
+SQL_ECHO = os.environ.get('SQL_ECHO') == '1'
+app.config["SQLALCHEMY_ECHO"] = SQL_ECHO
 
-@event.listens_for(Engine, "after_cursor_execute")
-def _after_execute(conn, cursor, statement, parameters, context, executemany):
-    total = time_module.time() - conn.info["query_start_time"].pop(-1)
-    app.logger.info("SQL_END: %.3f s", total)
+if SQL_ECHO:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+    
+    # SQL timing and debugging events
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time_module.perf_counter())
+        app.logger.debug("SQL_START: %s ; params=%s", statement, parameters)
+    
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        total = time_module.perf_counter() - conn.info["query_start_time"].pop(-1)
+        app.logger.debug("SQL_END: %.3f s", total)
 
 class Config:
     """Railway-optimized configuration with Auth v2 session support"""
@@ -117,6 +209,24 @@ class Config:
     SQLALCHEMY_DATABASE_URI = DATABASE_URL or 'sqlite:///glow_dev.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # JSON/JSONB columns (de)serialize through orjson on both dialects
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'json_serializer': lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode(),
+        'json_deserializer': orjson.loads
+    }
+    
+    # Connection pooling for Postgres; SQLite keeps SQLAlchemy's default pool
+    if not SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': int(os.environ.get('POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('POOL_MAX_OVERFLOW', 20)),
+            'pool_timeout': int(os.environ.get('POOL_TIMEOUT', 30)),
+            'pool_recycle': int(os.environ.get('POOL_RECYCLE', 1800)),
+            'pool_pre_ping': True,
+            # Hand out the most recently returned connection so idle extras can age out server-side
+            'pool_use_lifo': True
+        })
+    
     # Auth v2 Session Configuration
     # Use filesystem sessions for Flask-Session (we have our own Redis store)
     SESSION_TYPE = 'filesystem'  # Always use filesystem for Flask-Session
@@ -191,6 +301,16 @@ app.config.from_object(Config)
 db = SQLAlchemy()
 db.init_app(app)
 
+# Pool observability: log pool stats on every connection checkout
+@event.listens_for(Pool, "checkout")
+def _on_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool = connection_proxy._pool
+    if isinstance(pool, QueuePool) and app.logger.isEnabledFor(logging.DEBUG):
+        app.logger.debug(
+            "POOL_CHECKOUT: size=%d checked_out=%d overflow=%d",
+            pool.size(), pool.checkedout(), pool.overflow()
+        )
+
 # Initialize Flask-Session (filesystem for cookie management)
 sess = Session()
 sess.init_app(app)
@@ -199,11 +319,11 @@ sess.init_app(app)
 limiter = Limiter(key_func=get_remote_address, default_limits=[])
 
 # Initialize Argon2 password hasher
-ph = PasswordHasher()
+ph = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
 
 # Initialize Redis session store (T3.1-R2)
 session_store = get_session_store()
-app.logger.info(f"Session store initialized: {type(session_store).__name__}")
+app.logger.info("Session store initialized: %s", type(session_store).__name__)
 
 # Runtime rate limiter initialization
 redis_url = os.getenv("REDIS_URL")
@@ -212,7 +332,10 @@ app.config["RATELIMIT_STORAGE_URI"] = storage_uri
 app.config["RATELIMIT_HEADERS_ENABLED"] = True
 app.config["RATELIMIT_IN_MEMORY_FALLBACK"] = True
 limiter.init_app(app)
-app.logger.info(f"RL storage: {'redis' if redis_url else 'memory'}")
+app.logger.info("RL storage: %s", 'redis' if redis_url else 'memory')
+
+# Shared Redis client for application caches (None without REDIS_URL; callers fall through on errors)
+cache_redis = redis.from_url(redis_url, socket_timeout=0.2, socket_connect_timeout=0.2) if redis_url else None
 
 # Optional strict mode enforcement
 if os.getenv("RATELIMIT_STRICT") == "1" and not redis_url:
@@ -230,17 +353,31 @@ ALLOWED_ORIGIN_PATTERNS = [
     re.compile(r"^http://localhost:(3000|5173)$"),  # Development only
 ]
 
+# Same allowlist as one alternation so each check is a single regex match
+ALLOWED_ORIGIN_REGEX = re.compile("|".join(f"(?:{pat.pattern})" for pat in ALLOWED_ORIGIN_PATTERNS))
+
+# The fixed origins from the allowlist above; nearly all traffic is one of these, which a
+# set lookup answers without running the regex (only Vercel previews fall through to it)
+ALLOWED_ORIGINS_STATIC = frozenset({
+    "https://glowme.io",
+    "https://www.glowme.io",
+    "http://localhost:3000",
+    "http://localhost:5173",
+})
+
 def origin_allowed(origin: str) -> bool:
     """Check if origin is in our allowlist"""
     if not origin:
         return False
-    return any(pat.match(origin) for pat in ALLOWED_ORIGIN_PATTERNS)
+    if origin in ALLOWED_ORIGINS_STATIC:
+        return True
+    return ALLOWED_ORIGIN_REGEX.match(origin) is not None
 
 # Flask-CORS handles most cases
 CORS(
     app,
     resources={r"/api/*": {
-        "origins": ALLOWED_ORIGIN_PATTERNS   # same allowlist
+        "origins": [ALLOWED_ORIGIN_REGEX]   # same allowlist
     }},
     supports_credentials=True,
     allow_headers=["Content-Type"],
@@ -252,14 +389,25 @@ CORS(
 @app.after_request
 def add_cors_headers(resp):
     # Only touch /api/* and only for explicitly allowed origins
+    if not request.path.startswith("/api/"):
+        return resp
     origin = request.headers.get("Origin")
-    if request.path.startswith("/api/") and origin_allowed(origin):
+    if origin_allowed(origin):
         # If Flask-CORS already set ACAO, leave it. Otherwise echo allowed origin.
         resp.headers.setdefault("Access-Control-Allow-Origin", origin)
         resp.headers.setdefault("Vary", "Origin")
         resp.headers.setdefault("Access-Control-Allow-Credentials", "true")
     return resp
 
+def private_cache(f):
+    """
+    Let a GET view's successful responses be stored by the user's own browser instead of
+    the blanket no-store, but revalidated on every use (private, no-cache); pair with an
+    ETag so each read is a bodiless 304. add_security_headers applies it.
+    """
+    f._cache_control = 'private, no-cache'
+    return f
+
 @app.after_request
 def add_security_headers(resp):
     """Add standard security headers to all API responses"""
@@ -269,9 +417,16 @@ def add_security_headers(resp):
         resp.headers['X-Content-Type-Options'] = 'nosniff'
         resp.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
         resp.headers['X-Frame-Options'] = 'DENY'
-        # Prevent caching of sensitive API responses
-        resp.headers['Cache-Control'] = 'no-store'
-        resp.headers['Pragma'] = 'no-cache'
+        # Prevent caching of sensitive API responses, except reads that opted in via private_cache
+        view = app.view_functions.get(request.endpoint)
+        cache_control = getattr(view, '_cache_control', None)
+        if cache_control and request.method == 'GET' and resp.status_code in (200, 304):
+            resp.headers['Cache-Control'] = cache_control
+            # Per-user body: never reuse one session's copy for another login in the same browser
+            resp.vary.add('Cookie')
+        else:
+            resp.headers['Cache-Control'] = 'no-store'
+            resp.headers['Pragma'] = 'no-cache'
         
         # S7-FSR-CLOSE: Additional hardening headers
         # CSP (report-only) – safe for JSON; no blocking of app behavior
@@ -302,7 +457,7 @@ def handle_session_renewal(resp):
         if session_id:
             # Reissue session cookie with existing security flags
             set_session_cookie(resp, session_id)
-            app.logger.info(f"Session cookie renewed in response: {session_id}")
+            app.logger.debug("Session cookie renewed in response: %s", session_id)
     return resp
 
 # Register writer contract audit middleware (PROT-4)
@@ -351,7 +506,7 @@ def format_birth_time_strict(birth_time):
         return birth_time.strftime('%H:%M')
     
     # Reject non-time types with error logging
-    app.logger.error(f"birth_time_format_error route=me type={type(birth_time)} value={birth_time}")
+    app.logger.error("birth_time_format_error route=me type=%s value=%s", type(birth_time), birth_time)
     raise ValueError(f"Invalid birth_time type: expected time, got {type(birth_time)}")
 
 def log_request_shape_keys(route, payload):
@@ -378,16 +533,31 @@ def log_request_shape_keys(route, payload):
         alias_detected = any(key in alias_fields for key in keys)
         
         # Emit structured log
-        app.logger.info(f"request_shape_keys route='{route}' keys={keys} alias_detected={alias_detected} wrapper_detected={wrapper_detected}")
+        app.logger.info("request_shape_keys route='%s' keys=%s alias_detected=%s wrapper_detected=%s", route, keys, alias_detected, wrapper_detected)
         
     except Exception as e:
         # Don't let logging errors mask the original validation error
-        app.logger.error(f"request_shape_keys logging failed: {e}")
+        app.logger.exception("request_shape_keys logging failed: %s", e)
 
 # ============================================================================
 # DATABASE MODELS
 # ============================================================================
 
+class sql_utcnow(FunctionElement):
+    """Naive UTC timestamp computed by the database, for timestamp column defaults"""
+    type = db.DateTime()
+    inherit_cache = True
+
+@compiles(sql_utcnow)
+def _compile_sql_utcnow(element, compiler, **kw):
+    # UTC in SQLAlchemy's SQLite DATETIME text format (microseconds included), so defaulted
+    # values compare equal to bound datetimes; CURRENT_TIMESTAMP drops the fraction
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+@compiles(sql_utcnow, 'postgresql')
+def _compile_sql_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
 class User(db.Model):
     """User authentication model - minimal auth data only"""
     __tablename__ = 'users'
@@ -397,17 +567,38 @@ class User(db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     status = db.Column(db.String(20), default='pending')  # pending, approved, suspended
     is_admin = db.Column(db.Boolean, default=False, nullable=False)  # Admin privilege flag
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=sql_utcnow())
+    updated_at = db.Column(db.DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
+    
+    __table_args__ = (
+        # Keyset pagination for the admin user list (newest first)
+        db.Index('ix_users_created_id', db.text('created_at DESC'), db.text('id DESC')),
+    )
+    
+    # One-to-one profile; lazy='raise' turns an accidental per-user lazy load (N+1 in list
+    # endpoints) into an error - list queries must selectinload(User.profile)
+    profile = db.relationship(
+        'UserProfile', uselist=False, back_populates='user', lazy='raise', cascade='all, delete-orphan'
+    )
+    
+    # Columns exposed by to_dict (password_hash is never serialized)
+    PUBLIC_COLUMNS = ('id', 'email', 'status', 'is_admin', 'created_at', 'updated_at')
     
     def to_dict(self):
+        return User.row_to_dict({key: getattr(self, key) for key in User.PUBLIC_COLUMNS})
+    
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a user given as any column-name mapping (ORM instance dict or Core row)"""
+        created_at = row['created_at']
+        updated_at = row['updated_at']
         return {
-            'id': self.id,
-            'email': self.email,
-            'status': self.status,
-            'is_admin': self.is_admin,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'id': row['id'],
+            'email': row['email'],
+            'status': row['status'],
+            'is_admin': row['is_admin'],
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None
         }
 
 class UserPriorities(db.Model):
@@ -441,12 +632,42 @@ class UserPriorities(db.Model):
             'space_priority': self.space_priority
         }
     
+    PRIORITY_COLUMNS = (
+        'love_priority', 'intimacy_priority', 'communication_priority',
+        'friendship_priority', 'collaboration_priority', 'lifestyle_priority',
+        'decisions_priority', 'support_priority', 'growth_priority', 'space_priority'
+    )
+    
+    @classmethod
+    def bulk_load_array(cls):
+        """
+        (user_ids, priorities) for every user whose 10 priorities are all set and in 1..10:
+        an id vector and an (N, 10) int8 matrix in PRIORITY_COLUMNS order, from one Core select
+        """
+        columns = [getattr(cls, column) for column in cls.PRIORITY_COLUMNS]
+        rows = db.session.execute(
+            select(cls.user_id, *columns)
+            .where(*(column.between(1, 10) for column in columns))
+            .order_by(cls.user_id)
+        ).all()
+        data = np.array(rows, dtype=np.int64).reshape(-1, 1 + len(columns))
+        return data[:, 0], data[:, 1:].astype(np.int8)
+    
     def get_priorities_array(self):
-        return [
-            self.love_priority, self.intimacy_priority, self.communication_priority,
-            self.friendship_priority, self.collaboration_priority, self.lifestyle_priority,
-            self.decisions_priority, self.support_priority, self.growth_priority, self.space_priority
-        ]
+        """Priorities as a 10-tuple, cached on the instance until a column is set, expired or refreshed"""
+        cached = self.__dict__.get('_priorities_cache')
+        if cached is None:
+            cached = tuple(getattr(self, column) for column in self.PRIORITY_COLUMNS)
+            self.__dict__['_priorities_cache'] = cached
+        return cached
+
+def _clear_priorities_cache(target, *args):
+    target.__dict__.pop('_priorities_cache', None)
+
+for _column in UserPriorities.PRIORITY_COLUMNS:
+    event.listen(getattr(UserPriorities, _column), 'set', _clear_priorities_cache)
+event.listen(UserPriorities, 'expire', _clear_priorities_cache)
+event.listen(UserPriorities, 'refresh', _clear_priorities_cache)
 
 class UserProfile(db.Model):
     """Extended user profile information"""
@@ -461,11 +682,11 @@ class UserProfile(db.Model):
     bio = db.Column(db.Text)
     age = db.Column(db.Integer)
     profile_completion = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=sql_utcnow())
+    updated_at = db.Column(db.DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
     
-    # Relationship back to user
-    user = db.relationship('User', backref=db.backref('profile', uselist=False, cascade='all, delete-orphan'))
+    # Relationship back to user (lazy='raise': load it explicitly, e.g. selectinload, never per row)
+    user = db.relationship('User', back_populates='profile', lazy='raise')
     
     def to_dict(self):
         return {
@@ -482,13 +703,8 @@ class UserProfile(db.Model):
     
     def calculate_completion(self):
         """Calculate profile completion percentage"""
-        completion = 0
-        total_fields = 4  # first_name, last_name, bio, age
-        
-        if self.first_name: completion += 25
-        if self.last_name: completion += 25
-        if self.bio: completion += 25
-        if self.age: completion += 25
+        # 25 points each for first_name, last_name, bio, age
+        completion = 25 * (bool(self.first_name) + bool(self.last_name) + bool(self.bio) + bool(self.age))
         
         self.profile_completion = completion
         return completion
@@ -510,41 +726,46 @@ class CompatibilityMatrix(db.Model):
     growth_score = db.Column(db.SmallInteger)
     space_score = db.Column(db.SmallInteger)
     overall_score = db.Column(db.SmallInteger)
-    calculated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    calculated_at = db.Column(db.DateTime, default=sql_utcnow())
     
     # HD Enhancement Fields
     hd_enhancement_factor = db.Column(db.Float)  # HD intelligence enhancement factor
     compatibility_insights = db.Column(db.Text)  # JSON array of insights
     
+    # Top-K match reads (user_a_id = ? ORDER BY overall_score DESC) become an index range scan
+    __table_args__ = (
+        db.Index('ix_compat_user_a_score', 'user_a_id', db.text('overall_score DESC')),
+        # The PK only leads with user_a_id; user deletion also matches on user_b_id
+        db.Index('ix_compat_user_b', 'user_b_id'),
+    )
+    
     def to_dict(self):
-        import json
+        return CompatibilityMatrix.row_to_dict(
+            {column.key: getattr(self, column.key) for column in CompatibilityMatrix.__table__.columns}
+        )
+    
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a compatibility row given as any column-name mapping (ORM instance dict or Core row)"""
         insights = []
-        if self.compatibility_insights:
+        if row['compatibility_insights']:
             try:
-                insights = json.loads(self.compatibility_insights)
-            except:
+                insights = orjson.loads(row['compatibility_insights'])
+            except orjson.JSONDecodeError:
                 pass
         
+        calculated_at = row['calculated_at']
+        hd_enhancement_factor = row['hd_enhancement_factor']
+        
         return {
-            'user_a_id': self.user_a_id,
-            'user_b_id': self.user_b_id,
-            'dimension_scores': {
-                'love': self.love_score,
-                'intimacy': self.intimacy_score,
-                'communication': self.communication_score,
-                'friendship': self.friendship_score,
-                'collaboration': self.collaboration_score,
-                'lifestyle': self.lifestyle_score,
-                'decisions': self.decisions_score,
-                'support': self.support_score,
-                'growth': self.growth_score,
-                'space': self.space_score
-            },
-            'overall_score': self.overall_score,
-            'hd_enhancement_factor': self.hd_enhancement_factor,
+            'user_a_id': row['user_a_id'],
+            'user_b_id': row['user_b_id'],
+            'dimension_scores': {dim: row[f'{dim}_score'] for dim in MAGIC_10_DIMENSIONS},
+            'overall_score': row['overall_score'],
+            'hd_enhancement_factor': hd_enhancement_factor,
             'compatibility_insights': insights,
-            'enhanced_by_hd': self.hd_enhancement_factor is not None,
-            'calculated_at': self.calculated_at.isoformat() if self.calculated_at else None
+            'enhanced_by_hd': hd_enhancement_factor is not None,
+            'calculated_at': calculated_at.isoformat() if calculated_at else None
         }
 
 class BirthData(db.Model):
@@ -555,8 +776,8 @@ class BirthData(db.Model):
     birth_date = db.Column(db.Date)
     birth_time = db.Column(db.Time)
     birth_location = db.Column(db.String(255))
-    latitude = db.Column(db.Numeric(10, 8))
-    longitude = db.Column(db.Numeric(11, 8))
+    latitude = db.Column(db.Float)  # double precision: ~1e-15 deg resolution, no Decimal per read
+    longitude = db.Column(db.Float)
     data_consent = db.Column(db.Boolean, default=False)
     sharing_consent = db.Column(db.Boolean, default=False)
     
@@ -565,7 +786,7 @@ class BirthData(db.Model):
     location_country = db.Column(db.String(100))
     location_state = db.Column(db.String(100))
     location_city = db.Column(db.String(100))
-    location_importance = db.Column(db.Numeric(5, 4))
+    location_importance = db.Column(db.Float)  # 0-1 ranking score; double precision like the coordinates
     location_osm_id = db.Column(db.BigInteger)
     location_osm_type = db.Column(db.String(20))
     timezone = db.Column(db.String(50))           # Added missing field
@@ -595,61 +816,67 @@ class BirthData(db.Model):
             'location_verified': self.location_verified
         }
 
+# JSON payload columns: JSONB on PostgreSQL, JSON (TEXT) on SQLite
+HD_JSON = db.JSON().with_variant(JSONB(), 'postgresql')
+
 class HumanDesignData(db.Model):
     """Human Design chart data with comprehensive relational compatibility factors"""
     __tablename__ = 'human_design_data'
     
+    # Every wide column (JSON chart/API payloads and gate lists, *_relational_impact prose) is deferred
+    # into the 'hd_detail' group so type/authority reads don't pull them; detail views undefer the group
+    
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
-    chart_data = db.Column(db.Text)  # JSON as TEXT for Railway compatibility
-    api_response = db.Column(db.Text)  # Cached full API response
-    calculated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    chart_data = deferred(db.Column(HD_JSON), group='hd_detail')
+    api_response = deferred(db.Column(HD_JSON), group='hd_detail')  # Cached full API response
+    calculated_at = db.Column(db.DateTime, default=sql_utcnow())
     
     # === CORE TYPE & STRATEGY ===
     energy_type = db.Column(db.String(50))  # Generator, Manifestor, Projector, Reflector
     sub_type = db.Column(db.String(50))  # Manifesting Generator (if applicable)
     strategy = db.Column(db.String(100))
-    type_relational_impact = db.Column(db.Text)  # How type affects relationships
+    type_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # How type affects relationships
     
     # === AUTHORITY & DECISION MAKING ===
     authority = db.Column(db.String(100))  # Emotional, Sacral, Splenic, Ego, Self-Projected, Environmental, Lunar
     decision_pacing = db.Column(db.String(50))  # In-the-moment, requires waiting, instinctive
-    authority_compatibility_impact = db.Column(db.Text)  # How authority pacing aligns or conflicts
+    authority_compatibility_impact = deferred(db.Column(db.Text), group='hd_detail')  # How authority pacing aligns or conflicts
     
     # === DEFINITION & SPLITS ===
     definition_type = db.Column(db.String(50))  # Single, Split, Triple Split, Quad Split, No Definition
-    split_bridges = db.Column(db.Text)  # JSON: gates/channels that bridge splits
-    definition_relational_impact = db.Column(db.Text)  # Attraction patterns, independence needs
+    split_bridges = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON: gates/channels that bridge splits
+    definition_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # Attraction patterns, independence needs
     
     # === CENTERS (9 centers with relational dynamics) ===
     center_head = db.Column(db.Boolean, default=False)
-    center_head_relational_impact = db.Column(db.Text)
+    center_head_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_ajna = db.Column(db.Boolean, default=False)
-    center_ajna_relational_impact = db.Column(db.Text)
+    center_ajna_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_throat = db.Column(db.Boolean, default=False)
-    center_throat_relational_impact = db.Column(db.Text)
+    center_throat_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_g = db.Column(db.Boolean, default=False)
-    center_g_relational_impact = db.Column(db.Text)
+    center_g_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_heart = db.Column(db.Boolean, default=False)
-    center_heart_relational_impact = db.Column(db.Text)
+    center_heart_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_spleen = db.Column(db.Boolean, default=False)
-    center_spleen_relational_impact = db.Column(db.Text)
+    center_spleen_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_solar_plexus = db.Column(db.Boolean, default=False)
-    center_solar_plexus_relational_impact = db.Column(db.Text)
+    center_solar_plexus_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_sacral = db.Column(db.Boolean, default=False)
-    center_sacral_relational_impact = db.Column(db.Text)
+    center_sacral_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     center_root = db.Column(db.Boolean, default=False)
-    center_root_relational_impact = db.Column(db.Text)
+    center_root_relational_impact = deferred(db.Column(db.Text), group='hd_detail')
     
     # === GATES (with hanging gates and relational impacts) ===
-    gates_defined = db.Column(db.Text)  # JSON array of defined gate numbers
-    gates_personality = db.Column(db.Text)  # JSON array of personality gates
-    gates_design = db.Column(db.Text)  # JSON array of design gates
-    hanging_gates = db.Column(db.Text)  # JSON array of hanging gates seeking connection
-    key_relational_gates = db.Column(db.Text)  # JSON: gates 59,6,49,19,44,26,37,40 etc with impacts
+    gates_defined = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of defined gate numbers
+    gates_personality = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of personality gates
+    gates_design = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of design gates
+    hanging_gates = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of hanging gates seeking connection
+    key_relational_gates = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON: gates 59,6,49,19,44,26,37,40 etc with impacts
     
     # === CHANNELS (with circuit and relational dynamics) ===
-    channels_defined = db.Column(db.Text)  # JSON array of defined channel numbers
-    key_relationship_channels = db.Column(db.Text)  # JSON: 59-6, 49-19, 40-37, 44-26 etc with impacts
+    channels_defined = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of defined channel numbers
+    key_relationship_channels = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON: 59-6, 49-19, 40-37, 44-26 etc with impacts
     
     # === PROFILE (with line-by-line relational impacts) ===
     profile = db.Column(db.String(20))  # e.g., "1/3", "4/6", "2/4"
@@ -659,29 +886,29 @@ class HumanDesignData(db.Model):
     profile_line4 = db.Column(db.String(50))  # Opportunist characteristics
     profile_line5 = db.Column(db.String(50))  # Heretic characteristics
     profile_line6 = db.Column(db.String(50))  # Role Model characteristics
-    profile_relational_impact = db.Column(db.Text)  # How profile shapes relational style & attraction
+    profile_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # How profile shapes relational style & attraction
     
     # === INCARNATION CROSS ===
     incarnation_cross = db.Column(db.String(200))
-    cross_gates = db.Column(db.Text)  # JSON array of 4 gates that define the cross
+    cross_gates = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of 4 gates that define the cross
     cross_angle = db.Column(db.String(50))  # Right/Left angle, Juxtaposition
-    cross_relational_impact = db.Column(db.Text)  # Compatibility of life themes & trajectories
+    cross_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # Compatibility of life themes & trajectories
     
     # === CONDITIONING & OPENNESS ===
-    open_centers = db.Column(db.Text)  # JSON array of open center names
-    conditioning_themes = db.Column(db.Text)  # Areas most influenced by others
-    conditioning_relational_impact = db.Column(db.Text)  # Where attraction/conditioning happens
+    open_centers = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON array of open center names
+    conditioning_themes = deferred(db.Column(db.Text), group='hd_detail')  # Areas most influenced by others
+    conditioning_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # Where attraction/conditioning happens
     
     # === CIRCUITRY (with relational impacts) ===
     circuitry_individual = db.Column(db.Integer, default=0)  # Count of individual circuitry
     circuitry_tribal = db.Column(db.Integer, default=0)  # Count of tribal circuitry
     circuitry_collective = db.Column(db.Integer, default=0)  # Count of collective circuitry
-    circuitry_relational_impact = db.Column(db.Text)  # Tribal→intimacy, Collective→ideals, Individual→uniqueness
+    circuitry_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # Tribal→intimacy, Collective→ideals, Individual→uniqueness
     
     # === NODES (North/South Node orientation) ===
     conscious_node = db.Column(db.String(50))  # North Node
     unconscious_node = db.Column(db.String(50))  # South Node
-    nodes_relational_impact = db.Column(db.Text)  # Environmental orientation compatibility
+    nodes_relational_impact = deferred(db.Column(db.Text), group='hd_detail')  # Environmental orientation compatibility
     
     # === PLANETARY ACTIVATIONS (advanced layer) ===
     sun_personality = db.Column(db.String(20))  # Gate.Line format (e.g., "1.3")
@@ -712,59 +939,23 @@ class HumanDesignData(db.Model):
     north_node_design = db.Column(db.String(20))
     south_node_design = db.Column(db.String(20))
     
-    planetary_relational_impacts = db.Column(db.Text)  # JSON: planet-specific relational impacts
+    planetary_relational_impacts = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON: planet-specific relational impacts
     
     # === COMPATIBILITY CALCULATIONS (for Magic 10 algorithm) ===
-    electromagnetic_connections = db.Column(db.Text)  # JSON of electromagnetic connections
-    compromise_connections = db.Column(db.Text)  # JSON of compromise connections  
-    dominance_connections = db.Column(db.Text)  # JSON of dominance connections
-    conditioning_dynamics = db.Column(db.Text)  # JSON of conditioning patterns with other charts
+    electromagnetic_connections = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON of electromagnetic connections
+    compromise_connections = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON of compromise connections  
+    dominance_connections = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON of dominance connections
+    conditioning_dynamics = deferred(db.Column(HD_JSON), group='hd_detail')  # JSON of conditioning patterns with other charts
     
     # === METADATA ===
     schema_version = db.Column(db.Integer, default=3)  # Updated to v3 for comprehensive relational factors
-    last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+    last_updated = db.Column(db.DateTime, default=sql_utcnow())
     
     # === HELPER METHODS ===
-    def set_chart_data(self, data):
-        self.chart_data = json.dumps(data) if data else None
-    
-    def get_chart_data(self):
-        return json.loads(self.chart_data) if self.chart_data else {}
-    
-    def set_api_response(self, response):
-        self.api_response = json.dumps(response) if response else None
-    
-    def get_api_response(self):
-        return json.loads(self.api_response) if self.api_response else {}
-    
-    def set_gates_defined(self, gates):
-        self.gates_defined = json.dumps(gates) if gates else None
-    
-    def get_gates_defined(self):
-        return json.loads(self.gates_defined) if self.gates_defined else []
-    
-    def set_hanging_gates(self, gates):
-        self.hanging_gates = json.dumps(gates) if gates else None
-    
-    def get_hanging_gates(self):
-        return json.loads(self.hanging_gates) if self.hanging_gates else []
-    
-    def set_channels_defined(self, channels):
-        self.channels_defined = json.dumps(channels) if channels else None
-    
-    def get_channels_defined(self):
-        return json.loads(self.channels_defined) if self.channels_defined else []
-    
-    def set_open_centers(self, centers):
-        self.open_centers = json.dumps(centers) if centers else None
-    
-    def get_open_centers(self):
-        return json.loads(self.open_centers) if self.open_centers else []
-    
     def to_dict(self):
         return {
             'user_id': self.user_id,
-            'chart_data': self.get_chart_data(),
+            'chart_data': self.chart_data or {},
             'calculated_at': self.calculated_at.isoformat() if self.calculated_at else None,
             
             # Core Type & Strategy
@@ -780,7 +971,7 @@ class HumanDesignData(db.Model):
             
             # Definition & Splits
             'definition_type': self.definition_type,
-            'split_bridges': json.loads(self.split_bridges) if self.split_bridges else [],
+            'split_bridges': self.split_bridges or [],
             'definition_relational_impact': self.definition_relational_impact,
             
             # Centers with relational impacts
@@ -797,11 +988,11 @@ class HumanDesignData(db.Model):
             },
             
             # Gates and Channels
-            'gates_defined': self.get_gates_defined(),
-            'hanging_gates': self.get_hanging_gates(),
-            'channels_defined': self.get_channels_defined(),
-            'key_relational_gates': json.loads(self.key_relational_gates) if self.key_relational_gates else {},
-            'key_relationship_channels': json.loads(self.key_relationship_channels) if self.key_relationship_channels else {},
+            'gates_defined': self.gates_defined or [],
+            'hanging_gates': self.hanging_gates or [],
+            'channels_defined': self.channels_defined or [],
+            'key_relational_gates': self.key_relational_gates or {},
+            'key_relationship_channels': self.key_relationship_channels or {},
             
             # Profile with line details
             'profile': self.profile,
@@ -817,12 +1008,12 @@ class HumanDesignData(db.Model):
             
             # Incarnation Cross
             'incarnation_cross': self.incarnation_cross,
-            'cross_gates': json.loads(self.cross_gates) if self.cross_gates else [],
+            'cross_gates': self.cross_gates or [],
             'cross_angle': self.cross_angle,
             'cross_relational_impact': self.cross_relational_impact,
             
             # Conditioning & Openness
-            'open_centers': self.get_open_centers(),
+            'open_centers': self.open_centers or [],
             'conditioning_themes': self.conditioning_themes,
             'conditioning_relational_impact': self.conditioning_relational_impact,
             
@@ -873,15 +1064,15 @@ class HumanDesignData(db.Model):
                     'north_node': self.north_node_design,
                     'south_node': self.south_node_design
                 },
-                'relational_impacts': json.loads(self.planetary_relational_impacts) if self.planetary_relational_impacts else {}
+                'relational_impacts': self.planetary_relational_impacts or {}
             },
             
             # Compatibility Calculations
             'compatibility_connections': {
-                'electromagnetic': json.loads(self.electromagnetic_connections) if self.electromagnetic_connections else {},
-                'compromise': json.loads(self.compromise_connections) if self.compromise_connections else {},
-                'dominance': json.loads(self.dominance_connections) if self.dominance_connections else {},
-                'conditioning_dynamics': json.loads(self.conditioning_dynamics) if self.conditioning_dynamics else {}
+                'electromagnetic': self.electromagnetic_connections or {},
+                'compromise': self.compromise_connections or {},
+                'dominance': self.dominance_connections or {},
+                'conditioning_dynamics': self.conditioning_dynamics or {}
             },
             
             'schema_version': self.schema_version
@@ -896,16 +1087,29 @@ class AdminActionLog(db.Model):
     action = db.Column(db.String(50), nullable=False)
     target_user_id = db.Column(db.Integer, db.ForeignKey('users.id'))
     details = db.Column(db.Text)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    timestamp = db.Column(db.DateTime, default=sql_utcnow())
+    
+    __table_args__ = (
+        # Keyset pagination for the admin log view (newest first)
+        db.Index('ix_admin_action_log_timestamp_id', db.text('timestamp DESC'), db.text('id DESC')),
+    )
     
     def to_dict(self):
+        return AdminActionLog.row_to_dict(
+            {column.key: getattr(self, column.key) for column in AdminActionLog.__table__.columns}
+        )
+    
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a log entry given as any column-name mapping (e.g. a Core row's _mapping)"""
+        timestamp = row['timestamp']
         return {
-            'id': self.id,
-            'admin_user_id': self.admin_user_id,
-            'action': self.action,
-            'target_user_id': self.target_user_id,
-            'details': self.details,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None
+            'id': row['id'],
+            'admin_user_id': row['admin_user_id'],
+            'action': row['action'],
+            'target_user_id': row['target_user_id'],
+            'details': row['details'],
+            'timestamp': timestamp.isoformat() if timestamp else None
         }
 
 class EmailNotification(db.Model):
@@ -917,7 +1121,7 @@ class EmailNotification(db.Model):
     email_type = db.Column(db.String(50), nullable=False)
     recipient_email = db.Column(db.String(255), nullable=False)
     subject = db.Column(db.String(255))
-    sent_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, default=sql_utcnow())
     delivery_status = db.Column(db.String(20), default='sent')
     
     def to_dict(self):
@@ -937,9 +1141,9 @@ class UserSession(db.Model):
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    session_token = db.Column(db.String(255), unique=True, nullable=False, index=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    expires_at = db.Column(db.DateTime, nullable=False)
+    session_token = db.Column(db.String(255), unique=True, nullable=False, index=True)  # SHA-256 hex of the issued token
+    created_at = db.Column(db.DateTime, default=sql_utcnow())
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)  # range-deleted by purge_expired_sessions
     
     def is_expired(self):
         return datetime.utcnow() > self.expires_at
@@ -950,7 +1154,7 @@ class UserPreferences(db.Model):
     
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     prefs = db.Column(db.JSON)  # JSONB on PostgreSQL, JSON on SQLite
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
     
     # Relationship
     user = db.relationship('User', backref='preferences')
@@ -967,8 +1171,8 @@ class UserResonancePrefs(db.Model):
     version = db.Column(db.Integer, nullable=False, default=1)
     weights = db.Column(db.JSON, nullable=False)  # Dict[str, int] - 0-100 scale
     facets = db.Column(db.JSON)  # Optional sub-facet preferences
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=sql_utcnow(), nullable=False)
+    updated_at = db.Column(db.DateTime, default=sql_utcnow(), onupdate=sql_utcnow(), nullable=False)
     
     def to_dict(self):
         return {
@@ -998,7 +1202,7 @@ class UserResonanceSignalsPrivate(db.Model):
     identity_openness = db.Column(db.Boolean, nullable=False)
     trajectory_code = db.Column(db.String(20))
     confidence = db.Column(db.JSON)  # Confidence scores for signal quality
-    computed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    computed_at = db.Column(db.DateTime, default=sql_utcnow(), nullable=False)
     
     def to_dict(self):
         """Note: This should never be exposed to public APIs"""
@@ -1031,83 +1235,181 @@ MAGIC_10_DIMENSIONS = [
     'growth', 'space'
 ]
 
+def _magic10_score_arrays(a, b):
+    """
+    Vectorized Magic 10 core over broadcastable (..., 10) int8 priority arrays
+    Returns (dimension base scores, final overall scores, high-priority matches, major mismatches)
+    """
+    # Calculate base compatibility (inverse of difference)
+    diff = np.abs(a - b)
+    base = np.maximum(0, 10 - diff)
+    
+    # Apply weighting based on average priority importance (normalized to 0-1)
+    weight = (a + b) / 2 / 10
+    
+    # cumsum reduces left-to-right, so float rounding matches previously stored scores
+    total_weighted_score = np.cumsum(base * weight, axis=-1)[..., -1]
+    total_weight = np.cumsum(weight, axis=-1)[..., -1]
+    overall_score = np.rint(total_weighted_score / total_weight)
+    
+    # Apply bonus for high mutual priorities / penalty for major mismatches
+    high_priority_bonus = np.count_nonzero((a >= 8) & (b >= 8), axis=-1)
+    major_mismatches = np.count_nonzero(diff >= 7, axis=-1)
+    
+    # Final score adjustment
+    final_score = np.clip(overall_score + high_priority_bonus - 2 * major_mismatches, 0, 100).astype(np.int16)
+    
+    return base, final_score, high_priority_bonus, major_mismatches
+
+if njit is not None:
+    @njit(cache=True)
+    def _magic10_row_kernel(a, others):
+        """Numba version of _magic10_score_arrays for one (10,) row against (M, 10) rows, without temporaries"""
+        m = others.shape[0]
+        base = np.empty((m, 10), dtype=np.int8)
+        final_score = np.empty(m, dtype=np.int16)
+        high_priority_bonus = np.empty(m, dtype=np.int64)
+        major_mismatches = np.empty(m, dtype=np.int64)
+        
+        for j in range(m):
+            total_weighted_score = 0.0
+            total_weight = 0.0
+            bonus = 0
+            mismatches = 0
+            for k in range(10):
+                x = np.int64(a[k])
+                y = np.int64(others[j, k])
+                diff = abs(x - y)
+                score = 10 - diff if diff < 10 else 0
+                base[j, k] = score
+                
+                # Same operation order as the NumPy path so rounding is identical
+                weight = (x + y) / 2 / 10
+                total_weighted_score += score * weight
+                total_weight += weight
+                
+                if x >= 8 and y >= 8:
+                    bonus += 1
+                if diff >= 7:
+                    mismatches += 1
+            
+            overall = np.rint(total_weighted_score / total_weight) + bonus - 2 * mismatches
+            final_score[j] = min(max(overall, 0.0), 100.0)
+            high_priority_bonus[j] = bonus
+            major_mismatches[j] = mismatches
+        
+        return base, final_score, high_priority_bonus, major_mismatches
+    
+    # Compile at import (once in the gunicorn --preload master) rather than on the first request
+    _magic10_row_kernel(np.ones(10, dtype=np.int8), np.ones((1, 10), dtype=np.int8))
+else:
+    _magic10_row_kernel = None
+
+def _magic10_score_row(a, others):
+    """Score one (10,) int8 priority row against (M, 10) rows, JIT-compiled when numba is installed"""
+    if _magic10_row_kernel is not None:
+        return _magic10_row_kernel(a, others)
+    return _magic10_score_arrays(a, others)
+
 def calculate_compatibility_score(user1_priorities, user2_priorities):
     """
     Core Magic 10 compatibility calculation algorithm
     Calculates weighted compatibility scores between two users based on their priorities
+    Vectorized with NumPy: all 10 dimensions are scored in a single pass of array ops
     """
     if len(user1_priorities) != 10 or len(user2_priorities) != 10:
         raise ValueError("Both users must have exactly 10 priority values")
     
-    # Initialize scores
-    dimension_scores = {}
-    total_weighted_score = 0
-    total_weight = 0
+    # The score is symmetric, so (a, b) and (b, a) share one cache entry
+    key1, key2 = tuple(user1_priorities), tuple(user2_priorities)
+    if key2 < key1:
+        key1, key2 = key2, key1
+    result = _cached_compatibility_score(key1, key2)
     
-    # Calculate compatibility for each dimension
-    for i, dimension in enumerate(MAGIC_10_DIMENSIONS):
-        priority1 = user1_priorities[i]
-        priority2 = user2_priorities[i]
-        
-        # Validate priority values (1-10 scale)
-        if not (1 <= priority1 <= 10) or not (1 <= priority2 <= 10):
-            raise ValueError(f"Priority values must be between 1 and 10")
-        
-        # Calculate base compatibility (inverse of difference)
-        difference = abs(priority1 - priority2)
-        base_score = max(0, 10 - difference)
-        
-        # Apply weighting based on average priority importance
-        avg_priority = (priority1 + priority2) / 2
-        weight = avg_priority / 10  # Normalize to 0-1
-        
-        # Calculate weighted score for this dimension
-        weighted_score = base_score * weight
-        dimension_scores[dimension] = int(round(base_score))
-        
-        total_weighted_score += weighted_score
-        total_weight += weight
-    
-    # Calculate overall compatibility score
-    if total_weight > 0:
-        overall_score = int(round((total_weighted_score / total_weight)))
-    else:
-        overall_score = 0
-    
-    # Apply bonus for high mutual priorities
-    high_priority_bonus = 0
-    for i in range(10):
-        if user1_priorities[i] >= 8 and user2_priorities[i] >= 8:
-            high_priority_bonus += 1
+    # Callers may mutate the result; hand out copies of the cached dicts
+    return {**result, 'dimension_scores': dict(result['dimension_scores'])}
+
+@lru_cache(maxsize=65536)
+def _cached_compatibility_score(user1_priorities, user2_priorities):
+    """Magic 10 score for a canonically ordered pair of priority tuples (memoized; pure function)"""
+    a = np.asarray(user1_priorities)
+    b = np.asarray(user2_priorities)
     
-    # Apply penalty for major mismatches
-    mismatch_penalty = 0
-    for i in range(10):
-        if abs(user1_priorities[i] - user2_priorities[i]) >= 7:
-            mismatch_penalty += 2
+    # Validate priority values (1-10 scale) before narrowing to int8
+    if ((a < 1) | (a > 10) | (b < 1) | (b > 10)).any():
+        raise ValueError(f"Priority values must be between 1 and 10")
     
-    # Final score adjustment
-    final_score = max(0, min(100, overall_score + high_priority_bonus - mismatch_penalty))
+    # A one-row batch, so a pair goes through the numba kernel too when it is available
+    base, final_score, high_priority_bonus, major_mismatches = _magic10_score_row(
+        a.astype(np.int8), b.astype(np.int8)[np.newaxis, :]
+    )
     
     return {
-        'dimension_scores': dimension_scores,
-        'overall_score': final_score,
-        'high_priority_matches': high_priority_bonus,
-        'major_mismatches': mismatch_penalty // 2
+        'dimension_scores': dict(zip(MAGIC_10_DIMENSIONS, base[0].tolist())),
+        'overall_score': int(final_score[0]),
+        'high_priority_matches': int(high_priority_bonus[0]),
+        'major_mismatches': int(major_mismatches[0])
     }
 
+# Per-process cache of user_id -> priority tuple for the hot match/compatibility paths.
+# Writes in this worker invalidate immediately; the TTL bounds staleness across workers.
+# gthread workers share it between request threads, so every access holds _priority_cache_lock.
+PRIORITY_CACHE_TTL_SECONDS = int(os.environ.get('PRIORITY_CACHE_TTL_SECONDS', '60'))
+PRIORITY_CACHE_MAX_ENTRIES = 4096
+_priority_cache = {}
+_priority_cache_lock = threading.Lock()
+
+def get_priority_tuples(user_ids):
+    """Return {user_id: 10-tuple of priorities} for users that have priorities, using one IN query for misses"""
+    now = time_module.monotonic()
+    found = {}
+    missing = []
+    
+    with _priority_cache_lock:
+        for user_id in set(user_ids):
+            cached = _priority_cache.get(user_id)
+            if cached and cached[0] > now:
+                found[user_id] = cached[1]
+            else:
+                missing.append(user_id)
+    
+    if missing:
+        # Plain column tuples: no UserPriorities instances to hydrate for a read-only lookup
+        columns = [getattr(UserPriorities, column) for column in UserPriorities.PRIORITY_COLUMNS]
+        rows = db.session.execute(
+            select(UserPriorities.user_id, *columns).where(UserPriorities.user_id.in_(missing))
+        )
+        for user_id, *values in rows:
+            found[user_id] = tuple(values)
+        
+        # Query outside the lock; only the dict updates are serialized
+        with _priority_cache_lock:
+            for user_id in missing:
+                if user_id not in found:
+                    continue
+                if len(_priority_cache) >= PRIORITY_CACHE_MAX_ENTRIES:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    _priority_cache.pop(next(iter(_priority_cache)), None)
+                _priority_cache[user_id] = (now + PRIORITY_CACHE_TTL_SECONDS, found[user_id])
+    
+    return found
+
+def invalidate_priority_cache(user_id):
+    """Drop a user's cached priorities after they change"""
+    with _priority_cache_lock:
+        _priority_cache.pop(user_id, None)
+
 def calculate_mutual_compatibility(user1_id, user2_id):
     """Calculate bidirectional compatibility between two users with HD intelligence"""
     try:
-        user1_priorities = UserPriorities.query.get(user1_id)
-        user2_priorities = UserPriorities.query.get(user2_id)
+        priorities = get_priority_tuples([user1_id, user2_id])
         
-        if not user1_priorities or not user2_priorities:
+        if user1_id not in priorities or user2_id not in priorities:
             return None
         
         # Get priority arrays
-        priorities1 = user1_priorities.get_priorities_array()
-        priorities2 = user2_priorities.get_priorities_array()
+        priorities1 = priorities[user1_id]
+        priorities2 = priorities[user2_id]
         
         # Calculate base Magic 10 compatibility
         magic10_compatibility = calculate_compatibility_score(priorities1, priorities2)
@@ -1120,94 +1422,338 @@ def calculate_mutual_compatibility(user1_id, user2_id):
             )
             return enhanced_compatibility
         except Exception as hd_error:
-            print(f"HD enhancement failed, using Magic 10 only: {hd_error}")
+            app.logger.warning("HD enhancement failed, using Magic 10 only: %s", hd_error)
             return magic10_compatibility
         
     except Exception as e:
-        print(f"Error calculating mutual compatibility: {e}")
+        app.logger.exception("Error calculating mutual compatibility: %s", e)
         return None
 
-def store_compatibility_result(user_a_id, user_b_id, compatibility_result):
-    """Store compatibility calculation result in database with HD enhancement"""
+def _valid_priorities(values):
+    """True for a full set of 10 priorities on the 1-10 scale (the only rows Magic 10 can score)"""
+    return values is not None and all(p is not None and 1 <= p <= 10 for p in values)
+
+def calculate_mutual_compatibility_batch(user_id, target_user_ids):
+    """
+    Calculate compatibility between one user and many targets in a single pass
+    Priorities and HD factors are loaded with one query each and the Magic 10 scores for
+    every target come from one vectorized row call. Returns {target_user_id: result};
+    targets without valid priorities are omitted, so the dict is empty when nothing is
+    scorable. Returns None on failure.
+    """
     try:
-        # Check if result already exists
-        existing = CompatibilityMatrix.query.filter_by(
-            user_a_id=user_a_id, user_b_id=user_b_id
-        ).first()
-        
-        if existing:
-            # Update existing record
-            compatibility_record = existing
-        else:
-            # Create new record
-            compatibility_record = CompatibilityMatrix(
-                user_a_id=user_a_id,
-                user_b_id=user_b_id
-            )
+        from hd_intelligence_engine import (
+            HDIntelligenceEngine, get_hd_factors_for_users, enhance_compatibility_with_factors
+        )
         
-        # Update scores
-        scores = compatibility_result['dimension_scores']
-        compatibility_record.love_score = scores.get('love', 0)
-        compatibility_record.intimacy_score = scores.get('intimacy', 0)
-        compatibility_record.communication_score = scores.get('communication', 0)
-        compatibility_record.friendship_score = scores.get('friendship', 0)
-        compatibility_record.collaboration_score = scores.get('collaboration', 0)
-        compatibility_record.lifestyle_score = scores.get('lifestyle', 0)
-        compatibility_record.decisions_score = scores.get('decisions', 0)
-        compatibility_record.support_score = scores.get('support', 0)
-        compatibility_record.growth_score = scores.get('growth', 0)
-        compatibility_record.space_score = scores.get('space', 0)
-        compatibility_record.overall_score = compatibility_result['overall_score']
-        compatibility_record.calculated_at = datetime.utcnow()
-        
-        # Store HD enhancement data if available
-        if 'hd_enhancement_factor' in compatibility_result:
-            compatibility_record.hd_enhancement_factor = compatibility_result['hd_enhancement_factor']
-        
-        if 'compatibility_insights' in compatibility_result:
-            import json
-            compatibility_record.compatibility_insights = json.dumps(compatibility_result['compatibility_insights'])
-        
-        if not existing:
-            db.session.add(compatibility_record)
+        target_user_ids = [target_id for target_id in dict.fromkeys(target_user_ids) if target_id != user_id]
+        priorities = get_priority_tuples([user_id, *target_user_ids])
         
+        if not _valid_priorities(priorities.get(user_id)):
+            return {}
+        scored_ids = [target_id for target_id in target_user_ids if _valid_priorities(priorities.get(target_id))]
+        if not scored_ids:
+            return {}
+        
+        base, final_score, high_priority_bonus, major_mismatches = _magic10_score_row(
+            np.array(priorities[user_id], dtype=np.int8),
+            np.array([priorities[target_id] for target_id in scored_ids], dtype=np.int8).reshape(-1, 10)
+        )
+        
+        hd_engine = HDIntelligenceEngine()
+        hd_factors = get_hd_factors_for_users([user_id, *scored_ids], hd_engine)
+        
+        results = {}
+        for k, target_id in enumerate(scored_ids):
+            magic10_compatibility = {
+                'dimension_scores': dict(zip(MAGIC_10_DIMENSIONS, base[k].tolist())),
+                'overall_score': int(final_score[k]),
+                'high_priority_matches': int(high_priority_bonus[k]),
+                'major_mismatches': int(major_mismatches[k])
+            }
+            try:
+                results[target_id] = enhance_compatibility_with_factors(
+                    magic10_compatibility,
+                    hd_factors.get(user_id, {}),
+                    hd_factors.get(target_id, {}),
+                    hd_engine
+                )
+            except Exception as hd_error:
+                app.logger.warning("HD enhancement failed, using Magic 10 only: %s", hd_error)
+                results[target_id] = magic10_compatibility
+        
+        return results
+    except Exception as e:
+        app.logger.exception("Error calculating batch compatibility: %s", e)
+        return None
+
+def _compatibility_row(user_a_id, user_b_id, compatibility_result, calculated_at=None):
+    """Flatten a compatibility result into a compatibility_matrix row dict"""
+    scores = compatibility_result['dimension_scores']
+    row = {
+        'user_a_id': user_a_id,
+        'user_b_id': user_b_id,
+        'overall_score': compatibility_result['overall_score'],
+        'calculated_at': calculated_at or datetime.utcnow()
+    }
+    for dimension in MAGIC_10_DIMENSIONS:
+        row[f'{dimension}_score'] = scores.get(dimension, 0)
+    
+    # Store HD enhancement data if available
+    if 'hd_enhancement_factor' in compatibility_result:
+        row['hd_enhancement_factor'] = compatibility_result['hd_enhancement_factor']
+    if 'compatibility_insights' in compatibility_result:
+        row['compatibility_insights'] = orjson.dumps(compatibility_result['compatibility_insights'], option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    return row
+
+def _dialect_insert():
+    """insert() of the active dialect, which has on_conflict_do_update (Postgres and SQLite)"""
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+def _upsert_compatibility_rows(rows):
+    """
+    Write compatibility_matrix rows with a single INSERT ... ON CONFLICT DO UPDATE
+    Rows must share the same keys; columns absent from the rows are left untouched on conflict.
+    Does not commit - callers own the transaction.
+    """
+    if not rows:
+        return
+    
+    stmt = _dialect_insert()(CompatibilityMatrix).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_a_id', 'user_b_id'],
+        set_={
+            key: stmt.excluded[key]
+            for key in rows[0]
+            if key not in ('user_a_id', 'user_b_id')
+        }
+    )
+    db.session.execute(stmt)
+
+COMPATIBILITY_UPSERT_CHUNK_SIZE = 1000
+COMPATIBILITY_COPY_CHUNK_SIZE = 50000
+
+def _copy_compatibility_rows(rows):
+    """
+    Postgres bulk path: COPY rows into a temp staging table, then merge them into
+    compatibility_matrix with one INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+    Rows must share the same keys. Does not commit - callers own the transaction.
+    Returns the number of rows written.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    
+    columns = list(first)
+    column_list = ', '.join(columns)
+    update_list = ', '.join(
+        f"{column} = EXCLUDED.{column}" for column in columns if column not in ('user_a_id', 'user_b_id')
+    )
+    
+    # Temp table lives in the session's transaction, so COPY must use the same connection
+    connection = db.session.connection()
+    connection.execute(text("""
+        CREATE TEMP TABLE IF NOT EXISTS compat_stage
+        (LIKE compatibility_matrix INCLUDING DEFAULTS) ON COMMIT DROP
+    """))
+    connection.execute(text("TRUNCATE compat_stage"))
+    
+    cursor = connection.connection.driver_connection.cursor()
+    stored = 0
+    try:
+        pending = itertools.chain([first], rows)
+        while True:
+            chunk = list(itertools.islice(pending, COMPATIBILITY_COPY_CHUNK_SIZE))
+            if not chunk:
+                break
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in chunk:
+                writer.writerow([row[column] for column in columns])
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY compat_stage ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+            stored += len(chunk)
+    finally:
+        cursor.close()
+    
+    connection.execute(text(f"""
+        INSERT INTO compatibility_matrix ({column_list})
+        SELECT {column_list} FROM compat_stage
+        ON CONFLICT (user_a_id, user_b_id) DO UPDATE SET {update_list}
+    """))
+    connection.execute(text("TRUNCATE compat_stage"))
+    return stored
+
+# get_user_matches results are cached per user in one Redis hash (field "limit:min_score"),
+# so a single DEL drops every variant once that user's compatibility_matrix rows change
+MATCHES_CACHE_VERSION = 1
+MATCHES_CACHE_TTL_SECONDS = 300
+
+def _matches_cache_key(user_id):
+    return f"glow:matches:{user_id}:v{MATCHES_CACHE_VERSION}"
+
+def invalidate_matches_cache(user_ids):
+    """Drop cached match lists for the given users"""
+    if cache_redis is None or not user_ids:
+        return
+    try:
+        cache_redis.delete(*(_matches_cache_key(user_id) for user_id in user_ids))
+    except redis.RedisError as e:
+        app.logger.warning("Matches cache invalidation failed: %s", e)
+
+def store_compatibility_result(user_a_id, user_b_id, compatibility_result):
+    """
+    Store compatibility calculation result in database with HD enhancement
+    Single INSERT ... ON CONFLICT upsert; returns the stored row dict (None on failure)
+    """
+    try:
+        row = _compatibility_row(user_a_id, user_b_id, compatibility_result)
+        _upsert_compatibility_rows([row])
+        db.session.commit()
+        invalidate_matches_cache([user_a_id])
+        return row
+    except Exception as e:
+        db.session.rollback()
+        app.logger.exception("Error storing compatibility result: %s", e)
+        return None
+
+def store_compatibility_results(rows):
+    """
+    Bulk variant of store_compatibility_result taking compatibility_matrix row dicts
+    (see _compatibility_row). Accepts any iterable; on Postgres rows are streamed through COPY,
+    elsewhere upserted in COMPATIBILITY_UPSERT_CHUNK_SIZE chunks. Commits once; returns the
+    row count (None on failure).
+    """
+    touched_user_ids = set()
+    
+    def tracked(rows):
+        for row in rows:
+            touched_user_ids.add(row['user_a_id'])
+            yield row
+    
+    rows = tracked(rows)
+    try:
+        if db.engine.dialect.name == 'postgresql':
+            stored = _copy_compatibility_rows(rows)
+        else:
+            rows = iter(rows)
+            stored = 0
+            while True:
+                chunk = list(itertools.islice(rows, COMPATIBILITY_UPSERT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                _upsert_compatibility_rows(chunk)
+                stored += len(chunk)
         db.session.commit()
-        return compatibility_record
+        invalidate_matches_cache(touched_user_ids)
+        return stored
     except Exception as e:
         db.session.rollback()
-        print(f"Error storing compatibility result: {e}")
+        app.logger.exception("Error storing compatibility results: %s", e)
         return None
 
 def get_user_matches(user_id, limit=20, min_score=60):
-    """Get top matches for a user based on compatibility scores"""
+    """Get top matches for a user based on compatibility scores (cached in Redis, see MATCHES_CACHE_*)"""
     try:
-        matches = CompatibilityMatrix.query.filter(
-            CompatibilityMatrix.user_a_id == user_id,
-            CompatibilityMatrix.overall_score >= min_score
-        ).order_by(CompatibilityMatrix.overall_score.desc()).limit(limit).all()
-        
-        return [match.to_dict() for match in matches]
+        cache_key = _matches_cache_key(user_id)
+        cache_field = f"{limit}:{min_score}"
+        if cache_redis is not None:
+            try:
+                cached = cache_redis.hget(cache_key, cache_field)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except redis.RedisError as e:
+                app.logger.warning("Matches cache read failed: %s", e)
+        
+        # Core select: plain rows, no ORM identity-map bookkeeping for a read-only list
+        table = CompatibilityMatrix.__table__
+        rows = db.session.execute(
+            select(table).where(
+                table.c.user_a_id == user_id,
+                table.c.overall_score >= min_score
+            ).order_by(table.c.overall_score.desc()).limit(limit)
+        ).mappings().all()
+        
+        matches = [CompatibilityMatrix.row_to_dict(row) for row in rows]
+        
+        if cache_redis is not None:
+            try:
+                pipe = cache_redis.pipeline()
+                pipe.hset(cache_key, cache_field, orjson.dumps(matches))
+                pipe.expire(cache_key, MATCHES_CACHE_TTL_SECONDS)
+                pipe.execute()
+            except redis.RedisError as e:
+                app.logger.warning("Matches cache write failed: %s", e)
+        
+        return matches
     except Exception as e:
-        print(f"Error getting user matches: {e}")
+        app.logger.exception("Error getting user matches: %s", e)
         return []
 
 def recalculate_all_compatibility():
-    """Recalculate compatibility matrix for all users (admin function)"""
+    """
+    Recalculate compatibility matrix for all users (admin function)
+    Priorities and HD factors are loaded once; each user's row of the pair matrix is
+    scored in one call (NumPy broadcast, or a numba kernel when available) and every
+    pair is upserted in a single transaction.
+    """
     try:
-        users_with_priorities = UserPriorities.query.all()
-        user_ids = [up.user_id for up in users_with_priorities]
+        from hd_intelligence_engine import (
+            HDIntelligenceEngine, get_hd_factors_for_users, enhance_compatibility_with_factors
+        )
+        
+        # Users with missing/out-of-range priorities can't be scored (same as the per-pair path);
+        # the (N, 10) batch comes straight from SQL without building UserPriorities instances
+        user_id_vector, priority_matrix = UserPriorities.bulk_load_array()
+        user_ids = user_id_vector.tolist()
+        
+        hd_engine = HDIntelligenceEngine()
+        hd_factors = get_hd_factors_for_users(user_ids, hd_engine)
         
-        calculation_count = 0
+        calculated_at = datetime.utcnow()
         
-        # Calculate compatibility for all user pairs
-        for i, user_a_id in enumerate(user_ids):
-            for user_b_id in user_ids[i+1:]:
-                compatibility = calculate_mutual_compatibility(user_a_id, user_b_id)
-                if compatibility:
-                    # Store both directions
-                    store_compatibility_result(user_a_id, user_b_id, compatibility)
-                    store_compatibility_result(user_b_id, user_a_id, compatibility)
-                    calculation_count += 2
+        def pair_rows():
+            # Calculate compatibility for all user pairs (upper triangle, one user row at a time)
+            for i, user_a_id in enumerate(user_ids[:-1]):
+                base, final_score, high_priority_bonus, major_mismatches = _magic10_score_row(
+                    priority_matrix[i], priority_matrix[i + 1:]
+                )
+                
+                for k, user_b_id in enumerate(user_ids[i + 1:]):
+                    magic10_compatibility = {
+                        'dimension_scores': dict(zip(MAGIC_10_DIMENSIONS, base[k].tolist())),
+                        'overall_score': int(final_score[k]),
+                        'high_priority_matches': int(high_priority_bonus[k]),
+                        'major_mismatches': int(major_mismatches[k])
+                    }
+                    
+                    try:
+                        compatibility = enhance_compatibility_with_factors(
+                            magic10_compatibility,
+                            hd_factors.get(user_a_id, {}),
+                            hd_factors.get(user_b_id, {}),
+                            hd_engine
+                        )
+                    except Exception as hd_error:
+                        app.logger.warning("HD enhancement failed, using Magic 10 only: %s", hd_error)
+                        compatibility = magic10_compatibility
+                    
+                    # Store both directions (HD columns always present so chunk rows share keys)
+                    for pair in ((user_a_id, user_b_id), (user_b_id, user_a_id)):
+                        row = _compatibility_row(pair[0], pair[1], compatibility, calculated_at)
+                        row.setdefault('hd_enhancement_factor', None)
+                        row.setdefault('compatibility_insights', None)
+                        yield row
+        
+        calculation_count = store_compatibility_results(pair_rows())
+        if calculation_count is None:
+            raise RuntimeError("Failed to store compatibility matrix")
         
         return {
             'status': 'success',
@@ -1215,7 +1761,8 @@ def recalculate_all_compatibility():
             'users_processed': len(user_ids)
         }
     except Exception as e:
-        print(f"Error recalculating compatibility matrix: {e}")
+        db.session.rollback()
+        app.logger.exception("Error recalculating compatibility matrix: %s", e)
         return {
             'status': 'error',
             'message': str(e)
@@ -1226,13 +1773,36 @@ def recalculate_all_compatibility():
 # ============================================================================
 
 def hash_password(password):
-    """Secure password hashing"""
-    return generate_password_hash(password)
+    """Secure password hashing (Argon2)"""
+    return ph.hash(password)
 
 def verify_password(password, password_hash):
-    """Verify password against hash"""
+    """Verify password against an Argon2 hash or a legacy Werkzeug hash"""
+    if not password_hash:
+        return False
+    if password_hash.startswith('$argon2'):
+        try:
+            return ph.verify(password_hash, password)
+        except VerifyMismatchError:
+            return False
+        except Exception as e:
+            app.logger.exception("Password verification failed: %s", e)
+            return False
     return check_password_hash(password_hash, password)
 
+def password_needs_rehash(password_hash):
+    """True for legacy Werkzeug hashes and Argon2 hashes with outdated parameters"""
+    if not password_hash.startswith('$argon2'):
+        return True
+    try:
+        return ph.check_needs_rehash(password_hash)
+    except Exception:
+        return True
+
+def hash_session_token(token):
+    """Digest stored for a session token; the raw token is only ever held by the client"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def create_session_token(user_id):
     """Create session token for user"""
     try:
@@ -1242,10 +1812,10 @@ def create_session_token(user_id):
         # Set expiration (24 hours from now)
         expires_at = datetime.utcnow() + timedelta(hours=24)
         
-        # Create session record
+        # Create session record (fixed-width digest keeps the unique index compact)
         session = UserSession(
             user_id=user_id,
-            session_token=token,
+            session_token=hash_session_token(token),
             expires_at=expires_at
         )
         
@@ -1255,87 +1825,205 @@ def create_session_token(user_id):
         return token
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating session token: {e}")
+        app.logger.exception("Error creating session token: %s", e)
         return None
 
 def verify_session_token(token):
     """Verify session token and return user ID"""
     try:
-        session = UserSession.query.filter_by(session_token=token).first()
-        
-        if not session:
-            return None
-        
-        if session.is_expired():
-            # Clean up expired session
-            db.session.delete(session)
-            db.session.commit()
-            return None
-        
-        return session.user_id
+        # Only the user_id of a live session; expired rows are left for purge_expired_sessions
+        return db.session.execute(
+            select(UserSession.user_id).where(
+                UserSession.session_token == hash_session_token(token),
+                UserSession.expires_at > datetime.utcnow()
+            )
+        ).scalar()
     except Exception as e:
-        print(f"Error verifying session token: {e}")
+        app.logger.exception("Error verifying session token: %s", e)
         return None
 
+def _authenticate():
+    """Validate the session cookie once; returns (user_id, None) or (None, 401 response)"""
+    user, error_code = validate_auth_session()
+    
+    if user:
+        return user, None
+    
+    if error_code == "AUTH_REQUIRED":
+        return None, (jsonify({'error': 'Authentication required', 'code': 'AUTH_REQUIRED'}), 401)
+    
+    # SESSION_EXPIRED - return typed JSON as per CRD
+    return None, (jsonify({
+        'ok': False, 
+        'error': 'session_expired', 
+        'code': 'SESSION_EXPIRED'
+    }), 401)
+
+# Every function marked by require_auth; check_require_auth_placement verifies each one is a registered view
+_auth_required_views = []
+
 def require_auth(f):
-    """Decorator to require session-based authentication (cookie sessions only)"""
-    def decorated_function(*args, **kwargs):
-        user, error_code = validate_auth_session()
-        
-        if not user:
-            if error_code == "AUTH_REQUIRED":
-                return jsonify({'error': 'Authentication required', 'code': 'AUTH_REQUIRED'}), 401
-            else:
-                # SESSION_EXPIRED - return typed JSON as per CRD
-                return jsonify({
-                    'ok': False, 
-                    'error': 'session_expired', 
-                    'code': 'SESSION_EXPIRED'
-                }), 401
-        
-        # Add user to Flask g context for access in route handlers
-        g.user = user
-        return f(*args, **kwargs)
+    """
+    Mark a view as requiring session-based authentication (cookie sessions only)
+    The check itself runs once per request in _auth_guard, so no per-route wrapper is added.
+    Must sit directly under @app.route so the marked function is the one Flask dispatches to.
+    """
+    f._auth_required = True
+    _auth_required_views.append(f)
+    return f
+
+def check_require_auth_placement():
+    """Fail startup when a @require_auth function is not itself a registered view (the route would be unprotected)"""
+    registered = set(app.view_functions.values())
+    misplaced = [f.__qualname__ for f in _auth_required_views if f not in registered]
+    if misplaced:
+        raise RuntimeError(
+            f"@require_auth must be the decorator directly under @app.route; misplaced on: {', '.join(misplaced)}"
+        )
+
+@app.before_request
+def _auth_guard():
+    """Authenticate requests to @require_auth views before dispatch"""
+    # CORS preflights never carry the session and are answered by Flask/Flask-CORS
+    if request.method == 'OPTIONS':
+        return None
     
-    decorated_function.__name__ = f.__name__
-    return decorated_function
+    view = app.view_functions.get(request.endpoint)
+    if view is None or not getattr(view, '_auth_required', False):
+        return None
+    
+    user, error_response = _authenticate()
+    if error_response:
+        return error_response
+    
+    # Add user to Flask g context for access in route handlers
+    g.user = user
+    return None
+
+def current_user():
+    """The authenticated User for this request, loaded at most once (None when unauthenticated)"""
+    if 'current_user' not in g:
+        g.current_user = db.session.get(User, g.user) if g.get('user') else None
+    return g.current_user
 
 def require_admin(f):
     """Decorator to require admin privileges (session-based)"""
+    @wraps(f)
     def decorated_function(*args, **kwargs):
-        user, error_code = validate_auth_session()
-        
+        # Reuse the id when _auth_guard already authenticated this request
+        user = g.get('user')
         if not user:
-            if error_code == "AUTH_REQUIRED":
-                return jsonify({'error': 'Authentication required', 'code': 'AUTH_REQUIRED'}), 401
-            else:
-                # SESSION_EXPIRED - return typed JSON as per CRD
-                return jsonify({
-                    'ok': False, 
-                    'error': 'session_expired', 
-                    'code': 'SESSION_EXPIRED'
-                }), 401
-        
-        # Check if user is admin
-        if not user.is_admin:
-            return jsonify({'error': 'Admin privileges required', 'code': 'ADMIN_REQUIRED'}), 403
+            user, error_response = _authenticate()
+            if error_response:
+                return error_response
         
         # Add user to Flask g context
         g.user = user
+        
+        # Check if user is admin (the session only carries the user id)
+        admin_user = current_user()
+        if not admin_user or not admin_user.is_admin:
+            return jsonify({'error': 'Admin privileges required', 'code': 'ADMIN_REQUIRED'}), 403
+        
         return f(*args, **kwargs)
     
-    decorated_function.__name__ = f.__name__
     return decorated_function
 
 # ============================================================================
 # EXTERNAL API INTEGRATIONS
 # ============================================================================
 
+# Shared keep-alive pool for outbound API calls (Mailgun, Human Design, Google geocoding).
+# Connection failures are retried for every method; status/read retries only for GET so a
+# POST (e.g. an email send) is never replayed after the upstream may have processed it.
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True
+    )
+))
+
+# Shared latency budget per request: chained upstream calls (geocode -> HD -> email) share one
+# deadline instead of each getting its own full timeout. Kept below gunicorn's 30s worker timeout.
+REQUEST_BUDGET_SECONDS = float(os.environ.get('REQUEST_BUDGET_SECONDS', '25'))
+OUTBOUND_CONNECT_TIMEOUT_SECONDS = 3
+OUTBOUND_MIN_TIMEOUT_SECONDS = 0.1
+
+@app.before_request
+def _start_request_budget():
+    g.request_deadline = time_module.monotonic() + REQUEST_BUDGET_SECONDS
+
+def outbound_timeout(read_timeout):
+    """
+    (connect, read) timeout for an outbound call, capped by what is left of the request budget
+    Background tasks have no request deadline and get the call's own timeouts.
+    """
+    connect_timeout = OUTBOUND_CONNECT_TIMEOUT_SECONDS
+    deadline = g.get('request_deadline') if has_request_context() else None
+    if deadline is not None:
+        remaining = max(OUTBOUND_MIN_TIMEOUT_SECONDS, deadline - time_module.monotonic())
+        connect_timeout = min(connect_timeout, remaining)
+        read_timeout = min(read_timeout, remaining)
+    return (connect_timeout, read_timeout)
+
+class CircuitBreaker:
+    """
+    Minimal per-process circuit breaker for upstream APIs
+    After fail_max consecutive failures calls are refused for reset_timeout seconds,
+    then a single trial call is let through (half-open) to decide whether to close again.
+    """
+    
+    def __init__(self, name, fail_max=5, reset_timeout=30):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+    
+    def allow_request(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time_module.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let this call through and push the window out for everyone else
+                self._opened_at = time_module.monotonic()
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    app.logger.warning("Circuit breaker opened for %s after %s failures", self.name, self._failures)
+                self._opened_at = time_module.monotonic()
+
+mailgun_breaker = CircuitBreaker('mailgun')
+hd_api_breaker = CircuitBreaker('human_design_api')
+geocode_breaker = CircuitBreaker('google_geocode')
+
+def _is_upstream_failure(status_code):
+    """Statuses that indicate the upstream itself is unhealthy (vs. a bad request)"""
+    return status_code == 429 or status_code >= 500
+
 def send_email_via_mailgun(to_email, subject, content, content_type='text'):
     """Send email via Mailgun API with error handling"""
     try:
         if not app.config['MAILGUN_API_KEY'] or not app.config['MAILGUN_DOMAIN']:
-            print("Mailgun not configured, skipping email")
+            app.logger.warning("Mailgun not configured, skipping email")
             return {'status': 'skipped', 'message': 'Email service not configured'}
         
         url = f"{app.config['MAILGUN_BASE_URL']}/{app.config['MAILGUN_DOMAIN']}/messages"
@@ -1351,26 +2039,105 @@ def send_email_via_mailgun(to_email, subject, content, content_type='text'):
         else:
             data['text'] = content
         
-        response = requests.post(
+        if not mailgun_breaker.allow_request():
+            return {'status': 'failed', 'message': 'Email service unavailable', 'retryable': True}
+        
+        response = http_session.post(
             url,
             auth=('api', app.config['MAILGUN_API_KEY']),
             data=data,
-            timeout=10
+            timeout=outbound_timeout(10)
         )
         
+        if _is_upstream_failure(response.status_code):
+            mailgun_breaker.record_failure()
+        else:
+            mailgun_breaker.record_success()
+        
         if response.status_code == 200:
             return {'status': 'sent', 'message': 'Email sent successfully'}
         else:
-            print(f"Mailgun error: {response.status_code} - {response.text}")
-            return {'status': 'failed', 'message': 'Email delivery failed'}
+            app.logger.error("Mailgun error: %s - %s", response.status_code, response.text)
+            return {
+                'status': 'failed',
+                'message': 'Email delivery failed',
+                'retryable': _is_upstream_failure(response.status_code)
+            }
     
     except requests.RequestException as e:
-        print(f"Mailgun request error: {e}")
-        return {'status': 'failed', 'message': 'Email service unavailable'}
+        mailgun_breaker.record_failure()
+        app.logger.exception("Mailgun request error: %s", e)
+        return {'status': 'failed', 'message': 'Email service unavailable', 'retryable': True}
     except Exception as e:
-        print(f"Email sending error: {e}")
+        app.logger.exception("Email sending error: %s", e)
         return {'status': 'failed', 'message': 'Email sending failed'}
 
+# Background pool for fire-and-forget side effects (e.g. emails): the Mailgun round trip runs off
+# the request thread, so the response doesn't wait on upstream RTT or hold a gthread slot for it.
+background_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('BACKGROUND_WORKERS', '4')),
+    thread_name_prefix='glow-bg'
+)
+
+def run_in_background(func, *args, **kwargs):
+    """Run func in the background pool inside an app context; errors are logged, never raised"""
+    def task():
+        with app.app_context():
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                app.logger.exception("Background task %s failed: %s", func.__name__, e)
+            finally:
+                db.session.remove()
+    
+    return background_executor.submit(task)
+
+EMAIL_MAX_RETRIES = 5
+EMAIL_RETRY_BACKOFF_SECONDS = 2
+EMAIL_RETRY_BACKOFF_MAX_SECONDS = 60
+
+def send_email_task(to_email, subject, content, email_type, user_id, attempt=0):
+    """
+    Send an email via Mailgun and log the outcome as an EmailNotification row. Transient
+    failures (network errors, 429, 5xx) are retried with exponential backoff and full jitter;
+    a timer resubmits the next attempt to the background pool, so no pool thread sleeps
+    through the delay and only the final attempt is logged.
+    """
+    result = send_email_via_mailgun(to_email, subject, content)
+    if result['status'] == 'failed' and result.get('retryable') and attempt < EMAIL_MAX_RETRIES:
+        delay = min(EMAIL_RETRY_BACKOFF_MAX_SECONDS, EMAIL_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        retry = threading.Timer(
+            random.uniform(0, delay), run_in_background,
+            args=(send_email_task, to_email, subject, content, email_type, user_id),
+            kwargs={'attempt': attempt + 1}
+        )
+        retry.daemon = True
+        retry.start()
+        return result
+    
+    # Log email notification in its own short transaction (Core insert, one round-trip),
+    # so it neither commits nor rolls back whatever the caller's session has pending
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(EmailNotification.__table__.insert(), {
+                'user_id': user_id,
+                'email_type': email_type,
+                'recipient_email': to_email,
+                'subject': subject,
+                'delivery_status': result['status']
+            })
+    except Exception as e:
+        app.logger.exception("Error logging email notification: %s", e)
+    
+    return result
+
+def send_welcome_email_for_user_id(user_id):
+    """Background entry point: reload the user in this thread's session and send the welcome email"""
+    user = db.session.get(User, user_id)
+    if user:
+        return send_welcome_email(user)
+    return None
+
 def send_welcome_email(user):
     """Send welcome email to new user"""
     subject = "Welcome to GLOW!"
@@ -1385,23 +2152,7 @@ def send_welcome_email(user):
     The GLOW Team
     """
     
-    result = send_email_via_mailgun(user.email, subject, content)
-    
-    # Log email notification
-    try:
-        notification = EmailNotification(
-            user_id=user.id,
-            email_type='welcome',
-            recipient_email=user.email,
-            subject=subject,
-            delivery_status=result['status']
-        )
-        db.session.add(notification)
-        db.session.commit()
-    except Exception as e:
-        print(f"Error logging email notification: {e}")
-    
-    return result
+    return send_email_task(user.email, subject, content, 'welcome', user.id)
 
 def send_match_notification(user, match_user, compatibility_score):
     """Send new match notification email"""
@@ -1420,30 +2171,34 @@ def send_match_notification(user, match_user, compatibility_score):
     The GLOW Team
     """
     
-    result = send_email_via_mailgun(user.email, subject, content)
-    
-    # Log email notification
-    try:
-        notification = EmailNotification(
-            user_id=user.id,
-            email_type='match_notification',
-            recipient_email=user.email,
-            subject=subject,
-            delivery_status=result['status']
-        )
-        db.session.add(notification)
-        db.session.commit()
-    except Exception as e:
-        print(f"Error logging email notification: {e}")
-    
-    return result
+    return send_email_task(user.email, subject, content, 'match_notification', user.id)
+
+# A chart is fully determined by its birth inputs, so cached responses only age out
+# to bound Redis memory; the key carries an API-key fingerprint so rotations don't mix.
+HD_CACHE_TTL_SECONDS = 365 * 86400
+
+def _hd_cache_key(birth_data):
+    """Redis key for a Human Design chart, keyed on the normalized birth-data tuple"""
+    tenant = hashlib.sha256(app.config['HD_API_KEY'].encode()).hexdigest()[:12]
+    location = ' '.join(str(birth_data['birth_location']).lower().split())
+    raw = f"{birth_data['birth_date']}|{birth_data['birth_time']}|{location}"
+    return f"hd:v1:{tenant}:{hashlib.sha256(raw.encode()).hexdigest()}"
 
 def call_human_design_api(birth_data):
-    """Call Human Design API with birth data"""
+    """Call Human Design API with birth data (successful charts cached in Redis)"""
     try:
         if not app.config['HD_API_KEY'] or not app.config['GEO_API_KEY']:
             return {'error': 'Human Design API not configured'}
         
+        cache_key = _hd_cache_key(birth_data)
+        if cache_redis is not None:
+            try:
+                cached = cache_redis.get(cache_key)
+                if cached:
+                    return orjson.loads(cached)
+            except redis.RedisError as e:
+                app.logger.warning("Human Design cache read failed: %s", e)
+        
         url = f"{app.config['HD_API_BASE_URL']}/bodygraphs"
         
         headers = {
@@ -1459,84 +2214,133 @@ def call_human_design_api(birth_data):
             'location': birth_data['birth_location']
         }
         
-        response = requests.post(
+        if not hd_api_breaker.allow_request():
+            return {'error': 'Human Design API unavailable'}
+        
+        response = http_session.post(
             url,
             headers=headers,
             json=api_data,
-            timeout=30
+            timeout=outbound_timeout(30)
         )
         
+        if _is_upstream_failure(response.status_code):
+            hd_api_breaker.record_failure()
+        else:
+            hd_api_breaker.record_success()
+        
         if response.status_code == 200:
-            return response.json()
+            result = orjson.loads(response.content)
+            if cache_redis is not None and isinstance(result, dict) and 'error' not in result:
+                try:
+                    cache_redis.setex(cache_key, HD_CACHE_TTL_SECONDS, orjson.dumps(result))
+                except redis.RedisError as e:
+                    app.logger.warning("Human Design cache write failed: %s", e)
+            return result
         else:
-            print(f"Human Design API error: {response.status_code} - {response.text}")
+            app.logger.error("Human Design API error: %s - %s", response.status_code, response.text)
             return {'error': f'API request failed: {response.status_code}'}
     
     except requests.RequestException as e:
-        print(f"Human Design API request error: {e}")
+        hd_api_breaker.record_failure()
+        app.logger.exception("Human Design API request error: %s", e)
         return {'error': 'Human Design API unavailable'}
     except Exception as e:
-        print(f"Human Design API error: {e}")
+        app.logger.exception("Human Design API error: %s", e)
         return {'error': 'Human Design calculation failed'}
 
+GEOCODE_CACHE_TTL_SECONDS = 30 * 86400
+
+def _geocode_cache_key(location_string):
+    """Redis key for a location, normalized for case and whitespace"""
+    normalized = ' '.join(location_string.lower().split())
+    return f"geo:v1:{hashlib.sha1(normalized.encode()).hexdigest()}"
+
 def geocode_location(location_string):
-    """Geocode location using Google Places API"""
+    """Geocode location using Google Places API (results cached in Redis for 30 days)"""
     try:
         if not app.config['GEO_API_KEY']:
             return None
         
+        cache_key = _geocode_cache_key(location_string)
+        if cache_redis is not None:
+            try:
+                cached = cache_redis.get(cache_key)
+                if cached:
+                    return orjson.loads(cached)
+            except redis.RedisError as e:
+                app.logger.warning("Geocode cache read failed: %s", e)
+        
         url = "https://maps.googleapis.com/maps/api/geocode/json"
         params = {
             'address': location_string,
             'key': app.config['GEO_API_KEY']
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        if not geocode_breaker.allow_request():
+            return None
+        
+        try:
+            response = http_session.get(url, params=params, timeout=outbound_timeout(10))
+        except requests.RequestException:
+            geocode_breaker.record_failure()
+            raise
+        
+        if _is_upstream_failure(response.status_code):
+            geocode_breaker.record_failure()
+        else:
+            geocode_breaker.record_success()
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if data['results']:
                 location = data['results'][0]['geometry']['location']
-                return {
+                result = {
                     'latitude': location['lat'],
                     'longitude': location['lng']
                 }
+                
+                if cache_redis is not None:
+                    try:
+                        cache_redis.setex(cache_key, GEOCODE_CACHE_TTL_SECONDS, orjson.dumps(result))
+                    except redis.RedisError as e:
+                        app.logger.warning("Geocode cache write failed: %s", e)
+                
+                return result
         
         return None
     except Exception as e:
-        print(f"Geocoding error: {e}")
+        app.logger.exception("Geocoding error: %s", e)
         return None
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Set once tables are confirmed; an Event (not a function attribute) so threads in a worker agree
+_database_ready = threading.Event()
+
 def ensure_database():
-    """Ensure database is initialized (Railway-safe lazy initialization)"""
-    if not hasattr(ensure_database, 'initialized'):
-        try:
-            with app.app_context():
-                # Create all tables
-                db.create_all()
-                
-                # Verify tables were created by checking if users table exists
-                result = db.session.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='users'"))
-                if not result.fetchone():
-                    # If using PostgreSQL, use different query
-                    try:
-                        result = db.session.execute(text("SELECT tablename FROM pg_tables WHERE tablename='users'"))
-                        if not result.fetchone():
-                            raise Exception("Users table not found after creation")
-                    except:
-                        # Force table creation again
-                        db.create_all()
-                
-                ensure_database.initialized = True
-                print("Database initialized successfully - all tables created")
-        except Exception as e:
-            print(f"Database initialization error: {e}")
-            # Don't raise the exception, let the app continue
-            pass
+    """
+    Ensure database is initialized
+    Runs at import (before gunicorn --preload forks), so request paths only pay the Event check.
+    """
+    if _database_ready.is_set():
+        return
+    try:
+        with app.app_context():
+            # Create all tables
+            db.create_all()
+            
+            # Verify the users table through the dialect-aware inspector
+            if not sa_inspect(db.engine).has_table('users'):
+                raise Exception("Users table not found after creation")
+            
+            _database_ready.set()
+            app.logger.info("Database initialized successfully - all tables created")
+    except Exception as e:
+        app.logger.exception("Database initialization error: %s", e)
+        # Don't raise the exception, let the app continue
 
 def log_admin_action(admin_user_id, action, target_user_id=None, details=None):
     """Log admin action for audit trail"""
@@ -1552,40 +2356,169 @@ def log_admin_action(admin_user_id, action, target_user_id=None, details=None):
         return log_entry
     except Exception as e:
         db.session.rollback()
-        print(f"Error logging admin action: {e}")
+        app.logger.exception("Error logging admin action: %s", e)
         return None
 
+KEYSET_MAX_PER_PAGE = 200
+
+def encode_page_cursor(sort_value, row_id):
+    """Opaque cursor for the last row of a keyset page (a NULL sort value encodes as empty)"""
+    raw = f"{sort_value.isoformat() if sort_value is not None else ''}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_page_cursor(cursor):
+    """Inverse of encode_page_cursor; raises ValueError on a malformed cursor"""
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return (datetime.fromisoformat(sort_value) if sort_value else None), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def _keyset_order(sort_column, id_column):
+    """
+    (sort_column DESC NULLS FIRST, id DESC): the sort columns are nullable, and NULLS FIRST is
+    Postgres' own DESC order (so the DESC indexes still serve it) made explicit for SQLite
+    """
+    return sort_column.desc().nulls_first(), id_column.desc()
+
+def keyset_page(query, sort_column, id_column, cursor, per_page):
+    """
+    One page of query in _keyset_order (sort_column DESC, id DESC), seeking past cursor
+    An index range scan regardless of depth (no OFFSET). Returns (rows, next_cursor or None).
+    """
+    if cursor:
+        query = query.filter(_keyset_seek(sort_column, id_column, cursor))
+    
+    # One extra row tells us whether there is a next page without a COUNT
+    rows = query.order_by(*_keyset_order(sort_column, id_column)).limit(per_page + 1).all()
+    if len(rows) <= per_page:
+        return rows, None
+    
+    rows = rows[:per_page]
+    last = rows[-1]
+    return rows, encode_page_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+def _keyset_seek(sort_column, id_column, cursor):
+    """WHERE clause selecting the rows after cursor in _keyset_order"""
+    sort_value, row_id = decode_page_cursor(cursor)
+    if sort_value is None:
+        # Still inside the leading NULL block: its remaining ids, then every dated row
+        return or_(and_(sort_column.is_(None), id_column < row_id), sort_column.isnot(None))
+    return or_(
+        sort_column < sort_value,
+        and_(sort_column == sort_value, id_column < row_id)
+    )
+
+def json_keyset_page(columns, sort_column, id_column, cursor, per_page, *criteria):
+    """
+    Postgres-only keyset_page that has the database render the page as a JSON array
+    (json_agg over the given table columns), so rows are never hydrated or re-encoded in Python.
+    Returns (json_array_text, next_cursor or None).
+    """
+    from sqlalchemy.dialects.postgresql import aggregate_order_by
+    
+    order = _keyset_order(sort_column, id_column)
+    stmt = select(*columns, db.func.row_number().over(order_by=order).label('rn')).where(*criteria)
+    if cursor:
+        stmt = stmt.where(_keyset_seek(sort_column, id_column, cursor))
+    page = stmt.order_by(*order).limit(per_page + 1).subquery()
+    
+    item = db.func.json_build_object(*itertools.chain.from_iterable(
+        (db.literal_column(f"'{column.key}'"), page.c[column.key]) for column in columns
+    ))
+    # The extra row only signals has_next; the last in-page row supplies the cursor
+    is_last = page.c.rn == per_page
+    items, has_next, last_sort_value, last_id = db.session.execute(select(
+        db.cast(db.func.coalesce(
+            db.func.json_agg(aggregate_order_by(item, page.c.rn)).filter(page.c.rn <= per_page),
+            db.literal_column("'[]'::json")
+        ), db.Text),
+        db.func.count() > per_page,
+        db.func.max(page.c[sort_column.key]).filter(is_last),
+        db.func.max(page.c[id_column.key]).filter(is_last)
+    )).one()
+    
+    return items, encode_page_cursor(last_sort_value, last_id) if has_next else None
+
+def json_page_response(key, items, next_cursor, per_page):
+    """Keyset page response around a pre-rendered JSON array (from json_keyset_page)"""
+    meta = orjson.dumps({'has_next': next_cursor is not None, 'next_cursor': next_cursor, 'per_page': per_page})
+    body = meta[:-1] + f',"{key}":'.encode() + items.encode() + b'}\n'
+    return app.response_class(body, mimetype='application/json')
+
+# Legacy ?page= totals: an exact COUNT(*) per click is the slow half of an OFFSET page, so
+# totals come from Redis and may lag inserts/deletes by up to this TTL.
+ADMIN_COUNT_CACHE_TTL_SECONDS = 300
+
+def offset_page(query, page, per_page):
+    """One OFFSET page of an ordered query, without COUNT. Returns (rows, has_next)."""
+    rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+    return rows[:per_page], len(rows) > per_page
+
+def cached_row_count(cache_key, query):
+    """query's row count, cached in Redis for ADMIN_COUNT_CACHE_TTL_SECONDS"""
+    if cache_redis is not None:
+        try:
+            cached = cache_redis.get(cache_key)
+            if cached is not None:
+                return int(cached)
+        except redis.RedisError as e:
+            app.logger.warning("Count cache read failed: %s", e)
+    
+    total = query.order_by(None).count()
+    if cache_redis is not None:
+        try:
+            cache_redis.setex(cache_key, ADMIN_COUNT_CACHE_TTL_SECONDS, total)
+        except redis.RedisError as e:
+            app.logger.warning("Count cache write failed: %s", e)
+    return total
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def validate_email(email):
     """Basic email validation"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 def validate_priorities(priorities):
     """Validate Magic 10 priorities array"""
     if not isinstance(priorities, list) or len(priorities) != 10:
         return False
     
-    for priority in priorities:
-        if not isinstance(priority, int) or not (1 <= priority <= 10):
-            return False
-    
-    return True
+    return all(isinstance(priority, int) and 1 <= priority <= 10 for priority in priorities)
 
 # ============================================================================
 # API ROUTES - HEALTH CHECK AND MONITORING
 # ============================================================================
 
+# Health probes fire every few seconds; reuse a recent DB check instead of querying each time,
+# and ride out a brief DB blip with the last known-good result (marked X-Cache: stale).
+HEALTH_CHECK_TTL_SECONDS = 5
+HEALTH_CHECK_STALE_SECONDS = 30
+_health_last_ok = None
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint for Railway monitoring"""
+    global _health_last_ok
+    cache_status = 'hit'
+    
     try:
-        ensure_database()
-        
-        # Test database connection
-        db.session.execute(text('SELECT 1'))
+        now = time_module.monotonic()
+        if _health_last_ok is None or now - _health_last_ok > HEALTH_CHECK_TTL_SECONDS:
+            cache_status = 'miss'
+            try:
+                ensure_database()
+                
+                # Test database connection
+                db.session.execute(text('SELECT 1'))
+                _health_last_ok = now
+            except Exception:
+                if _health_last_ok is None or now - _health_last_ok > HEALTH_CHECK_STALE_SECONDS:
+                    raise
+                db.session.rollback()
+                cache_status = 'stale'
         
-        return jsonify({
+        response = jsonify({
             'status': 'healthy',
             'database': 'connected',
             'version': '1.0.0',
@@ -1597,6 +2530,8 @@ def health_check():
                 'admin_console': True
             }
         })
+        response.headers['X-Cache'] = cache_status
+        return response
     except Exception as e:
         return jsonify({
             'status': 'unhealthy',
@@ -1649,7 +2584,7 @@ def test_human_design_api():
             'birth_location': data.get('location', 'East Grand Rapids, Michigan, USA')
         }
         
-        print(f"Testing Human Design API with: {test_data}")
+        app.logger.info("Testing Human Design API with: %s", test_data)
         
         # Call the Human Design API
         api_response = call_human_design_api(test_data)
@@ -1805,13 +2740,13 @@ def cleanup_user_redundancy():
                 for column in existing_columns:
                     try:
                         db.session.execute(text(f"ALTER TABLE users DROP COLUMN IF EXISTS {column}"))
-                        print(f"Dropped column: {column}")
+                        app.logger.info("Dropped column: %s", column)
                     except Exception as e:
-                        print(f"Could not drop column {column}: {e}")
+                        app.logger.warning("Could not drop column %s: %s", column, e)
                 
             else:
                 # SQLite - more complex, need to recreate table
-                print("SQLite detected - column dropping requires table recreation")
+                app.logger.info("SQLite detected - column dropping requires table recreation")
                 # For SQLite, we'd need to recreate the table, but this is more complex
                 # For now, just report the status
                 
@@ -1838,8 +2773,6 @@ def cleanup_user_redundancy():
 def register():
     """User registration endpoint"""
     try:
-        ensure_database()
-        
         data = request.get_json()
         if not data:
             return jsonify({'error': 'No data provided'}), 400
@@ -1869,15 +2802,16 @@ def register():
         )
         
         db.session.add(user)
-        db.session.commit()
+        db.session.flush()  # assigns user.id without committing
         
-        # Create default priorities
+        # Create default priorities in the same transaction
         priorities = UserPriorities(user_id=user.id)
         db.session.add(priorities)
         db.session.commit()
+        invalidate_admin_stats_cache()
         
-        # Send welcome email
-        send_welcome_email(user)
+        # Send welcome email without blocking the response on Mailgun
+        run_in_background(send_welcome_email_for_user_id, user.id)
         
         return jsonify({
             'message': 'User registered successfully',
@@ -1886,7 +2820,7 @@ def register():
     
     except Exception as e:
         db.session.rollback()
-        print(f"Registration error: {e}")
+        app.logger.exception("Registration error: %s", e)
         return jsonify({'error': 'Registration failed'}), 500
 
 # ============================================================================
@@ -1909,10 +2843,10 @@ def create_auth_session(user_id):
         # Track session for revocation (T-BE-003)
         track_session_on_login(session_store, user_id, session_data['session_id'])
         
-        app.logger.info(f"Session created for user {user_id}: {session_data['session_id']}")
+        app.logger.debug("Session created for user %s: %s", user_id, session_data['session_id'])
         return True
     except Exception as e:
-        app.logger.error(f"Failed to create session: {e}")
+        app.logger.exception("Failed to create session: %s", e)
         return False
 
 def validate_auth_session():
@@ -1953,7 +2887,7 @@ def validate_auth_session():
         if idle_seconds >= idle_limit_seconds:
             session_store.destroy_session(session_id)
             session.clear()
-            app.logger.info(f"Session expired (idle {idle_seconds:.0f}s >= {idle_limit_seconds}s): {session_id}")
+            app.logger.debug("Session expired (idle %.0fs >= %ss): %s", idle_seconds, idle_limit_seconds, session_id)
             return None, "SESSION_EXPIRED"
         
         # Update last_seen for all requests
@@ -1966,12 +2900,12 @@ def validate_auth_session():
             # Set flag for cookie reissue in response
             g.session_needs_refresh = True
             g.session_id = session_id
-            app.logger.info(f"Session renewal triggered (idle {idle_seconds:.0f}s >= {renewal_threshold_seconds:.0f}s): {session_id}")
+            app.logger.debug("Session renewal triggered (idle %.0fs >= %.0fs): %s", idle_seconds, renewal_threshold_seconds, session_id)
         
         return session_data['user_id'], None
         
     except Exception as e:
-        app.logger.error(f"Session validation error: {e}")
+        app.logger.exception("Session validation error: %s", e)
         session.clear()
         return None, "SESSION_EXPIRED"
 
@@ -1992,29 +2926,10 @@ def clear_auth_session():
         # Clear Flask session
         session.clear()
         
-        app.logger.info(f"Session cleared for user {user_id or 'unknown'}")
+        app.logger.info("Session cleared for user %s", user_id or 'unknown')
         return True
     except Exception as e:
-        app.logger.error(f"Failed to clear session: {e}")
-        return False
-
-def hash_password_v2(password):
-    """Hash password using Argon2 (Auth v2)"""
-    try:
-        return ph.hash(password)
-    except Exception as e:
-        app.logger.error(f"Password hashing failed: {e}")
-        raise
-
-def verify_password_v2(password, password_hash):
-    """Verify password using Argon2 (Auth v2)"""
-    try:
-        ph.verify(password_hash, password)
-        return True
-    except VerifyMismatchError:
-        return False
-    except Exception as e:
-        app.logger.error(f"Password verification failed: {e}")
+        app.logger.exception("Failed to clear session: %s", e)
         return False
 
 # ============================================================================
@@ -2026,8 +2941,6 @@ def verify_password_v2(password, password_hash):
 def auth_v2_login():
     """Auth v2 Login - Cookie-based session with JSON contracts"""
     try:
-        ensure_database()
-        
         # Parse request
         data = request.get_json()
         if not data or not data.get('email') or not data.get('password'):
@@ -2055,12 +2968,12 @@ def auth_v2_login():
             return response
         
         # Rate limiting log
-        app.logger.info(f"Login attempt for email: {hashlib.sha256(email.encode()).hexdigest()[:8]}")
+        app.logger.info("Login attempt for email: %s", hashlib.sha256(email.encode()).hexdigest()[:8])
         
         # Find user
         user = User.query.filter_by(email=email).first()
         if not user:
-            app.logger.info(f"Login failed: user not found for email hash {hashlib.sha256(email.encode()).hexdigest()[:8]}")
+            app.logger.info("Login failed: user not found for email hash %s", hashlib.sha256(email.encode()).hexdigest()[:8])
             # S7-MP4: Record failed attempt
             login_rate_limiter.record_failed_attempt(request, email)
             return jsonify({
@@ -2070,21 +2983,15 @@ def auth_v2_login():
             }), 401
         
         # Verify password (support both old and new hashing)
-        password_valid = False
-        if user.password_hash.startswith('$argon2'):
-            # New Argon2 hash
-            password_valid = verify_password_v2(password, user.password_hash)
-        else:
-            # Legacy Werkzeug hash - verify and upgrade
-            password_valid = check_password_hash(user.password_hash, password)
-            if password_valid:
-                # Upgrade to Argon2
-                user.password_hash = hash_password_v2(password)
-                db.session.commit()
-                app.logger.info(f"Password upgraded to Argon2 for user {user.id}")
+        password_valid = verify_password(password, user.password_hash)
+        if password_valid and password_needs_rehash(user.password_hash):
+            # Lazily upgrade legacy Werkzeug hashes and stale Argon2 parameters
+            user.password_hash = hash_password(password)
+            db.session.commit()
+            app.logger.info("Password upgraded to Argon2 for user %s", user.id)
         
         if not password_valid:
-            app.logger.info(f"Login failed: invalid password for user {user.id}")
+            app.logger.info("Login failed: invalid password for user %s", user.id)
             # S7-MP4: Record failed attempt
             login_rate_limiter.record_failed_attempt(request, email)
             return jsonify({
@@ -2095,7 +3002,7 @@ def auth_v2_login():
         
         # Check user status
         if user.status != 'approved':
-            app.logger.info(f"Login failed: user {user.id} status is {user.status}")
+            app.logger.info("Login failed: user %s status is %s", user.id, user.status)
             return jsonify({
                 'ok': False,
                 'error': f'Account is {user.status}',
@@ -2126,14 +3033,14 @@ def auth_v2_login():
         
         # Issue both session and CSRF cookies using centralized helpers (BE-LOGIN-02)
         session_id = session.get('session_id')
-        app.logger.info(f"DEBUG: session_id from Flask session: {session_id}")
+        app.logger.debug("DEBUG: session_id from Flask session: %s", session_id)
         
         if session_id:
             # Import centralized cookie helpers
             from cookies import set_session_cookie, set_csrf_cookie
             from csrf_protection import generate_csrf_token
             
-            app.logger.info(f"DEBUG: Setting cookies for session_id: {session_id}")
+            app.logger.debug("DEBUG: Setting cookies for session_id: %s", session_id)
             
             # Set session cookie (HttpOnly=true)
             set_session_cookie(response, session_id, max_age=1800)
@@ -2149,9 +3056,9 @@ def auth_v2_login():
                 session_store.update_session(session_id, session_data)
             
             # Login diagnostics logging (BE-LOGIN-02-C)
-            app.logger.info(f"auth_login_issue user_id={user.id} has_session_cookie=true has_csrf_cookie=true domain=.glowme.io status=200")
+            app.logger.info("auth_login_issue user_id=%s has_session_cookie=true has_csrf_cookie=true domain=.glowme.io status=200", user.id)
         else:
-            app.logger.error(f"DEBUG: No session_id found in Flask session - cookies not set!")
+            app.logger.error("DEBUG: No session_id found in Flask session - cookies not set!")
             # Emergency fallback - try to get session_id from session store directly
             try:
                 from cookies import set_session_cookie, set_csrf_cookie
@@ -2165,7 +3072,7 @@ def auth_v2_login():
                 session['session_id'] = fallback_session_id
                 session['user_id'] = user.id
                 
-                app.logger.info(f"DEBUG: Created fallback session: {fallback_session_id}")
+                app.logger.debug("DEBUG: Created fallback session: %s", fallback_session_id)
                 
                 # Set cookies with fallback session
                 set_session_cookie(response, fallback_session_id, max_age=1800)
@@ -2176,15 +3083,15 @@ def auth_v2_login():
                 session_data['csrf'] = csrf_token
                 session_store.update_session(fallback_session_id, session_data)
                 
-                app.logger.info(f"auth_login_issue_fallback user_id={user.id} has_session_cookie=true has_csrf_cookie=true domain=.glowme.io status=200")
+                app.logger.info("auth_login_issue_fallback user_id=%s has_session_cookie=true has_csrf_cookie=true domain=.glowme.io status=200", user.id)
             except Exception as e:
-                app.logger.error(f"DEBUG: Fallback cookie setting failed: {e}")
+                app.logger.exception("DEBUG: Fallback cookie setting failed: %s", e)
         
-        app.logger.info(f"Login successful for user {user.id}")
+        app.logger.info("Login successful for user %s", user.id)
         return response, 200
     
     except Exception as e:
-        app.logger.error(f"Login error: {e}")
+        app.logger.exception("Login error: %s", e)
         return jsonify({
             'ok': False,
             'error': 'Login failed',
@@ -2207,7 +3114,7 @@ def auth_v2_me():
         user_id, error_code = validate_auth_session()
         
         if not user_id:
-            app.logger.info(f"Me check failed: {error_code}")
+            app.logger.info("Me check failed: %s", error_code)
             response = jsonify({
                 'ok': False,
                 'error': 'Authentication required',
@@ -2244,18 +3151,18 @@ def auth_v2_me():
             ).filter(User.id == user_id)
             
             # Log compiled SQL for debugging
-            app.logger.info(f"me_join_sql user_id={user_id} query={str(query)}")
+            app.logger.info("me_join_sql user_id=%s query=%s", user_id, query)
             
             result = query.first()
             
             # Log raw row for debugging
             if result:
-                app.logger.info(f"me_join_row user_id={user_id} birth_date={result[10]} birth_time={result[11]}")
+                app.logger.info("me_join_row user_id=%s birth_date=%s birth_time=%s", user_id, result[10], result[11])
             else:
-                app.logger.warning(f"me_join_row user_id={user_id} result=None")
+                app.logger.warning("me_join_row user_id=%s result=None", user_id)
                 
         except Exception as query_error:
-            app.logger.error(f"me_join_error user_id={user_id} error={type(query_error).__name__}: {query_error}")
+            app.logger.exception("me_join_error user_id=%s error=%s: %s", user_id, type(query_error).__name__, query_error)
             # Return 5xx instead of silent fallback
             response = jsonify({
                 'ok': False,
@@ -2268,7 +3175,7 @@ def auth_v2_me():
         
         if not result:
             session.clear()
-            app.logger.error(f"Me check failed: user {user_id} not found")
+            app.logger.error("Me check failed: user %s not found", user_id)
             response = jsonify({
                 'ok': False,
                 'error': 'User not found',
@@ -2284,7 +3191,7 @@ def auth_v2_me():
              first_name, last_name, display_name, avatar_url, bio, profile_completion,
              birth_date, birth_time, timezone, latitude, longitude, birth_location) = result
         except (ValueError, TypeError) as unpack_error:
-            app.logger.error(f"Result unpacking error in /me: {unpack_error}")
+            app.logger.exception("Result unpacking error in /me: %s", unpack_error)
             # Use safe defaults
             user_id, email, status, is_admin, updated_at = result[:5]
             first_name = last_name = display_name = avatar_url = bio = profile_completion = None
@@ -2387,13 +3294,13 @@ def auth_v2_me():
         
         # Log performance and success
         latency_ms = int((time_module.time() - start_time) * 1000)
-        app.logger.info(f"Me check successful for user {user_id}, renewed={session_renewed}, latency={latency_ms}ms")
+        app.logger.info("Me check successful for user %s, renewed=%s, latency=%sms", user_id, session_renewed, latency_ms)
         
         return response, 200
     
     except Exception as e:
         latency_ms = int((time_module.time() - start_time) * 1000)
-        app.logger.error(f"Me check error: {e}, latency={latency_ms}ms")
+        app.logger.exception("Me check error: %s, latency=%sms", e, latency_ms)
         response = jsonify({
             'ok': False,
             'error': 'Authentication check failed',
@@ -2423,7 +3330,7 @@ def auth_v2_logout():
                 'idempotent': True,
                 'ok': True
             }
-            app.logger.info(f"Logout successful for user {user_id}")
+            app.logger.info("Logout successful for user %s", user_id)
         else:
             response_data = {
                 'status': 'ok',
@@ -2443,7 +3350,7 @@ def auth_v2_logout():
         return response, 200
     
     except Exception as e:
-        app.logger.error(f"Logout error: {e}")
+        app.logger.exception("Logout error: %s", e)
         return jsonify({
             'status': 'error',
             'code': 'INTERNAL_ERROR',
@@ -2510,7 +3417,7 @@ def get_user_priorities():
         return jsonify({'priorities': priorities.to_dict()})
     
     except Exception as e:
-        print(f"Get priorities error: {e}")
+        app.logger.exception("Get priorities error: %s", e)
         return jsonify({'error': 'Failed to get priorities'}), 500
 
 @app.route('/api/priorities', methods=['PUT'])
@@ -2522,18 +3429,12 @@ def update_user_priorities():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Validate priorities
-        priority_fields = [
-            'love_priority', 'intimacy_priority', 'communication_priority',
-            'friendship_priority', 'collaboration_priority', 'lifestyle_priority',
-            'decisions_priority', 'support_priority', 'growth_priority', 'space_priority'
-        ]
+        # Validate priorities (single pass over the fields present in the payload)
+        updates = {field: data[field] for field in UserPriorities.PRIORITY_COLUMNS if field in data}
         
-        for field in priority_fields:
-            if field in data:
-                value = data[field]
-                if not isinstance(value, int) or not (1 <= value <= 10):
-                    return jsonify({'error': f'{field} must be an integer between 1 and 10'}), 400
+        for field, value in updates.items():
+            if not isinstance(value, int) or not (1 <= value <= 10):
+                return jsonify({'error': f'{field} must be an integer between 1 and 10'}), 400
         
         # Get or create priorities record
         priorities = UserPriorities.query.get(g.user)
@@ -2541,19 +3442,19 @@ def update_user_priorities():
             priorities = UserPriorities(user_id=g.user)
             db.session.add(priorities)
         
-        # Update priorities
-        for field in priority_fields:
-            if field in data:
-                setattr(priorities, field, data[field])
+        # Update priorities (setattr keeps SQLAlchemy change tracking)
+        for field, value in updates.items():
+            setattr(priorities, field, value)
         
         db.session.commit()
+        invalidate_priority_cache(g.user)
         
         # Return lake-compliant minimal response
         return jsonify({"status": "ok"})
     
     except Exception as e:
         db.session.rollback()
-        print(f"Update priorities error: {e}")
+        app.logger.exception("Update priorities error: %s", e)
         return jsonify({'error': 'Failed to update priorities'}), 500
 
 # ============================================================================
@@ -2567,7 +3468,7 @@ def get_resonance_config_endpoint():
         config = get_resonance_config()
         return jsonify(config)
     except Exception as e:
-        print(f"Get resonance config error: {e}")
+        app.logger.exception("Get resonance config error: %s", e)
         return jsonify({'error': 'Failed to get configuration'}), 500
 
 @app.route('/api/me/resonance', methods=['GET'])
@@ -2593,7 +3494,7 @@ def get_user_resonance_prefs():
         return jsonify(prefs.to_dict())
     
     except Exception as e:
-        print(f"Get resonance prefs error: {e}")
+        app.logger.exception("Get resonance prefs error: %s", e)
         return jsonify({'error': 'Failed to get preferences'}), 500
 
 @app.route('/api/me/resonance', methods=['PUT'])
@@ -2639,7 +3540,7 @@ def update_user_resonance_prefs():
     
     except Exception as e:
         db.session.rollback()
-        print(f"Update resonance prefs error: {e}")
+        app.logger.exception("Update resonance prefs error: %s", e)
         return jsonify({'error': 'Failed to update preferences'}), 500
 
 # ============================================================================
@@ -2659,12 +3560,16 @@ app.add_url_rule("/me/resonance", view_func=update_user_resonance_prefs, methods
 # COMPATIBILITY ENDPOINTS
 # ============================================================================
 
+COMPATIBILITY_BATCH_MAX_TARGETS = 100
+
 @app.route('/api/compatibility/calculate', methods=['POST'])
 @require_auth
 def calculate_compatibility():
-    """Calculate compatibility with another user"""
+    """Calculate compatibility with another user, or with many via target_user_ids in one pass"""
     try:
         data = request.get_json()
+        if data and data.get('target_user_ids'):
+            return calculate_compatibility_batch(data['target_user_ids'])
         if not data or not data.get('target_user_id'):
             return jsonify({'error': 'target_user_id required'}), 400
         
@@ -2687,8 +3592,53 @@ def calculate_compatibility():
         return jsonify({"status": "ok"})
     
     except Exception as e:
-        print(f"Calculate compatibility error: {e}")
+        app.logger.exception("Calculate compatibility error: %s", e)
+        return jsonify({'error': 'Failed to calculate compatibility'}), 500
+
+def calculate_compatibility_batch(target_user_ids):
+    """
+    Batch branch of calculate_compatibility: a match page's fan-out of targets costs one
+    existence query, one scoring pass and one bulk upsert instead of a round-trip per target
+    """
+    if not isinstance(target_user_ids, list) or not all(
+        isinstance(t, int) and not isinstance(t, bool) for t in target_user_ids  # JSON true is an int in Python
+    ):
+        return jsonify({'error': 'target_user_ids must be a list of user ids'}), 400
+    if len(target_user_ids) > COMPATIBILITY_BATCH_MAX_TARGETS:
+        return jsonify({'error': f'At most {COMPATIBILITY_BATCH_MAX_TARGETS} target_user_ids per request'}), 400
+    
+    existing_ids = set(db.session.execute(
+        select(User.id).where(User.id.in_(target_user_ids))
+    ).scalars())
+    missing_ids = [t for t in target_user_ids if t not in existing_ids]
+    if missing_ids:
+        return jsonify({'error': 'Target user not found', 'missing_user_ids': missing_ids}), 404
+    
+    if all(target_id == g.user for target_id in target_user_ids):
+        return jsonify({'error': 'target_user_ids must include a user other than yourself'}), 400
+    
+    results = calculate_mutual_compatibility_batch(g.user, target_user_ids)
+    if results is None:
+        return jsonify({'error': 'Failed to calculate compatibility'}), 500
+    if not results:
+        # Nothing scorable: either the caller or every target lacks a full set of priorities
+        if not _valid_priorities(get_priority_tuples([g.user]).get(g.user)):
+            return jsonify({'error': 'Set your priorities before calculating compatibility', 'code': 'PRIORITIES_REQUIRED'}), 400
+        return jsonify({'error': 'None of the target users have priorities set', 'code': 'TARGET_PRIORITIES_MISSING'}), 400
+    
+    calculated_at = datetime.utcnow()
+    rows = []
+    for target_id, compatibility in results.items():
+        row = _compatibility_row(g.user, target_id, compatibility, calculated_at)
+        # Bulk upsert needs every row to share the same keys
+        row.setdefault('hd_enhancement_factor', None)
+        row.setdefault('compatibility_insights', None)
+        rows.append(row)
+    
+    if store_compatibility_results(rows) is None:
         return jsonify({'error': 'Failed to calculate compatibility'}), 500
+    
+    return jsonify({"status": "ok", "calculated": len(rows)})
 
 @app.route('/api/matches', methods=['GET'])
 @require_auth
@@ -2700,14 +3650,26 @@ def get_matches():
         
         matches = get_user_matches(g.user, limit, min_score)
         
-        # Get user details for matches
+        # Get user details for matches: one IN query of plain rows, serialized once per user
+        # (no ORM instances, identity-map lookups or password_hash loads)
+        match_user_ids = [match['user_b_id'] for match in matches]
+        user_dicts = {}
+        if match_user_ids:
+            users_table = User.__table__
+            rows = db.session.execute(
+                select(*(users_table.c[key] for key in User.PUBLIC_COLUMNS)).where(
+                    users_table.c.id.in_(match_user_ids),
+                    users_table.c.status == 'approved'
+                )
+            ).mappings().all()
+            user_dicts = {row['id']: User.row_to_dict(row) for row in rows}
+        
         enriched_matches = []
         for match in matches:
-            user = User.query.get(match['user_b_id'])
-            if user and user.status == 'approved':
-                match_data = match.copy()
-                match_data['user'] = user.to_dict()
-                enriched_matches.append(match_data)
+            user_dict = user_dicts.get(match['user_b_id'])
+            if user_dict:
+                match['user'] = user_dict
+                enriched_matches.append(match)
         
         return jsonify({
             'matches': enriched_matches,
@@ -2715,7 +3677,7 @@ def get_matches():
         })
     
     except Exception as e:
-        print(f"Get matches error: {e}")
+        app.logger.exception("Get matches error: %s", e)
         return jsonify({'error': 'Failed to get matches'}), 500
 
 # ============================================================================
@@ -2734,9 +3696,32 @@ def get_birth_data():
         return jsonify({'birth_data': birth_data.to_dict()})
     
     except Exception as e:
-        print(f"Get birth data error: {e}")
+        app.logger.exception("Get birth data error: %s", e)
         return jsonify({'error': 'Failed to get birth data'}), 500
 
+def upsert_birth_data(user_id, validated_data):
+    """
+    Create or update a user's birth_data row from BirthDataValidator output in one
+    INSERT ... ON CONFLICT (user_id) DO UPDATE ... RETURNING round-trip. Only the given
+    fields are written on conflict. Does not commit - callers own the transaction.
+    """
+    # Date/Time columns take date/time objects; the validator hands back the checked strings
+    values = dict(validated_data)
+    if values.get('birth_date'):
+        values['birth_date'] = date.fromisoformat(values['birth_date'])
+    if values.get('birth_time'):
+        values['birth_time'] = time.fromisoformat(values['birth_time'])
+    
+    if not values:
+        return db.session.get(BirthData, user_id) or BirthData(user_id=user_id)
+    
+    stmt = _dialect_insert()(BirthData).values(user_id=user_id, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_id'],
+        set_={field: stmt.excluded[field] for field in values}
+    ).returning(BirthData)
+    return db.session.scalars(stmt, execution_options={'populate_existing': True}).one()
+
 @app.route('/api/birth-data', methods=['POST'])
 @require_auth
 @csrf_protect(session_store, validate_auth_session)
@@ -2770,15 +3755,8 @@ def save_birth_data():
                 'details': e.details
             }), 400
         
-        # Get or create birth data record
-        birth_data = BirthData.query.get(g.user)
-        if not birth_data:
-            birth_data = BirthData(user_id=g.user)
-            db.session.add(birth_data)
-        
-        # Update only provided fields
-        for field, value in validated_data.items():
-            setattr(birth_data, field, value)
+        # Create or update the record, touching only the provided fields
+        birth_data = upsert_birth_data(g.user, validated_data)
         
         # Log successful save
         app.logger.info("save_attempt", extra={
@@ -2796,7 +3774,7 @@ def save_birth_data():
     
     except Exception as e:
         db.session.rollback()
-        app.logger.error(f"Unexpected error in save_birth_data: {e}")
+        app.logger.exception("Unexpected error in save_birth_data: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/human-design/calculate', methods=['POST'])
@@ -2841,11 +3819,11 @@ def calculate_human_design():
             })
             
         except Exception as hd_error:
-            print(f"HD intelligence engine error: {hd_error}")
+            app.logger.exception("HD intelligence engine error: %s", hd_error)
             return jsonify({'error': 'HD calculation service unavailable'}), 503
     
     except Exception as e:
-        print(f"Calculate Human Design error: {e}")
+        app.logger.exception("Calculate Human Design error: %s", e)
         return jsonify({'error': 'Failed to calculate Human Design chart'}), 500
 
 @app.route('/api/human-design/generate-bodygraph', methods=['POST'])
@@ -2882,10 +3860,10 @@ def generate_bodygraph():
         hd_data.strategy = api_response.get('strategy')
         hd_data.authority = api_response.get('authority')
         hd_data.profile = api_response.get('profile')
-        hd_data.centers = json.dumps(api_response.get('centers', {}))
-        hd_data.gates = json.dumps(api_response.get('gates', {}))
-        hd_data.channels = json.dumps(api_response.get('channels', {}))
-        hd_data.full_chart_data = json.dumps(api_response)
+        hd_data.centers = orjson.dumps(api_response.get('centers', {})).decode()
+        hd_data.gates = orjson.dumps(api_response.get('gates', {})).decode()
+        hd_data.channels = orjson.dumps(api_response.get('channels', {})).decode()
+        hd_data.full_chart_data = orjson.dumps(api_response).decode()
         hd_data.calculated_at = datetime.utcnow()
         
         db.session.commit()
@@ -2898,7 +3876,7 @@ def generate_bodygraph():
     
     except Exception as e:
         db.session.rollback()
-        print(f"Generate bodygraph error: {e}")
+        app.logger.exception("Generate bodygraph error: %s", e)
         return jsonify({'error': 'Failed to generate Human Design bodygraph'}), 500
 
 @app.route('/api/human-design', methods=['GET'])
@@ -2906,14 +3884,14 @@ def generate_bodygraph():
 def get_human_design():
     """Get user's Human Design data"""
     try:
-        hd_data = HumanDesignData.query.get(g.user)
+        hd_data = HumanDesignData.query.options(undefer_group('hd_detail')).get(g.user)
         if not hd_data:
             return jsonify({'human_design': None})
         
         return jsonify({'human_design': hd_data.to_dict()})
     
     except Exception as e:
-        print(f"Get Human Design error: {e}")
+        app.logger.exception("Get Human Design error: %s", e)
         return jsonify({'error': 'Failed to get Human Design data'}), 500
 
 # ============================================================================
@@ -3014,37 +3992,100 @@ def preferences_writer():
         
     except Exception as e:
         db.session.rollback()
-        app.logger.error(f"Preferences writer error: {e}")
+        app.logger.exception("Preferences writer error: %s", e)
         resp = jsonify({"error": "internal_error"})
         if correlation_id:
             resp.headers['X-Correlation-Id'] = correlation_id
         return resp, 500
 
+# /api/profile response bodies cached in Redis per user. Any committed ORM change to a User or
+# UserProfile row drops that user's entry, so every writer invalidates without opting in.
+# Bump PROFILE_CACHE_VERSION when the response shape changes.
+PROFILE_CACHE_VERSION = 1
+PROFILE_CACHE_TTL_SECONDS = 300
+
+def _profile_cache_key(user_id):
+    return f"glow:profile:{user_id}:v{PROFILE_CACHE_VERSION}"
+
+def invalidate_profile_cache(user_ids):
+    """Drop cached /api/profile responses for the given users"""
+    if cache_redis is None or not user_ids:
+        return
+    try:
+        cache_redis.delete(*(_profile_cache_key(user_id) for user_id in user_ids))
+    except redis.RedisError as e:
+        app.logger.warning("Profile cache invalidation failed: %s", e)
+
+def _profile_response(body):
+    """
+    /api/profile response with a content-hash ETag; answers If-None-Match with a bodiless 304
+    (on a Redis hit that means no DB work at all)
+    """
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(hashlib.sha1(body).hexdigest())
+    return response.make_conditional(request)
+
+@event.listens_for(SASession, 'after_flush')
+def _collect_profile_changes(session, flush_context):
+    changed = session.info.setdefault('profile_cache_user_ids', set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, User):
+            changed.add(obj.id)
+        elif isinstance(obj, UserProfile):
+            changed.add(obj.user_id)
+
+@event.listens_for(SASession, 'after_commit')
+def _invalidate_committed_profiles(session):
+    invalidate_profile_cache(session.info.pop('profile_cache_user_ids', None))
+
+@event.listens_for(SASession, 'after_rollback')
+def _discard_profile_changes(session):
+    session.info.pop('profile_cache_user_ids', None)
+
+def touch_user_updated_at(user_id):
+    """Bump users.updated_at with a bare UPDATE (no User load); the profile cache entry drops on commit"""
+    db.session.execute(
+        User.__table__.update().where(User.id == user_id).values(updated_at=datetime.utcnow())
+    )
+    # Core statements bypass the flush hook above, so record the id for after_commit directly
+    db.session.info.setdefault('profile_cache_user_ids', set()).add(user_id)
+
 @app.route('/api/profile', methods=['GET'])
 @require_auth
+@private_cache
 def get_profile():
-    """Get user profile with separated auth and profile data"""
+    """Get user profile with separated auth and profile data (cached in Redis for 5 minutes)"""
     try:
-        user = User.query.get(g.user)
+        cache_key = _profile_cache_key(g.user)
+        if cache_redis is not None:
+            try:
+                cached = cache_redis.get(cache_key)
+                if cached:
+                    # Stored body is already serialized JSON; skip jsonify entirely
+                    return _profile_response(cached)
+            except redis.RedisError as e:
+                app.logger.warning("Profile cache read failed: %s", e)
+        
+        # Only the public columns; password_hash is never read and no User instance is built
+        users_table = User.__table__
+        user = db.session.execute(
+            select(*(users_table.c[key] for key in User.PUBLIC_COLUMNS))
+            .where(users_table.c.id == g.user)
+        ).mappings().one_or_none()
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
         # Get or create profile
-        profile = UserProfile.query.filter_by(user_id=user.id).first()
+        profile = UserProfile.query.filter_by(user_id=g.user).first()
         if not profile:
             # Create empty profile for user
-            profile = UserProfile(user_id=user.id)
+            profile = UserProfile(user_id=g.user)
             db.session.add(profile)
             db.session.commit()
         
         # Combine user and profile data
         profile_data = {
-            'id': user.id,
-            'email': user.email,
-            'status': user.status,
-            'is_admin': user.is_admin,
-            'created_at': user.created_at.isoformat() if user.created_at else None,
-            'updated_at': user.updated_at.isoformat() if user.updated_at else None,
+            **User.row_to_dict(user),
             # Profile data
             'first_name': profile.first_name,
             'last_name': profile.last_name,
@@ -3052,10 +4093,17 @@ def get_profile():
             'profile_completion': profile.profile_completion
         }
         
-        return jsonify(profile_data)
+        body = jsonify(profile_data).get_data()
+        if cache_redis is not None:
+            try:
+                cache_redis.setex(cache_key, PROFILE_CACHE_TTL_SECONDS, body)
+            except redis.RedisError as e:
+                app.logger.warning("Profile cache write failed: %s", e)
+        
+        return _profile_response(body)
     
     except Exception as e:
-        print(f"Get profile error: {e}")
+        app.logger.exception("Get profile error: %s", e)
         return jsonify({'error': 'Failed to get profile'}), 500
 
 @app.route('/api/profile', methods=['PUT'])
@@ -3064,7 +4112,7 @@ def update_profile():
     """Update user profile with separated auth and profile data"""
     try:
         data = request.get_json()
-        user = User.query.get(g.user)
+        user = current_user()
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -3117,7 +4165,7 @@ def update_profile():
     
     except Exception as e:
         db.session.rollback()
-        print(f"Update profile error: {e}")
+        app.logger.exception("Update profile error: %s", e)
         return jsonify({'error': 'Failed to update profile', 'success': False}), 500
 
 @app.route('/api/profile/birth-data', methods=['GET'])
@@ -3147,7 +4195,7 @@ def get_profile_birth_data():
         return response
     
     except Exception as e:
-        print(f"Get profile birth data error: {e}")
+        app.logger.exception("Get profile birth data error: %s", e)
         response = jsonify({'ok': False, 'error': 'Failed to get birth data'})
         response.headers['Content-Type'] = 'application/json'
         response.headers['Cache-Control'] = 'no-store'
@@ -3190,11 +4238,11 @@ def put_profile_birth_data():
         
         # Convert validated strings to database types
         if 'birth_date' in validated_data and validated_data['birth_date'] is not None:
-            birth_date = datetime.strptime(validated_data['birth_date'], '%Y-%m-%d').date()
+            birth_date = date.fromisoformat(validated_data['birth_date'])
         
         if 'birth_time' in validated_data and validated_data['birth_time'] is not None:
             # Convert HH:mm to time object with seconds=00 (enforced by A4 constraint)
-            birth_time = datetime.strptime(validated_data['birth_time'] + ':00', '%H:%M:%S').time()
+            birth_time = time.fromisoformat(validated_data['birth_time'])
         
         # Upsert birth data (partial updates supported)
         birth_data = BirthData.query.get(g.user)
@@ -3217,9 +4265,7 @@ def put_profile_birth_data():
             birth_data.longitude = longitude
         
         # Update user's updated_at timestamp
-        user = User.query.get(g.user)
-        if user:
-            user.updated_at = datetime.utcnow()
+        touch_user_updated_at(g.user)
         
         db.session.commit()
         
@@ -3245,7 +4291,7 @@ def put_profile_birth_data():
         return response
         
     except Exception as e:
-        print(f"Put profile birth data error: {e}")
+        app.logger.exception("Put profile birth data error: %s", e)
         db.session.rollback()
         return jsonify({'error': 'server_error', 'message': 'Failed to update birth data'}), 500
 
@@ -3276,7 +4322,7 @@ def get_profile_basic():
         return response
     
     except Exception as e:
-        print(f"Get profile basic error: {e}")
+        app.logger.exception("Get profile basic error: %s", e)
         response = jsonify({'ok': False, 'error': 'Failed to get basic profile'})
         response.headers['Content-Type'] = 'application/json'
         response.headers['Cache-Control'] = 'no-store'
@@ -3289,7 +4335,7 @@ def put_profile_basic():
     """Update user's basic profile information"""
     try:
         # BE-DECOR-ORDER-06: Diagnostic logging
-        print(f"save.profile.put.start user_id={g.user} has_csrf_header={bool(request.headers.get('X-CSRF-Token'))} has_session_cookie={bool(request.cookies.get('glow_session'))}")
+        app.logger.info("save.profile.put.start user_id=%s has_csrf_header=%s has_session_cookie=%s", g.user, bool(request.headers.get('X-CSRF-Token')), bool(request.cookies.get('glow_session')))
         
         # Ensure JSON request
         if not request.is_json:
@@ -3356,9 +4402,7 @@ def put_profile_basic():
         profile.updated_at = datetime.utcnow()
         
         # Update user's updated_at timestamp
-        user = User.query.get(g.user)
-        if user:
-            user.updated_at = datetime.utcnow()
+        touch_user_updated_at(g.user)
         
         db.session.commit()
         
@@ -3385,7 +4429,7 @@ def put_profile_basic():
         return response
         
     except Exception as e:
-        print(f"Put profile basic error: {e}")
+        app.logger.exception("Put profile basic error: %s", e)
         db.session.rollback()
         return jsonify({'ok': False, 'error': 'Failed to update basic profile'}), 500
 
@@ -3440,7 +4484,7 @@ def put_profile_basic_info():
         if bio is not None:
             fields_updated.append('bio')
         
-        app.logger.info(f"basic_info_update stage=validate fields={fields_updated}")
+        app.logger.info("basic_info_update stage=validate fields=%s", fields_updated)
         
         # Get or create user profile
         profile = UserProfile.query.filter_by(user_id=g.user).first()
@@ -3459,23 +4503,21 @@ def put_profile_basic_info():
         profile.updated_at = datetime.utcnow()
         
         # Update user's updated_at timestamp
-        user = User.query.get(g.user)
-        if user:
-            user.updated_at = datetime.utcnow()
+        touch_user_updated_at(g.user)
         
         db.session.commit()
         
-        app.logger.info(f"basic_info_update stage=save fields={fields_updated}")
+        app.logger.info("basic_info_update stage=save fields=%s", fields_updated)
         
         # SW-G2: Return minimal success response - no resource body to prevent stale data injection
-        app.logger.info(f"basic_info_update stage=success writer_minimal=true user_id={g.user}")
+        app.logger.info("basic_info_update stage=success writer_minimal=true user_id=%s", g.user)
         response = make_response('', 204)  # 204 No Content
         response.headers['Cache-Control'] = 'no-store'
         
         return response
         
     except Exception as e:
-        app.logger.error(f"Put profile basic-info error: {e}")
+        app.logger.exception("Put profile basic-info error: %s", e)
         db.session.rollback()
         return jsonify({'error': 'server_error', 'message': 'Failed to update basic info'}), 500
 
@@ -3485,7 +4527,7 @@ def get_profile_human_design():
     """Get user's human design data for profile management"""
     try:
         # Try to get from the new comprehensive HD table first
-        hd_data = HumanDesignData.query.filter_by(user_id=g.user).first()
+        hd_data = HumanDesignData.query.options(undefer_group('hd_detail')).filter_by(user_id=g.user).first()
         if hd_data:
             return jsonify(hd_data.to_dict())
         
@@ -3506,7 +4548,7 @@ def get_profile_human_design():
         return jsonify({'human_design_data': None})
     
     except Exception as e:
-        print(f"Get profile human design error: {e}")
+        app.logger.exception("Get profile human design error: %s", e)
         return jsonify({'error': 'Failed to get human design data'}), 500
 
 @app.route('/api/profile/update-birth-data', methods=['POST'])
@@ -3540,15 +4582,8 @@ def update_birth_data():
                 'details': e.details
             }), 400
         
-        # Get or create birth data record
-        birth_data = BirthData.query.get(g.user)
-        if not birth_data:
-            birth_data = BirthData(user_id=g.user)
-            db.session.add(birth_data)
-        
-        # Update only provided fields
-        for field, value in validated_data.items():
-            setattr(birth_data, field, value)
+        # Create or update the record, touching only the provided fields
+        birth_data = upsert_birth_data(g.user, validated_data)
         
         # Log successful save
         app.logger.info("save_attempt", extra={
@@ -3569,7 +4604,7 @@ def update_birth_data():
     
     except Exception as e:
         db.session.rollback()
-        app.logger.error(f"Unexpected error in update_birth_data: {e}")
+        app.logger.exception("Unexpected error in update_birth_data: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 # ============================================================================
@@ -3586,32 +4621,47 @@ def admin_search_users():
         if not query:
             return jsonify({'users': []})
         
-        # Search by email, name, or user ID
-        users = User.query.filter(
-            db.or_(
-                User.email.ilike(f'%{query}%'),
-                User.name.ilike(f'%{query}%'),
-                User.id == query if query.isdigit() else False
+        # Search by email, name (names live on the profile), or user ID
+        pattern = f'%{query}%'
+        criteria = [
+            User.email.ilike(pattern),
+            UserProfile.display_name.ilike(pattern),
+            UserProfile.first_name.ilike(pattern),
+            UserProfile.last_name.ilike(pattern)
+        ]
+        if query.isdigit():
+            criteria.append(User.id == int(query))
+        
+        # One query for the whole list; only the narrow HD columns are read, never the wide
+        # TEXT-heavy human_design_data row per user
+        rows = db.session.execute(
+            select(
+                User.id, User.email, User.created_at,
+                UserProfile.display_name, UserProfile.first_name, UserProfile.last_name,
+                HumanDesignData.user_id.label('hd_user_id'), HumanDesignData.calculated_at
             )
-        ).limit(20).all()
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .outerjoin(HumanDesignData, HumanDesignData.user_id == User.id)
+            .where(or_(*criteria))
+            .limit(20)
+        ).mappings().all()
         
         user_list = []
-        for user in users:
-            # Check if user has HD data
-            hd_data = HumanDesignData.query.get(user.id)
+        for row in rows:
+            full_name = ' '.join(part for part in (row['first_name'], row['last_name']) if part)
             user_list.append({
-                'id': user.id,
-                'email': user.email,
-                'name': user.name,
-                'created_at': user.created_at.isoformat() if user.created_at else None,
-                'has_hd_data': hd_data is not None,
-                'hd_calculated_at': hd_data.calculated_at.isoformat() if hd_data and hd_data.calculated_at else None
+                'id': row['id'],
+                'email': row['email'],
+                'name': row['display_name'] or full_name or None,
+                'created_at': row['created_at'].isoformat() if row['created_at'] else None,
+                'has_hd_data': row['hd_user_id'] is not None,
+                'hd_calculated_at': row['calculated_at'].isoformat() if row['calculated_at'] else None
             })
         
         return jsonify({'users': user_list})
     
     except Exception as e:
-        print(f"Admin search users error: {e}")
+        app.logger.exception("Admin search users error: %s", e)
         return jsonify({'error': 'Failed to search users'}), 500
 
 @app.route('/api/admin/users/<int:user_id>/human-design', methods=['GET'])
@@ -3626,7 +4676,7 @@ def admin_get_user_hd_data(user_id):
             return jsonify({'error': 'User not found'}), 404
         
         # Get HD data
-        hd_data = HumanDesignData.query.get(user_id)
+        hd_data = HumanDesignData.query.options(undefer_group('hd_detail')).get(user_id)
         if not hd_data:
             return jsonify({'error': 'No Human Design data found for this user'}), 404
         
@@ -3642,11 +4692,11 @@ def admin_get_user_hd_data(user_id):
             },
             'birth_data': birth_data.to_dict() if birth_data else None,
             'human_design': hd_data.to_dict(),
-            'raw_api_response': hd_data.get_api_response()
+            'raw_api_response': hd_data.api_response or {}
         })
     
     except Exception as e:
-        print(f"Admin get HD data error: {e}")
+        app.logger.exception("Admin get HD data error: %s", e)
         return jsonify({'error': 'Failed to get Human Design data'}), 500
 
 @app.route('/api/admin/human-design/stats', methods=['GET'])
@@ -3687,37 +4737,70 @@ def admin_hd_stats():
         })
     
     except Exception as e:
-        print(f"Admin HD stats error: {e}")
+        app.logger.exception("Admin HD stats error: %s", e)
         return jsonify({'error': 'Failed to get HD statistics'}), 500
 
 @app.route('/api/admin/users', methods=['GET'])
 @require_admin
 def admin_get_users():
-    """Get all users for admin console"""
+    """
+    Get all users for admin console
+    Keyset-paginated via ?cursor= (next_cursor in the response); ?page= keeps the legacy
+    OFFSET pagination, with has_next and Redis-cached (approximate) totals.
+    """
     try:
-        page = request.args.get('page', 1, type=int)
+        page = request.args.get('page', type=int)
         per_page = request.args.get('per_page', 50, type=int)
         status_filter = request.args.get('status')
         
-        query = User.query
+        # to_dict touches no relationships, so the only per-row waste is columns it never reads
+        query = User.query.options(load_only(*(getattr(User, key) for key in User.PUBLIC_COLUMNS)))
         
         if status_filter:
             query = query.filter(User.status == status_filter)
         
-        users = query.order_by(User.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        if page is None:
+            per_page = max(1, min(per_page, KEYSET_MAX_PER_PAGE))
+            try:
+                if db.engine.dialect.name == 'postgresql':
+                    users_table = User.__table__
+                    items, next_cursor = json_keyset_page(
+                        [users_table.c[key] for key in User.PUBLIC_COLUMNS],
+                        users_table.c.created_at, users_table.c.id,
+                        request.args.get('cursor'), per_page,
+                        *([users_table.c.status == status_filter] if status_filter else [])
+                    )
+                    return json_page_response('users', items, next_cursor, per_page)
+                
+                users, next_cursor = keyset_page(
+                    query, User.created_at, User.id, request.args.get('cursor'), per_page
+                )
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            
+            return jsonify({
+                'users': [user.to_dict() for user in users],
+                'next_cursor': next_cursor,
+                'has_next': next_cursor is not None,
+                'per_page': per_page
+            })
+        
+        page = max(1, page)
+        per_page = max(1, per_page)
+        users, has_next = offset_page(query.order_by(User.created_at.desc()), page, per_page)
+        total = cached_row_count(f"glow:admin:users:count:{status_filter or 'all'}:v1", query)
         
         return jsonify({
-            'users': [user.to_dict() for user in users.items],
-            'total': users.total,
-            'pages': users.pages,
+            'users': [user.to_dict() for user in users],
+            'total': total,
+            'pages': -(-total // per_page),
+            'has_next': has_next,
             'current_page': page,
             'per_page': per_page
         })
     
     except Exception as e:
-        print(f"Admin get users error: {e}")
+        app.logger.exception("Admin get users error: %s", e)
         return jsonify({'error': 'Failed to get users'}), 500
 
 @app.route('/api/admin/users/<int:user_id>/status', methods=['PUT'])
@@ -3733,15 +4816,38 @@ def admin_update_user_status(user_id):
         if new_status not in ['pending', 'approved', 'suspended']:
             return jsonify({'error': 'Invalid status'}), 400
         
-        user = User.query.get(user_id)
-        if not user:
+        # UPDATE ... RETURNING applies the change and returns the serialized columns without
+        # ORM hydration; on Postgres the prior status comes from a locked FROM subquery, so
+        # the whole change is one round-trip
+        users_table = User.__table__
+        update_stmt = users_table.update().values(status=new_status, updated_at=datetime.utcnow())
+        if db.engine.dialect.name == 'postgresql':
+            previous = select(users_table.c.id, users_table.c.status).where(
+                users_table.c.id == user_id
+            ).with_for_update().subquery('previous')
+            update_stmt = update_stmt.where(users_table.c.id == previous.c.id)
+            old_status_column = previous.c.status
+        else:
+            # SQLite flattens a FROM subquery into the updated row, so read the prior status first
+            old_status = db.session.execute(
+                select(users_table.c.status).where(users_table.c.id == user_id)
+            ).scalar()
+            update_stmt = update_stmt.where(users_table.c.id == user_id)
+            old_status_column = db.literal(old_status)
+        
+        row = db.session.execute(
+            update_stmt.returning(
+                *(users_table.c[key] for key in User.PUBLIC_COLUMNS),
+                old_status_column.label('old_status')
+            )
+        ).mappings().first()
+        if not row:
+            db.session.rollback()
             return jsonify({'error': 'User not found'}), 404
         
-        old_status = user.status
-        user.status = new_status
-        user.updated_at = datetime.utcnow()
-        
+        old_status = row['old_status']
         db.session.commit()
+        invalidate_admin_stats_cache(profile_user_ids=[user_id])
         
         # Log admin action
         log_admin_action(
@@ -3753,14 +4859,51 @@ def admin_update_user_status(user_id):
         
         return jsonify({
             'message': 'User status updated successfully',
-            'user': user.to_dict()
+            'user': User.row_to_dict(row)
         })
     
     except Exception as e:
         db.session.rollback()
-        print(f"Admin update user status error: {e}")
+        app.logger.exception("Admin update user status error: %s", e)
         return jsonify({'error': 'Failed to update user status'}), 500
 
+# Postgres data-modifying CTE: one round-trip instead of one DELETE per related table.
+# compatibility_matrix is cleared by two single-column DELETEs (PK prefix and ix_compat_user_b
+# range scans) rather than an OR that plans as a BitmapOr or seq scan; the <> keeps the
+# self-pair from being targeted twice. Audit log rows outlive the user, so their references
+# are nulled instead (including the user_deletion row written just before this runs) in a
+# single UPDATE, since two sub-statements must not modify the same row.
+USER_DELETE_CTE = text("""
+    WITH deleted_priorities AS (
+        DELETE FROM user_priorities WHERE user_id = :user_id
+    ), deleted_compatibility_a AS (
+        DELETE FROM compatibility_matrix WHERE user_a_id = :user_id
+    ), deleted_compatibility_b AS (
+        DELETE FROM compatibility_matrix WHERE user_b_id = :user_id AND user_a_id <> :user_id
+    ), deleted_birth_data AS (
+        DELETE FROM birth_data WHERE user_id = :user_id
+    ), deleted_human_design AS (
+        DELETE FROM human_design_data WHERE user_id = :user_id
+    ), deleted_sessions AS (
+        DELETE FROM user_sessions WHERE user_id = :user_id
+    ), deleted_profile AS (
+        DELETE FROM user_profiles WHERE user_id = :user_id
+    ), deleted_preferences AS (
+        DELETE FROM user_preferences WHERE user_id = :user_id
+    ), deleted_resonance_prefs AS (
+        DELETE FROM user_resonance_prefs WHERE user_id = :user_id
+    ), deleted_resonance_signals AS (
+        DELETE FROM user_resonance_signals_private WHERE user_id = :user_id
+    ), deleted_notifications AS (
+        DELETE FROM email_notifications WHERE user_id = :user_id
+    ), detached_log AS (
+        UPDATE admin_action_log
+        SET admin_user_id = NULLIF(admin_user_id, :user_id), target_user_id = NULLIF(target_user_id, :user_id)
+        WHERE admin_user_id = :user_id OR target_user_id = :user_id
+    )
+    DELETE FROM users WHERE id = :user_id
+""")
+
 @app.route('/api/admin/users/<int:user_id>', methods=['DELETE'])
 @require_admin
 def admin_delete_user(user_id):
@@ -3778,58 +4921,130 @@ def admin_delete_user(user_id):
             details=f'Deleted user {user.email}'
         )
         
-        # Delete related records (cascade should handle this, but being explicit)
-        UserPriorities.query.filter_by(user_id=user_id).delete()
-        CompatibilityMatrix.query.filter(
-            (CompatibilityMatrix.user_a_id == user_id) |
-            (CompatibilityMatrix.user_b_id == user_id)
-        ).delete()
-        BirthData.query.filter_by(user_id=user_id).delete()
-        HumanDesignData.query.filter_by(user_id=user_id).delete()
-        UserSession.query.filter_by(user_id=user_id).delete()
-        
-        # Delete user
-        db.session.delete(user)
+        if db.engine.dialect.name == 'postgresql':
+            # Related records and the user in one statement (FK checks run at statement end)
+            db.session.execute(USER_DELETE_CTE, {'user_id': user_id})
+            db.session.expunge(user)
+        else:
+            # Delete related records (cascade should handle this, but being explicit)
+            UserPriorities.query.filter_by(user_id=user_id).delete()
+            # One index range per side (PK prefix, ix_compat_user_b) instead of an OR scan
+            CompatibilityMatrix.query.filter_by(user_a_id=user_id).delete()
+            CompatibilityMatrix.query.filter_by(user_b_id=user_id).delete()
+            BirthData.query.filter_by(user_id=user_id).delete()
+            HumanDesignData.query.filter_by(user_id=user_id).delete()
+            UserSession.query.filter_by(user_id=user_id).delete()
+            UserProfile.query.filter_by(user_id=user_id).delete()
+            UserPreferences.query.filter_by(user_id=user_id).delete()
+            UserResonancePrefs.query.filter_by(user_id=user_id).delete()
+            UserResonanceSignalsPrivate.query.filter_by(user_id=user_id).delete()
+            EmailNotification.query.filter_by(user_id=user_id).delete()
+            AdminActionLog.query.filter_by(target_user_id=user_id).update({'target_user_id': None})
+            AdminActionLog.query.filter_by(admin_user_id=user_id).update({'admin_user_id': None})
+            
+            # Delete user
+            db.session.delete(user)
         db.session.commit()
+        invalidate_priority_cache(user_id)
+        invalidate_admin_stats_cache(profile_user_ids=[user_id])
         
         return jsonify({'message': 'User deleted successfully'})
     
     except Exception as e:
         db.session.rollback()
-        print(f"Admin delete user error: {e}")
+        app.logger.exception("Admin delete user error: %s", e)
         return jsonify({'error': 'Failed to delete user'}), 500
 
+# Dashboard counts move slowly; serve them from Redis for a short TTL and drop the entry
+# when users are added, re-statused or deleted so those changes show up immediately.
+ADMIN_STATS_CACHE_KEY = 'glow:admin:stats:v1'
+ADMIN_STATS_CACHE_TTL_SECONDS = 60
+
+def invalidate_admin_stats_cache(profile_user_ids=()):
+    """
+    Drop cached admin stats after a change to user counts, plus the /api/profile entries of
+    profile_user_ids in the same DEL (one round-trip for admin writes that touch both)
+    """
+    if cache_redis is not None:
+        try:
+            cache_redis.delete(
+                ADMIN_STATS_CACHE_KEY, *(_profile_cache_key(user_id) for user_id in profile_user_ids)
+            )
+        except redis.RedisError as e:
+            app.logger.warning("Admin stats cache invalidation failed: %s", e)
+
 @app.route('/api/admin/stats', methods=['GET'])
 @require_admin
 def admin_get_stats():
-    """Get system statistics for admin dashboard"""
+    """Get system statistics for admin dashboard (cached in Redis for 60 seconds)"""
     try:
+        if cache_redis is not None:
+            try:
+                cached = cache_redis.get(ADMIN_STATS_CACHE_KEY)
+                if cached:
+                    return jsonify({'stats': orjson.loads(cached)})
+            except redis.RedisError as e:
+                app.logger.warning("Admin stats cache read failed: %s", e)
+        
+        # One round-trip: per-table aggregates (FILTER buckets share a single scan) cross-joined into one row
+        users_agg = select(
+            db.func.count().label('total'),
+            db.func.count().filter(User.status == 'pending').label('pending'),
+            db.func.count().filter(User.status == 'approved').label('approved'),
+            db.func.count().filter(User.status == 'suspended').label('suspended')
+        ).select_from(User).subquery()
+        emails_agg = select(
+            db.func.count().label('total_sent'),
+            db.func.count().filter(EmailNotification.email_type == 'welcome').label('welcome_emails'),
+            db.func.count().filter(EmailNotification.email_type == 'match_notification').label('match_notifications')
+        ).select_from(EmailNotification).subquery()
+        
+        def table_count(model):
+            return select(db.func.count()).select_from(model).scalar_subquery()
+        
+        counts = db.session.execute(
+            select(
+                users_agg,
+                emails_agg,
+                table_count(CompatibilityMatrix).label('calculations'),
+                table_count(UserPriorities).label('users_with_priorities'),
+                table_count(BirthData).label('users_with_birth_data'),
+                table_count(HumanDesignData).label('calculated_charts')
+            ).select_from(users_agg.join(emails_agg, db.true()))
+        ).mappings().one()
+        
         stats = {
             'users': {
-                'total': User.query.count(),
-                'pending': User.query.filter_by(status='pending').count(),
-                'approved': User.query.filter_by(status='approved').count(),
-                'suspended': User.query.filter_by(status='suspended').count()
+                'total': counts['total'],
+                'pending': counts['pending'],
+                'approved': counts['approved'],
+                'suspended': counts['suspended']
             },
             'compatibility': {
-                'calculations': CompatibilityMatrix.query.count(),
-                'users_with_priorities': UserPriorities.query.count()
+                'calculations': counts['calculations'],
+                'users_with_priorities': counts['users_with_priorities']
             },
             'human_design': {
-                'users_with_birth_data': BirthData.query.count(),
-                'calculated_charts': HumanDesignData.query.count()
+                'users_with_birth_data': counts['users_with_birth_data'],
+                'calculated_charts': counts['calculated_charts']
             },
             'emails': {
-                'total_sent': EmailNotification.query.count(),
-                'welcome_emails': EmailNotification.query.filter_by(email_type='welcome').count(),
-                'match_notifications': EmailNotification.query.filter_by(email_type='match_notification').count()
+                'total_sent': counts['total_sent'],
+                'welcome_emails': counts['welcome_emails'],
+                'match_notifications': counts['match_notifications']
             }
         }
         
+        if cache_redis is not None:
+            try:
+                cache_redis.setex(ADMIN_STATS_CACHE_KEY, ADMIN_STATS_CACHE_TTL_SECONDS, orjson.dumps(stats))
+            except redis.RedisError as e:
+                app.logger.warning("Admin stats cache write failed: %s", e)
+        
         return jsonify({'stats': stats})
     
     except Exception as e:
-        print(f"Admin get stats error: {e}")
+        app.logger.exception("Admin get stats error: %s", e)
         return jsonify({'error': 'Failed to get statistics'}), 500
 
 @app.route('/api/admin/compatibility/recalculate', methods=['POST'])
@@ -3849,31 +5064,60 @@ def admin_recalculate_compatibility():
         return jsonify(result)
     
     except Exception as e:
-        print(f"Admin recalculate compatibility error: {e}")
+        app.logger.exception("Admin recalculate compatibility error: %s", e)
         return jsonify({'error': 'Failed to recalculate compatibility'}), 500
 
 @app.route('/api/admin/logs', methods=['GET'])
 @require_admin
 def admin_get_logs():
-    """Get admin action logs"""
+    """Get admin action logs (keyset-paginated via ?cursor=, legacy OFFSET pagination via ?page=)"""
     try:
-        page = request.args.get('page', 1, type=int)
+        page = request.args.get('page', type=int)
         per_page = request.args.get('per_page', 50, type=int)
         
-        logs = AdminActionLog.query.order_by(AdminActionLog.timestamp.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        # Column query: plain rows, no AdminActionLog instances for a read-only list
+        logs_table = AdminActionLog.__table__
+        log_rows = db.session.query(*logs_table.c)
+        
+        if page is None:
+            per_page = max(1, min(per_page, KEYSET_MAX_PER_PAGE))
+            try:
+                if db.engine.dialect.name == 'postgresql':
+                    items, next_cursor = json_keyset_page(
+                        list(logs_table.c), logs_table.c.timestamp, logs_table.c.id,
+                        request.args.get('cursor'), per_page
+                    )
+                    return json_page_response('logs', items, next_cursor, per_page)
+                
+                logs, next_cursor = keyset_page(
+                    log_rows, logs_table.c.timestamp, logs_table.c.id, request.args.get('cursor'), per_page
+                )
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            
+            return jsonify({
+                'logs': [AdminActionLog.row_to_dict(log._mapping) for log in logs],
+                'next_cursor': next_cursor,
+                'has_next': next_cursor is not None,
+                'per_page': per_page
+            })
+        
+        page = max(1, page)
+        per_page = max(1, per_page)
+        logs, has_next = offset_page(log_rows.order_by(logs_table.c.timestamp.desc()), page, per_page)
+        total = cached_row_count('glow:admin:logs:count:v1', log_rows)
         
         return jsonify({
-            'logs': [log.to_dict() for log in logs.items],
-            'total': logs.total,
-            'pages': logs.pages,
+            'logs': [AdminActionLog.row_to_dict(log._mapping) for log in logs],
+            'total': total,
+            'pages': -(-total // per_page),
+            'has_next': has_next,
             'current_page': page,
             'per_page': per_page
         })
     
     except Exception as e:
-        print(f"Admin get logs error: {e}")
+        app.logger.exception("Admin get logs error: %s", e)
         return jsonify({'error': 'Failed to get logs'}), 500
 
 # ============================================================================
@@ -3897,16 +5141,112 @@ def internal_error(error):
 # APPLICATION INITIALIZATION
 # ============================================================================
 
-# Initialize database on first request
-with app.app_context():
-    ensure_database()
-    
-    # Run enhanced location data migration
+def bootstrap_database():
+    """Create tables and run the startup migrations"""
+    with app.app_context():
+        ensure_database()
+        
+        # Run enhanced location data migration
+        try:
+            from migrate_on_startup import run_startup_migration
+            run_startup_migration()
+        except Exception as e:
+            app.logger.warning("Startup migration warning: %s", e)
+        
+        # HD_JSON reads decode these columns as JSON(B); a TEXT column on an unmigrated
+        # Postgres database would hand back raw strings, so convert before serving
+        try:
+            from convert_hd_json_columns_to_jsonb import convert_hd_json_columns
+            with db.engine.begin() as conn:
+                convert_hd_json_columns(conn)
+        except Exception as e:
+            app.logger.exception("HD JSON column migration failed: %s", e)
+
+def purge_expired_sessions():
+    """Delete every expired user_sessions row in one indexed range DELETE; returns the count"""
+    result = db.session.execute(
+        UserSession.__table__.delete().where(UserSession.expires_at < datetime.utcnow())
+    )
+    db.session.commit()
+    return result.rowcount
+
+@app.cli.command('purge-sessions')
+def purge_sessions_command():
+    """Delete expired session tokens (schedule it, e.g. hourly): flask --app app purge-sessions"""
+    with app.app_context():
+        click.echo(f"Purged {purge_expired_sessions()} expired sessions")
+
+@app.cli.command('ensure-db')
+def ensure_db_command():
+    """Bootstrap the schema as a deploy step: DB_BOOTSTRAP_ON_IMPORT=0 flask --app app ensure-db"""
+    bootstrap_database()
+    _finish_schema_bootstrap()
+
+# Only one process per schema version bootstraps at import. The key is the claim while it holds
+# 'running' and the completion flag once it holds 'done'; other workers (e.g. gunicorn without
+# --preload) wait for 'done' instead of serving against a half-created schema. It carries a
+# fingerprint of the model metadata so a deploy that changes the schema always bootstraps.
+SCHEMA_BOOTSTRAP_LOCK_SECONDS = 300
+SCHEMA_BOOTSTRAP_POLL_SECONDS = 0.5
+
+def _schema_bootstrap_key():
+    fingerprint = hashlib.sha1(repr([
+        (table.name, [column.name for column in table.columns]) for table in db.metadata.sorted_tables
+    ]).encode()).hexdigest()[:16]
+    return f"glow:schema:bootstrapped:{fingerprint}"
+
+def _claim_schema_bootstrap():
+    """
+    True if this process should bootstrap (always when Redis is unavailable). Otherwise blocks
+    until the claiming process marks the key 'done', taking over if it gives up or times out.
+    """
+    if cache_redis is None:
+        return True
+    key = _schema_bootstrap_key()
     try:
-        from migrate_on_startup import run_startup_migration
-        run_startup_migration()
-    except Exception as e:
-        print(f"Startup migration warning: {e}")
+        deadline = time_module.monotonic() + SCHEMA_BOOTSTRAP_LOCK_SECONDS
+        while time_module.monotonic() < deadline:
+            if cache_redis.set(key, 'running', nx=True, ex=SCHEMA_BOOTSTRAP_LOCK_SECONDS):
+                return True
+            if cache_redis.get(key) == b'done':
+                return False
+            time_module.sleep(SCHEMA_BOOTSTRAP_POLL_SECONDS)
+        app.logger.warning("Schema bootstrap still running after %ss; bootstrapping here", SCHEMA_BOOTSTRAP_LOCK_SECONDS)
+        return True
+    except redis.RedisError as e:
+        app.logger.warning("Schema bootstrap lock unavailable: %s", e)
+        return True
+
+def _finish_schema_bootstrap():
+    """Publish the bootstrap outcome: 'done' for waiting workers, or release the claim after a failure"""
+    if cache_redis is None:
+        return
+    try:
+        if _database_ready.is_set():
+            cache_redis.set(_schema_bootstrap_key(), 'done')
+        else:
+            # Let the next worker retry instead of holding the lock after a failed bootstrap
+            cache_redis.delete(_schema_bootstrap_key())
+    except redis.RedisError as e:
+        app.logger.warning("Schema bootstrap flag not updated: %s", e)
+
+def _confirm_schema_bootstrapped():
+    """Trust another process's 'done' after one has_table round-trip (e.g. Redis outlived a reset database)"""
+    with app.app_context():
+        if sa_inspect(db.engine).has_table('users'):
+            _database_ready.set()
+        else:
+            bootstrap_database()
+            _finish_schema_bootstrap()
+
+# DB_BOOTSTRAP_ON_IMPORT=0 leaves bootstrapping to `flask ensure-db` (run by scripts/boot.sh and
+# nixpacks.toml before gunicorn starts); the health check's ensure_database() still verifies tables
+if os.environ.get('DB_BOOTSTRAP_ON_IMPORT', '1') == '1':
+    if _claim_schema_bootstrap():
+        bootstrap_database()
+        _finish_schema_bootstrap()
+    else:
+        _confirm_schema_bootstrapped()
 
 # Railway deployment compatibility - no app.run() call
 # Gunicorn imports 'app' object directly
@@ -3925,23 +5265,23 @@ def change_password():
             return jsonify({'error': 'Current password and new password are required'}), 400
         
         # Get current user
-        current_user = User.query.get(g.user)
-        if not current_user:
+        user = current_user()
+        if not user:
             return jsonify({'error': 'User not found'}), 404
         
         # Verify current password
-        if not check_password_hash(current_user.password_hash, current_password):
+        if not verify_password(current_password, user.password_hash):
             return jsonify({'error': 'Current password is incorrect'}), 400
         
         # Update password
-        current_user.password_hash = generate_password_hash(new_password)
+        user.password_hash = hash_password(new_password)
         db.session.commit()
         
         return jsonify({'message': 'Password updated successfully'})
         
     except Exception as e:
         db.session.rollback()
-        print(f"Password change error: {e}")
+        app.logger.exception("Password change error: %s", e)
         return jsonify({'error': 'Failed to update password'}), 500
 
 @app.route('/api/profile/upload-photo', methods=['POST'])
@@ -3963,7 +5303,7 @@ def upload_photo():
         })
         
     except Exception as e:
-        print(f"Photo upload error: {e}")
+        app.logger.exception("Photo upload error: %s", e)
         return jsonify({'error': 'Failed to upload photo'}), 500
 
 @app.route('/api/admin/migrate-database', methods=['POST'])
@@ -4085,7 +5425,7 @@ def debug_users():
         })
         
     except Exception as e:
-        print(f"Debug users error: {e}")
+        app.logger.exception("Debug users error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/admin/initialize', methods=['POST'])
@@ -4098,10 +5438,9 @@ def initialize_admin():
             return jsonify({'message': 'Admin user already exists', 'email': admin.email})
         
         # Create admin user
-        from werkzeug.security import generate_password_hash
         admin = User(
             email='admin@glow.app',
-            password_hash=generate_password_hash('admin123'),
+            password_hash=hash_password('admin123'),
             first_name='Admin',
             last_name='User',
             status='approved',
@@ -4118,7 +5457,7 @@ def initialize_admin():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Admin initialization error: {e}")
+        app.logger.exception("Admin initialization error: %s", e)
         return jsonify({'error': 'Failed to initialize admin user'}), 500
 
 
@@ -4150,11 +5489,11 @@ def run_boot_self_checks():
                 required_methods = critical_routes[endpoint_path]
                 allowed_methods = list(rule.methods - {'HEAD', 'OPTIONS'})
                 
-                app.logger.info(f"ROUTE_AUDIT: {endpoint_path} → methods={allowed_methods}")
+                app.logger.info("ROUTE_AUDIT: %s → methods=%s", endpoint_path, allowed_methods)
                 
                 for required_method in required_methods:
                     if required_method not in allowed_methods:
-                        app.logger.error(f"ROUTE_AUDIT_FAIL: {required_method} not found on {endpoint_path}")
+                        app.logger.error("ROUTE_AUDIT_FAIL: %s not found on %s", required_method, endpoint_path)
                         exit(1)
         
         app.logger.info("ROUTE_AUDIT: PASS")
@@ -4162,7 +5501,7 @@ def run_boot_self_checks():
     # Sanity Probe (ENABLE_SANITY_PROBE=1)
     if os.environ.get('ENABLE_SANITY_PROBE') == '1':
         is_strict = os.environ.get('SANITY_STRICT') == '1'
-        app.logger.info(f"BOOT: Running sanity probe (strict={is_strict})...")
+        app.logger.info("BOOT: Running sanity probe (strict=%s)...", is_strict)
         
         try:
             # Test environment variable parsing
@@ -4192,7 +5531,7 @@ def run_boot_self_checks():
             app.logger.info("SANITY_PROBE: PASS")
             
         except Exception as e:
-            app.logger.error(f"SANITY_PROBE_FAIL: {e}")
+            app.logger.exception("SANITY_PROBE_FAIL: %s", e)
             if is_strict:
                 exit(1)
     
@@ -4206,7 +5545,7 @@ def run_boot_self_checks():
             with open(mapping_path, 'r') as f:
                 mappings = json.load(f)
             
-            app.logger.info(f"MAPPING: loaded {len(mappings)} entries")
+            app.logger.info("MAPPING: loaded %s entries", len(mappings))
             
             # Schema validation
             for entry in mappings:
@@ -4226,20 +5565,20 @@ def run_boot_self_checks():
                 if not entry['read_path'].startswith('user.'):
                     raise Exception(f"Invalid read_path '{entry['read_path']}' in field '{entry['field']}' - must start with 'user.'")
                 
-                app.logger.info(f"MAPPING OK field={entry['field']} writer={entry['writer']} read_path={entry['read_path']}")
+                app.logger.info("MAPPING OK field=%s writer=%s read_path=%s", entry['field'], entry['writer'], entry['read_path'])
             
             app.logger.info("MAPPING: schema OK")
             
             # Optional sample validation
             sample_user_id = os.environ.get('MAPPING_VALIDATE_SAMPLE_USER_ID')
             if sample_user_id:
-                app.logger.info(f"MAPPING: validating read_paths against user {sample_user_id}")
+                app.logger.info("MAPPING: validating read_paths against user %s", sample_user_id)
                 
                 with app.app_context():
                     # Fetch user data using same logic as /api/auth/me
                     user = User.query.get(int(sample_user_id))
                     if not user:
-                        app.logger.warning(f"MAPPING WARN: sample user {sample_user_id} not found")
+                        app.logger.warning("MAPPING WARN: sample user %s not found", sample_user_id)
                     else:
                         # Build user data structure like /api/auth/me
                         user_data = {
@@ -4270,12 +5609,12 @@ def run_boot_self_checks():
                                     break
                             
                             if resolved:
-                                app.logger.info(f"MAPPING: read_path OK {read_path}")
+                                app.logger.info("MAPPING: read_path OK %s", read_path)
                             else:
-                                app.logger.warning(f"MAPPING WARN unresolved read_path={read_path}")
+                                app.logger.warning("MAPPING WARN unresolved read_path=%s", read_path)
             
         except Exception as e:
-            app.logger.error(f"MAPPING_VALIDATOR_FAIL: {e}")
+            app.logger.exception("MAPPING_VALIDATOR_FAIL: %s", e)
             # Signal-only, never crash
 
 # Run boot self-checks after all initialization is complete
@@ -4367,9 +5706,11 @@ def update_user_preferences():
 
     except SQLAlchemyError as e:
         db.session.rollback()
-        app.logger.error(f"Database error in update_user_preferences: {e}")
+        app.logger.exception("Database error in update_user_preferences: %s", e)
         return jsonify({'error': 'Database error'}), 500
     except Exception as e:
-        app.logger.error(f"Error in update_user_preferences: {e}")
+        app.logger.exception("Error in update_user_preferences: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
+# All routes are registered above; refuse to start if any @require_auth marker was wrapped away
+check_require_auth_placement()
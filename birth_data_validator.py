@@ -4,7 +4,7 @@ Enforces HH:mm time format and YYYY-MM-DD date format with typed 400 errors
 """
 
 import re
-from datetime import datetime
+from datetime import date
 from typing import Dict, List, Optional, Tuple, Any
 
 
@@ -21,6 +21,9 @@ class BirthDataValidator:
     # HH:mm 24h format regex - no seconds allowed
     TIME_REGEX = re.compile(r'^(?:[01]\d|2[0-3]):[0-5]\d$')
     
+    # YYYY-MM-DD shape only; calendar validity is checked by date.fromisoformat
+    DATE_REGEX = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    
     # Banned literal strings (case-insensitive)
     BANNED_LITERALS = ['invalid date']
     
@@ -142,12 +145,12 @@ class BirthDataValidator:
         if date_str.lower() in cls.BANNED_LITERALS:
             raise ValueError("invalid literal value")
         
-        # Validate YYYY-MM-DD format and real calendar date
+        # Validate YYYY-MM-DD format and real calendar date (fromisoformat rejects e.g. 1990-02-30;
+        # the regex keeps out the other ISO forms it accepts, like 19900101)
+        if not cls.DATE_REGEX.match(date_str):
+            raise ValueError("must be YYYY-MM-DD")
         try:
-            parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-            # Ensure the parsed date matches the input (catches invalid dates like 1990-02-30)
-            if parsed_date.strftime('%Y-%m-%d') != date_str:
-                raise ValueError("must be YYYY-MM-DD")
+            date.fromisoformat(date_str)
         except ValueError:
             raise ValueError("must be YYYY-MM-DD")
         
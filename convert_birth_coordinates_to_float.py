@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Database migration to store birth_data latitude/longitude (and the Nominatim
+location_importance score) as double precision instead of NUMERIC
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+# birth_data columns read as floats by the app
+FLOAT_COLUMNS = ('latitude', 'longitude', 'location_importance')
+
+def convert_birth_coordinates_to_float():
+    """Convert birth_data FLOAT_COLUMNS to double precision"""
+    
+    # Get database URL from environment
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+    
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+    
+    try:
+        # Create engine
+        engine = create_engine(database_url, poolclass=NullPool)
+        
+        if engine.dialect.name != 'postgresql':
+            # SQLite stores NUMERIC coordinates with REAL affinity already
+            print("Non-Postgres database, nothing to convert")
+            return True
+        
+        with engine.begin() as conn:
+            result = conn.execute(text("""
+                SELECT column_name, data_type 
+                FROM information_schema.columns 
+                WHERE table_name = 'birth_data' AND column_name = ANY(:columns)
+            """), {'columns': list(FLOAT_COLUMNS)})
+            pending = [name for name, data_type in result if data_type != 'double precision']
+            
+            if not pending:
+                print("birth_data float columns already use double precision")
+                return True
+            
+            alter_clauses = ', '.join(
+                f"ALTER COLUMN {name} TYPE double precision USING {name}::double precision"
+                for name in pending
+            )
+            print(f"Converting {', '.join(pending)} to double precision...")
+            conn.execute(text(f"ALTER TABLE birth_data {alter_clauses}"))
+            print(f"✅ Converted birth_data {', '.join(pending)}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"ERROR: Migration failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔄 Running birth coordinate type migration...")
+    success = convert_birth_coordinates_to_float()
+    
+    if success:
+        print("🎉 Migration completed successfully!")
+        sys.exit(0)
+    else:
+        print("❌ Migration failed!")
+        sys.exit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Database migration to store the human_design_data JSON payload columns
+(chart data, API response, gate/channel lists) as JSONB instead of TEXT
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, inspect as sa_inspect, text
+from sqlalchemy.pool import NullPool
+
+# human_design_data columns mapped as HD_JSON by the app
+JSON_COLUMNS = (
+    'chart_data', 'api_response', 'split_bridges',
+    'gates_defined', 'gates_personality', 'gates_design', 'hanging_gates', 'key_relational_gates',
+    'channels_defined', 'key_relationship_channels', 'cross_gates', 'open_centers',
+    'planetary_relational_impacts', 'electromagnetic_connections', 'compromise_connections',
+    'dominance_connections', 'conditioning_dynamics'
+)
+
+def convert_hd_json_columns(conn):
+    """
+    Bring human_design_data's JSON_COLUMNS in line with the HD_JSON mapping on an open connection
+    (idempotent; bootstrap_database runs it before the app serves). Empty strings written by older
+    code paths are not valid JSON, so they become NULL on every dialect.
+    """
+    if conn.dialect.name != 'postgresql':
+        # SQLite keeps JSON as TEXT; only the '' rows would fail to decode
+        inspector = sa_inspect(conn)
+        if not inspector.has_table('human_design_data'):
+            return
+        existing = {column['name'] for column in inspector.get_columns('human_design_data')}
+        present = [name for name in JSON_COLUMNS if name in existing]
+        if present:
+            set_clauses = ', '.join(f"{name} = NULLIF({name}, '')" for name in present)
+            where_clause = ' OR '.join(f"{name} = ''" for name in present)
+            conn.execute(text(f"UPDATE human_design_data SET {set_clauses} WHERE {where_clause}"))
+        return
+
+    result = conn.execute(text("""
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_name = 'human_design_data' AND column_name = ANY(:columns)
+    """), {'columns': list(JSON_COLUMNS)})
+    pending = [name for name, data_type in result if data_type != 'jsonb']
+
+    if not pending:
+        print("human_design_data JSON columns already use jsonb")
+        return
+
+    alter_clauses = ', '.join(
+        f"ALTER COLUMN {name} TYPE jsonb USING NULLIF({name}, '')::jsonb"
+        for name in pending
+    )
+    print(f"Converting {', '.join(pending)} to jsonb...")
+    conn.execute(text(f"ALTER TABLE human_design_data {alter_clauses}"))
+    print(f"✅ Converted human_design_data {', '.join(pending)}")
+
+def convert_hd_json_columns_to_jsonb():
+    """Convert human_design_data JSON_COLUMNS to jsonb"""
+
+    # Get database URL from environment
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+
+    try:
+        # Create engine
+        engine = create_engine(database_url, poolclass=NullPool)
+
+        with engine.begin() as conn:
+            convert_hd_json_columns(conn)
+
+        return True
+
+    except Exception as e:
+        print(f"ERROR: Migration failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔄 Running Human Design JSON column migration...")
+    success = convert_hd_json_columns_to_jsonb()
+
+    if success:
+        print("🎉 Migration completed successfully!")
+        sys.exit(0)
+    else:
+        print("❌ Migration failed!")
+        sys.exit(1)
@@ -26,6 +26,7 @@ import os
 import sys
 from datetime import datetime
 from sqlalchemy import create_engine, text, MetaData, Table, Column, String, Boolean, Numeric, Integer
+from sqlalchemy.pool import NullPool
 
 def get_database_url():
     """Get database URL from environment or use default"""
@@ -43,7 +44,7 @@ def run_migration():
     database_url = get_database_url()
     print(f"🔗 Connecting to database: {database_url.split('@')[-1] if '@' in database_url else database_url}")
     
-    engine = create_engine(database_url)
+    engine = create_engine(database_url, poolclass=NullPool)
     
     try:
         with engine.connect() as conn:
@@ -181,7 +182,7 @@ def rollback_migration():
     print("🔄 Starting Migration Rollback")
     
     database_url = get_database_url()
-    engine = create_engine(database_url)
+    engine = create_engine(database_url, poolclass=NullPool)
     
     columns_to_remove = [
         "location_display_name", "location_country", "location_state", 
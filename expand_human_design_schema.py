@@ -8,6 +8,7 @@ import os
 import sys
 from datetime import datetime
 from sqlalchemy import create_engine, text, Column, Integer, String, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -22,7 +23,7 @@ def expand_human_design_schema():
     """Add comprehensive Human Design fields for matching"""
     
     database_url = get_database_url()
-    engine = create_engine(database_url)
+    engine = create_engine(database_url, poolclass=NullPool)
     
     print(f"Expanding Human Design schema in database: {database_url}")
     
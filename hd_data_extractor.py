@@ -3,7 +3,6 @@
 Human Design Data Extraction Engine
 Parses Human Design API responses and populates comprehensive schema fields
 """
-import json
 from datetime import datetime
 from app import app, db, HumanDesignData
 
@@ -25,8 +24,8 @@ def extract_hd_data_from_api(api_response, user_id):
         hd_data = HumanDesignData(user_id=user_id)
     
     # Store raw API response
-    hd_data.set_api_response(api_response)
-    hd_data.set_chart_data(api_response)
+    hd_data.api_response = api_response or None
+    hd_data.chart_data = api_response or None
     hd_data.calculated_at = datetime.utcnow()
     hd_data.schema_version = 3
     
@@ -43,7 +42,7 @@ def extract_hd_data_from_api(api_response, user_id):
     
     # === DEFINITION & SPLITS ===
     hd_data.definition_type = api_response.get('definition', '')
-    hd_data.split_bridges = json.dumps(extract_split_bridges(api_response))
+    hd_data.split_bridges = extract_split_bridges(api_response)
     hd_data.definition_relational_impact = generate_definition_relational_impact(hd_data.definition_type)
     
     # === CENTERS ===
@@ -125,11 +124,11 @@ def extract_gates_data(hd_data, gates_data, api_response):
     # Identify key relational gates
     key_relational_gates = identify_key_relational_gates(defined_gates)
     
-    hd_data.set_gates_defined(defined_gates)
-    hd_data.gates_personality = json.dumps(personality_gates)
-    hd_data.gates_design = json.dumps(design_gates)
-    hd_data.set_hanging_gates(hanging_gates)
-    hd_data.key_relational_gates = json.dumps(key_relational_gates)
+    hd_data.gates_defined = defined_gates or None
+    hd_data.gates_personality = personality_gates
+    hd_data.gates_design = design_gates
+    hd_data.hanging_gates = hanging_gates or None
+    hd_data.key_relational_gates = key_relational_gates
 
 def extract_channels_data(hd_data, channels_data):
     """Extract channel data with relational impacts"""
@@ -144,8 +143,8 @@ def extract_channels_data(hd_data, channels_data):
     # Identify key relationship channels
     key_relationship_channels = identify_key_relationship_channels(defined_channels)
     
-    hd_data.set_channels_defined(defined_channels)
-    hd_data.key_relationship_channels = json.dumps(key_relationship_channels)
+    hd_data.channels_defined = defined_channels or None
+    hd_data.key_relationship_channels = key_relationship_channels
 
 def extract_profile_data(hd_data, profile):
     """Extract profile data with line-by-line relational impacts"""
@@ -169,11 +168,11 @@ def extract_incarnation_cross_data(hd_data, cross_data):
     """Extract incarnation cross data"""
     if isinstance(cross_data, dict):
         hd_data.incarnation_cross = cross_data.get('name', '')
-        hd_data.cross_gates = json.dumps(cross_data.get('gates', []))
+        hd_data.cross_gates = cross_data.get('gates', [])
         hd_data.cross_angle = cross_data.get('angle', '')
     elif isinstance(cross_data, str):
         hd_data.incarnation_cross = cross_data
-        hd_data.cross_gates = json.dumps([])
+        hd_data.cross_gates = []
         hd_data.cross_angle = ''
     
     hd_data.cross_relational_impact = generate_cross_relational_impact(hd_data.incarnation_cross)
@@ -188,7 +187,7 @@ def extract_conditioning_data(hd_data, centers):
             open_centers.append(center_name)
             conditioning_themes.append(generate_conditioning_theme(center_name))
     
-    hd_data.set_open_centers(open_centers)
+    hd_data.open_centers = open_centers or None
     hd_data.conditioning_themes = '; '.join(conditioning_themes)
     hd_data.conditioning_relational_impact = generate_conditioning_relational_impact(open_centers)
 
@@ -199,7 +198,7 @@ def extract_circuitry_data(hd_data, channels_data):
     collective_count = 0
     
     # Count channels by circuitry type
-    for channel in hd_data.get_channels_defined():
+    for channel in hd_data.channels_defined or []:
         circuitry = get_channel_circuitry(channel)
         if circuitry == 'individual':
             individual_count += 1
@@ -260,15 +259,15 @@ def extract_planetary_data(hd_data, planets_data):
     
     # Generate planetary relational impacts
     planetary_impacts = generate_planetary_relational_impacts(personality_planets, design_planets)
-    hd_data.planetary_relational_impacts = json.dumps(planetary_impacts)
+    hd_data.planetary_relational_impacts = planetary_impacts
 
 def calculate_compatibility_connections(hd_data):
     """Calculate compatibility connections for Magic 10 algorithm"""
     # This will be populated when comparing with other users
-    hd_data.electromagnetic_connections = json.dumps({})
-    hd_data.compromise_connections = json.dumps({})
-    hd_data.dominance_connections = json.dumps({})
-    hd_data.conditioning_dynamics = json.dumps({})
+    hd_data.electromagnetic_connections = {}
+    hd_data.compromise_connections = {}
+    hd_data.dominance_connections = {}
+    hd_data.conditioning_dynamics = {}
 
 # === HELPER FUNCTIONS FOR RELATIONAL IMPACT GENERATION ===
 
@@ -14,7 +14,6 @@ Key Features:
 """
 
 import requests
-import json
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import os
@@ -479,16 +478,14 @@ def get_or_calculate_hd_chart(user_id: int, birth_data: Dict) -> Optional[Dict]:
     Returns:
         HD chart data or None
     """
+    from sqlalchemy.orm import undefer
     from app import db, HumanDesignData  # Import here to avoid circular imports
     
-    # Check if we already have HD data
-    hd_data = HumanDesignData.query.get(user_id)
+    # Check if we already have HD data (chart_data is deferred on the model)
+    hd_data = HumanDesignData.query.options(undefer(HumanDesignData.chart_data)).get(user_id)
     
     if hd_data and hd_data.chart_data:
-        try:
-            return json.loads(hd_data.chart_data)
-        except:
-            pass
+        return hd_data.chart_data
     
     # Calculate new chart
     hd_engine = HDIntelligenceEngine()
@@ -500,7 +497,7 @@ def get_or_calculate_hd_chart(user_id: int, birth_data: Dict) -> Optional[Dict]:
             hd_data = HumanDesignData(user_id=user_id)
             db.session.add(hd_data)
         
-        hd_data.chart_data = json.dumps(chart_data)
+        hd_data.chart_data = chart_data
         hd_data.calculated_at = datetime.utcnow()
         
         # Extract and store key factors
@@ -530,32 +527,64 @@ def calculate_enhanced_compatibility(user1_id: int, user2_id: int, magic10_resul
     Returns:
         Enhanced compatibility result
     """
-    from app import db, HumanDesignData  # Import here to avoid circular imports
+    hd_factors = get_hd_factors_for_users([user1_id, user2_id])
     
-    # Get HD data for both users
-    hd_data1 = HumanDesignData.query.get(user1_id)
-    hd_data2 = HumanDesignData.query.get(user2_id)
+    return enhance_compatibility_with_factors(
+        magic10_result,
+        hd_factors.get(user1_id, {}),
+        hd_factors.get(user2_id, {})
+    )
+
+def get_hd_factors_for_users(user_ids: List[int], hd_engine: Optional[HDIntelligenceEngine] = None) -> Dict[int, Dict]:
+    """
+    Load HD factors for many users with a single query
     
-    hd_factors1 = {}
-    hd_factors2 = {}
+    Args:
+        user_ids: User IDs to load
+        hd_engine: Optional engine instance to reuse
     
-    # Extract HD factors if available
-    hd_engine = HDIntelligenceEngine()
+    Returns:
+        Mapping of user_id -> HD factors (users without chart data are omitted)
+    """
+    from app import HumanDesignData  # Import here to avoid circular imports
     
-    if hd_data1 and hd_data1.chart_data:
-        try:
-            chart1 = json.loads(hd_data1.chart_data)
-            hd_factors1 = hd_engine.extract_hd_factors(chart1)
-        except:
-            pass
+    if not user_ids:
+        return {}
+    
+    hd_engine = hd_engine or HDIntelligenceEngine()
+    rows = HumanDesignData.query.with_entities(
+        HumanDesignData.user_id, HumanDesignData.chart_data
+    ).filter(
+        HumanDesignData.user_id.in_(list(set(user_ids)))
+    ).all()
     
-    if hd_data2 and hd_data2.chart_data:
+    hd_factors = {}
+    for hd_data in rows:
+        if not hd_data.chart_data:
+            continue
         try:
-            chart2 = json.loads(hd_data2.chart_data)
-            hd_factors2 = hd_engine.extract_hd_factors(chart2)
+            hd_factors[hd_data.user_id] = hd_engine.extract_hd_factors(hd_data.chart_data)
         except:
             pass
     
+    return hd_factors
+
+def enhance_compatibility_with_factors(magic10_result: Dict, hd_factors1: Dict, hd_factors2: Dict,
+                                       hd_engine: Optional[HDIntelligenceEngine] = None) -> Dict:
+    """
+    Enhance a Magic 10 result with already-loaded HD factors (no database access)
+    
+    Args:
+        magic10_result: Original Magic 10 compatibility result
+        hd_factors1: First person's HD factors
+        hd_factors2: Second person's HD factors
+        hd_engine: Optional engine instance to reuse across many pairs
+    
+    Returns:
+        Enhanced compatibility result
+    """
+    hd_engine = hd_engine or HDIntelligenceEngine()
+    
     # Enhance Magic 10 result with HD intelligence
     enhanced_result = hd_engine.enhance_magic10_compatibility(
         magic10_result, hd_factors1, hd_factors2
@@ -568,4 +597,3 @@ def calculate_enhanced_compatibility(user1_id: int, user2_id: int, magic10_resul
     enhanced_result['compatibility_insights'] = insights
     
     return enhanced_result
-
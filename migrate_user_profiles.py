@@ -8,6 +8,7 @@ import os
 import sys
 from datetime import datetime
 from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker
 
 # Add the app directory to the path to import models
@@ -148,7 +149,7 @@ def main():
         database_url = get_database_url()
         print(f"📊 Database: {database_url}")
         
-        engine = create_engine(database_url)
+        engine = create_engine(database_url, poolclass=NullPool)
         
         # Run migration steps
         create_user_profiles_table(engine)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the standalone database migration scripts
+"""
+
+import os
+from sqlalchemy import create_engine, text, bindparam
+from sqlalchemy.pool import NullPool
+
+def introspect_columns(conn, tables):
+    """Return {table: {column, ...}} for the given tables in a single query"""
+    existing = {table: set() for table in tables}
+    if conn.dialect.name == 'sqlite':
+        for table in tables:
+            for row in conn.execute(text(f"PRAGMA table_info({table})")):
+                existing[table].add(row[1])
+        return existing
+
+    result = conn.execute(text("""
+        SELECT table_name, column_name
+        FROM information_schema.columns
+        WHERE table_name IN :tables
+    """).bindparams(bindparam('tables', expanding=True)), {'tables': list(tables)})
+    for table_name, column_name in result:
+        existing[table_name].add(column_name)
+    return existing
+
+def create_indexes(indexes):
+    """
+    Create each {index_name: 'table (columns)'} index if it is missing, using DATABASE_URL
+    Postgres builds them CONCURRENTLY so writes are not locked. Returns True on success.
+    """
+
+    # Get database URL from environment
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+
+    try:
+        # Create engine
+        engine = create_engine(database_url, poolclass=NullPool)
+
+        if engine.dialect.name == 'postgresql':
+            # CONCURRENTLY avoids locking writes but cannot run inside a transaction
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                for index_name, target in indexes.items():
+                    conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {target}"))
+                    print(f"✅ {index_name} index is in place")
+        else:
+            with engine.begin() as conn:
+                for index_name, target in indexes.items():
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}"))
+                    print(f"✅ {index_name} index is in place")
+
+        return True
+
+    except Exception as e:
+        print(f"ERROR: Migration failed: {e}")
+        return False
@@ -227,11 +227,8 @@ class RedisSessionStore(SessionStore):
         session_key = f"sess:{session_id}"
         
         try:
-            # Update all fields in the hash
-            pipe = self.redis_client.pipeline()
-            for key, value in session_data.items():
-                pipe.hset(session_key, key, str(value))
-            pipe.execute()
+            # Update all fields in the hash with one multi-field HSET (runs on every authenticated request)
+            self.redis_client.hset(session_key, mapping={key: str(value) for key, value in session_data.items()})
             
             logger.info(f"Redis session updated: {session_id}")
             return True
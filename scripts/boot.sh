@@ -29,6 +29,15 @@ else
   fi
 fi
 
-echo "PRECHECK: Starting gunicorn --preload"
-exec gunicorn --preload --bind "0.0.0.0:${PORT:-8080}" "$WSGI_APP"
+# Create tables and run startup migrations once, before any worker serves; workers then
+# only confirm the schema at import instead of racing each other through the DDL
+echo "BOOT: flask ensure-db"
+DB_BOOTSTRAP_ON_IMPORT=0 flask --app "$(echo "$WSGI_APP" | cut -d: -f1)" ensure-db
+
+# gthread workers: Argon2 hashing releases the GIL, so one login/register no longer
+# blocks every other request on the worker
+GUNICORN_THREADS=${GUNICORN_THREADS:-4}
+
+echo "PRECHECK: Starting gunicorn --preload (gthread, threads=$GUNICORN_THREADS)"
+exec gunicorn --preload --worker-class gthread --threads "$GUNICORN_THREADS" --bind "0.0.0.0:${PORT:-8080}" "$WSGI_APP"
 
@@ -4,6 +4,11 @@ Test configuration for GLOW Intelligence App backend tests
 import os
 import pytest
 import tempfile
+
+# The engine is built when app is imported, so point it at in-memory SQLite first
+# (otherwise the fixtures below would create/drop tables in the local dev database)
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
 from app import app, db
 
 # Environment configuration
@@ -36,6 +41,19 @@ def test_app():
         yield app
         db.drop_all()
 
+@pytest.fixture
+def app_db():
+    """Fresh in-memory schema for unit tests that need the database (not E2E-gated)"""
+    import app as app_module
+    
+    app.config['TESTING'] = True
+    app_module._priority_cache.clear()
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
 @pytest.fixture
 def client(test_app):
     """Create test client"""
@@ -0,0 +1,69 @@
+"""
+Tests for DELETE /api/admin/users/<id>: every row referencing the user is removed or detached
+"""
+import pytest
+from sqlalchemy import event
+
+from app import (
+    app, db, session_store, User, UserProfile, UserPriorities, UserPreferences, UserSession,
+    UserResonancePrefs, EmailNotification, AdminActionLog, CompatibilityMatrix
+)
+from datetime import datetime, timedelta
+
+
+@pytest.fixture
+def enforced_fks(app_db):
+    """Turn on SQLite foreign key enforcement so a dangling reference fails the delete"""
+    def _enable(dbapi_connection, connection_record):
+        dbapi_connection.execute('PRAGMA foreign_keys=ON')
+    
+    event.listen(db.engine, 'connect', _enable)
+    db.engine.dispose()
+    db.create_all()
+    yield
+    event.remove(db.engine, 'connect', _enable)
+    db.session.remove()
+    db.engine.dispose()
+
+
+def _add_user(email, is_admin=False):
+    user = User(email=email, password_hash='x', status='approved', is_admin=is_admin)
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+
+def test_delete_user_clears_every_reference(enforced_fks):
+    admin_id = _add_user('admin@example.com', is_admin=True)
+    other_id = _add_user('other@example.com')
+    user_id = _add_user('gone@example.com')
+    db.session.add_all([
+        UserProfile(user_id=user_id),
+        UserPriorities(user_id=user_id, **{column: 5 for column in UserPriorities.PRIORITY_COLUMNS}),
+        UserPreferences(user_id=user_id, prefs={}),
+        UserSession(user_id=user_id, session_token='t' * 64, expires_at=datetime.utcnow() + timedelta(days=1)),
+        UserResonancePrefs(user_id=user_id, weights={}),
+        EmailNotification(user_id=user_id, email_type='welcome', recipient_email='gone@example.com'),
+        CompatibilityMatrix(user_a_id=other_id, user_b_id=user_id),
+        AdminActionLog(admin_user_id=user_id, action='user_approval', target_user_id=other_id),
+    ])
+    db.session.commit()
+    
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['session_id'] = session_store.create_session(admin_id)['session_id']
+    response = client.delete(f'/api/admin/users/{user_id}')
+    
+    assert response.status_code == 200, response.get_json()
+    db.session.expire_all()
+    assert db.session.get(User, user_id) is None
+    for model in (UserProfile, UserPriorities, UserPreferences, UserSession, UserResonancePrefs, EmailNotification):
+        assert model.query.filter_by(user_id=user_id).count() == 0
+    assert CompatibilityMatrix.query.count() == 0
+    
+    # The audit trail survives, including the row for this deletion, without the dangling ids
+    log = {row.action: row for row in AdminActionLog.query}
+    assert log['user_deletion'].admin_user_id == admin_id
+    assert log['user_deletion'].target_user_id is None
+    assert log['user_approval'].admin_user_id is None
+    assert log['user_approval'].target_user_id == other_id
@@ -0,0 +1,93 @@
+"""
+Tests for the target_user_ids branch of POST /api/compatibility/calculate
+"""
+import pytest
+from flask import g
+
+import app as app_module
+from app import app, db, User, UserPriorities, calculate_compatibility_batch
+
+
+def _make_user(email, priorities=None):
+    user = User(email=email, password_hash='x', status='approved')
+    db.session.add(user)
+    db.session.flush()
+    if priorities is not None:
+        db.session.add(UserPriorities(user_id=user.id, **dict(zip(UserPriorities.PRIORITY_COLUMNS, priorities))))
+    db.session.commit()
+    return user.id
+
+
+def _call(user_id, target_user_ids):
+    with app.test_request_context('/api/compatibility/calculate', method='POST'):
+        g.user = user_id
+        response = app.make_response(calculate_compatibility_batch(target_user_ids))
+        return response.status_code, response.get_json()
+
+
+def test_batch_scores_every_target(app_db):
+    caller = _make_user('caller@example.com', [5] * 10)
+    targets = [_make_user(f't{i}@example.com', [i + 1] * 10) for i in range(3)]
+    
+    status, body = _call(caller, targets)
+    
+    assert status == 200
+    assert body == {'status': 'ok', 'calculated': 3}
+
+
+def test_batch_rejects_self_only_targets(app_db):
+    caller = _make_user('caller@example.com', [5] * 10)
+    
+    status, body = _call(caller, [caller, caller])
+    
+    assert status == 400
+    assert 'other than yourself' in body['error']
+
+
+def test_batch_requires_caller_priorities(app_db):
+    caller = _make_user('caller@example.com')
+    target = _make_user('target@example.com', [5] * 10)
+    
+    status, body = _call(caller, [target])
+    
+    assert status == 400
+    assert body['code'] == 'PRIORITIES_REQUIRED'
+
+
+def test_batch_reports_targets_without_priorities(app_db):
+    caller = _make_user('caller@example.com', [5] * 10)
+    target = _make_user('target@example.com')
+    
+    status, body = _call(caller, [target])
+    
+    assert status == 400
+    assert body['code'] == 'TARGET_PRIORITIES_MISSING'
+
+
+@pytest.mark.parametrize('target_user_ids', [[True], [False], ['2'], [2.0], 2])
+def test_batch_rejects_non_integer_ids(app_db, target_user_ids):
+    caller = _make_user('caller@example.com', [5] * 10)
+    
+    status, body = _call(caller, target_user_ids)
+    
+    assert status == 400
+    assert body['error'] == 'target_user_ids must be a list of user ids'
+
+
+def test_batch_unknown_target_is_404(app_db):
+    caller = _make_user('caller@example.com', [5] * 10)
+    
+    status, body = _call(caller, [caller + 999])
+    
+    assert status == 404
+    assert body['missing_user_ids'] == [caller + 999]
+
+
+def test_batch_failure_is_500(app_db, monkeypatch):
+    caller = _make_user('caller@example.com', [5] * 10)
+    target = _make_user('target@example.com', [5] * 10)
+    monkeypatch.setattr(app_module, 'calculate_mutual_compatibility_batch', lambda *args: None)
+    
+    status, body = _call(caller, [target])
+    
+    assert status == 500
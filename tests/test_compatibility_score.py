@@ -0,0 +1,64 @@
+"""
+Baseline outputs for calculate_compatibility_score (Magic 10)
+Expected values were produced by the original pure-Python implementation; the vectorized
+and numba paths must reproduce them exactly, including how x.5 overall scores round.
+"""
+import numpy as np
+import pytest
+
+from app import MAGIC_10_DIMENSIONS, _magic10_score_arrays, calculate_compatibility_score
+
+BASELINE = [
+    # (priorities a, priorities b, dimension scores, overall_score, high_priority_matches, major_mismatches)
+    pytest.param([5, 5, 5, 5, 5, 5, 5, 5, 5, 5], [5, 5, 5, 5, 5, 5, 5, 5, 5, 5], [10, 10, 10, 10, 10, 10, 10, 10, 10, 10], 10, 0, 0, id='identical-mid'),
+    pytest.param([10, 10, 10, 10, 10, 10, 10, 10, 10, 10], [10, 10, 10, 10, 10, 10, 10, 10, 10, 10], [10, 10, 10, 10, 10, 10, 10, 10, 10, 10], 20, 10, 0, id='identical-max'),
+    pytest.param([8, 8, 8, 8, 8, 8, 8, 8, 8, 8], [8, 8, 8, 8, 8, 8, 8, 8, 8, 8], [10, 10, 10, 10, 10, 10, 10, 10, 10, 10], 20, 10, 0, id='bonus-all-8'),
+    pytest.param([7, 7, 7, 7, 7, 7, 7, 7, 7, 7], [8, 8, 8, 8, 8, 8, 8, 8, 8, 8], [9, 9, 9, 9, 9, 9, 9, 9, 9, 9], 9, 0, 0, id='bonus-edge-7-8'),
+    pytest.param([8, 7, 8, 7, 8, 7, 8, 7, 8, 7], [8, 8, 8, 8, 8, 8, 8, 8, 8, 8], [10, 9, 10, 9, 10, 9, 10, 9, 10, 9], 15, 5, 0, id='bonus-half'),
+    pytest.param([1, 1, 1, 1, 1, 1, 1, 1, 1, 1], [8, 8, 8, 8, 8, 8, 8, 8, 8, 8], [3, 3, 3, 3, 3, 3, 3, 3, 3, 3], 0, 0, 10, id='mismatch-edge-diff-7'),
+    pytest.param([1, 1, 1, 1, 1, 1, 1, 1, 1, 1], [7, 7, 7, 7, 7, 7, 7, 7, 7, 7], [4, 4, 4, 4, 4, 4, 4, 4, 4, 4], 4, 0, 0, id='mismatch-edge-diff-6'),
+    pytest.param([1, 1, 1, 1, 1, 5, 5, 5, 5, 5], [8, 8, 8, 8, 8, 5, 5, 5, 5, 5], [3, 3, 3, 3, 3, 10, 10, 10, 10, 10], 0, 0, 5, id='mismatch-clamped-to-0'),
+    pytest.param([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], [10, 9, 8, 7, 6, 5, 4, 3, 2, 1], [1, 3, 5, 7, 9, 9, 7, 5, 3, 1], 0, 0, 4, id='reversed'),
+    pytest.param([4, 6, 1, 5, 10, 3, 6, 9, 10, 10], [2, 4, 10, 5, 5, 2, 2, 8, 8, 2], [8, 8, 1, 10, 5, 9, 6, 9, 8, 2], 5, 2, 2, id='tie-6.5-a'),
+    pytest.param([8, 8, 2, 4, 5, 8, 8, 3, 5, 8], [9, 4, 3, 7, 8, 9, 2, 10, 5, 8], [9, 6, 9, 7, 7, 9, 4, 3, 10, 10], 9, 3, 1, id='tie-7.5'),
+    pytest.param([2, 10, 8, 9, 7, 6, 2, 2, 10, 2], [8, 3, 8, 5, 2, 6, 10, 1, 5, 10], [4, 3, 10, 6, 5, 10, 2, 9, 5, 2], 1, 1, 3, id='tie-5.5'),
+    pytest.param([3, 8, 7, 1, 1, 5, 2, 7, 8, 9], [7, 7, 7, 5, 2, 1, 1, 6, 7, 10], [6, 9, 10, 6, 9, 6, 9, 9, 9, 9], 9, 1, 0, id='tie-8.5'),
+    pytest.param([7, 10, 1, 6, 6, 5, 5, 5, 10, 7], [9, 1, 8, 5, 9, 3, 8, 4, 3, 8], [8, 1, 3, 9, 7, 8, 7, 9, 3, 9], 0, 0, 3, id='tie-6.5-b'),
+    pytest.param([6, 1, 6, 10, 5, 1, 5, 7, 9, 2], [10, 1, 4, 2, 7, 10, 3, 6, 7, 2], [6, 10, 8, 2, 8, 1, 8, 9, 8, 10], 3, 0, 2, id='tie-6.5-c'),
+]
+
+
+@pytest.mark.parametrize('a, b, dimension_scores, overall_score, high_priority_matches, major_mismatches', BASELINE)
+def test_matches_baseline(a, b, dimension_scores, overall_score, high_priority_matches, major_mismatches):
+    expected = {
+        'dimension_scores': dict(zip(MAGIC_10_DIMENSIONS, dimension_scores)),
+        'overall_score': overall_score,
+        'high_priority_matches': high_priority_matches,
+        'major_mismatches': major_mismatches
+    }
+    
+    assert calculate_compatibility_score(a, b) == expected
+    assert calculate_compatibility_score(b, a) == expected
+
+
+def test_batched_arrays_match_baseline():
+    # The recalc/matrix paths score many pairs per call; every row must agree with the pair result
+    a = np.array([case.values[0] for case in BASELINE], dtype=np.int8)
+    b = np.array([case.values[1] for case in BASELINE], dtype=np.int8)
+    
+    base, final_score, high_priority_bonus, major_mismatches = _magic10_score_arrays(a, b)
+    
+    assert base.tolist() == [case.values[2] for case in BASELINE]
+    assert final_score.tolist() == [case.values[3] for case in BASELINE]
+    assert high_priority_bonus.tolist() == [case.values[4] for case in BASELINE]
+    assert major_mismatches.tolist() == [case.values[5] for case in BASELINE]
+
+
+@pytest.mark.parametrize('a, b', [
+    ([5] * 9, [5] * 10),
+    ([0] + [5] * 9, [5] * 10),
+    ([5] * 10, [11] + [5] * 9),
+])
+def test_rejects_invalid_priorities(a, b):
+    with pytest.raises(ValueError):
+        calculate_compatibility_score(a, b)
@@ -0,0 +1,29 @@
+"""
+Tests for the human_design_data JSON column migration run by bootstrap_database
+"""
+from sqlalchemy import text
+
+from app import db, HumanDesignData, User
+from convert_hd_json_columns_to_jsonb import convert_hd_json_columns
+
+
+def test_empty_strings_become_null_and_json_still_decodes(app_db):
+    db.session.add(User(id=1, email='member@example.com', password_hash='x'))
+    db.session.commit()
+    # Older code paths stored '' in the TEXT columns, which no JSON loader accepts
+    db.session.execute(text(
+        "INSERT INTO human_design_data (user_id, chart_data, gates_defined, open_centers) "
+        "VALUES (1, '', '[1, 2]', '')"
+    ))
+    db.session.commit()
+    
+    with db.engine.begin() as conn:
+        convert_hd_json_columns(conn)
+        # Idempotent: a second bootstrap finds nothing to change
+        convert_hd_json_columns(conn)
+    
+    db.session.expire_all()
+    hd = db.session.execute(
+        db.select(HumanDesignData.chart_data, HumanDesignData.gates_defined, HumanDesignData.open_centers)
+    ).one()
+    assert hd == (None, [1, 2], None)
@@ -0,0 +1,88 @@
+"""
+Tests for keyset pagination cursors on the admin list endpoints
+"""
+from datetime import datetime
+
+import pytest
+
+from app import app, db, session_store, User, decode_page_cursor, encode_page_cursor
+
+
+@pytest.mark.parametrize('sort_value', [datetime(2025, 3, 1, 12, 30, 15, 123456), None])
+def test_cursor_round_trip(sort_value):
+    assert decode_page_cursor(encode_page_cursor(sort_value, 42)) == (sort_value, 42)
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', encode_page_cursor(None, 'x'), 'fA=='])
+def test_decode_rejects_malformed_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_page_cursor(cursor)
+
+
+@pytest.fixture
+def admin_client(app_db):
+    admin = User(email='admin@example.com', password_hash='x', status='approved', is_admin=True,
+                 created_at=datetime(2025, 2, 1))
+    db.session.add(admin)
+    db.session.add_all([
+        User(email=f'member{i}@example.com', password_hash='x', status='approved',
+             created_at=datetime(2025, 1, 1 + i % 3))
+        for i in range(7)
+    ])
+    db.session.commit()
+    # Legacy rows predate the column default
+    undated = [User(email=f'legacy{i}@example.com', password_hash='x', status='approved') for i in range(3)]
+    db.session.add_all(undated)
+    db.session.commit()
+    User.query.filter(User.id.in_([user.id for user in undated])).update({'created_at': None})
+    db.session.commit()
+    
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['session_id'] = session_store.create_session(admin.id)['session_id']
+    return client
+
+
+def _walk_pages(client, max_pages=20):
+    """User ids from following next_cursor through /api/admin/users two at a time"""
+    seen = []
+    cursor = None
+    for _ in range(max_pages):
+        response = client.get('/api/admin/users', query_string={'per_page': 2, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.extend(user['id'] for user in body['users'])
+        cursor = body['next_cursor']
+        if not cursor:
+            return seen
+    pytest.fail('pagination did not terminate')
+
+
+def test_pages_cover_every_user_once_including_null_created_at(admin_client):
+    seen = _walk_pages(admin_client)
+    
+    assert len(seen) == len(set(seen)) == User.query.count()
+    # Undated rows lead, as in Postgres' DESC order
+    assert [db.session.get(User, user_id).created_at for user_id in seen[:3]] == [None] * 3
+
+
+def test_invalid_cursor_returns_400(admin_client):
+    response = admin_client.get('/api/admin/users', query_string={'cursor': 'not-a-cursor'})
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid cursor'}
+
+
+def test_database_defaulted_timestamps_page_without_repeats(app_db):
+    admin = User(email='admin@example.com', password_hash='x', status='approved', is_admin=True)
+    db.session.add(admin)
+    # One flush: every created_at comes from the database default, most within the same second
+    db.session.add_all([User(email=f'member{i}@example.com', password_hash='x') for i in range(5)])
+    db.session.commit()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['session_id'] = session_store.create_session(admin.id)['session_id']
+    
+    seen = _walk_pages(client)
+    
+    assert sorted(seen) == sorted(user.id for user in User.query)
@@ -0,0 +1,67 @@
+"""
+Tests for password_needs_rehash and the lazy rehash on login
+"""
+import pytest
+from argon2 import PasswordHasher
+from werkzeug.security import generate_password_hash
+
+from app import app, db, limiter, User, hash_password, password_needs_rehash, verify_password
+
+PASSWORD = 'correct horse battery staple'
+
+
+def test_legacy_pbkdf2_hash_needs_rehash():
+    legacy = generate_password_hash(PASSWORD, method='pbkdf2:sha256')
+    
+    assert verify_password(PASSWORD, legacy)
+    assert password_needs_rehash(legacy)
+
+
+def test_current_argon2_hash_is_kept():
+    current = hash_password(PASSWORD)
+    
+    assert current.startswith('$argon2')
+    assert verify_password(PASSWORD, current)
+    assert not password_needs_rehash(current)
+
+
+def test_argon2_hash_with_outdated_parameters_needs_rehash():
+    outdated = PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1).hash(PASSWORD)
+    
+    assert verify_password(PASSWORD, outdated)
+    assert password_needs_rehash(outdated)
+
+
+def _login(password):
+    return app.test_client().post('/api/auth/login', json={'email': 'member@example.com', 'password': password})
+
+
+@pytest.fixture
+def legacy_user(app_db):
+    user = User(
+        email='member@example.com',
+        password_hash=generate_password_hash(PASSWORD, method='pbkdf2:sha256'),
+        status='approved'
+    )
+    db.session.add(user)
+    db.session.commit()
+    yield user.id
+    # Leave the per-IP login allowance to the E2E login fixtures
+    limiter.reset()
+
+
+def test_login_upgrades_legacy_hash(legacy_user):
+    response = _login(PASSWORD)
+    
+    assert response.status_code == 200
+    stored = db.session.get(User, legacy_user).password_hash
+    assert stored.startswith('$argon2')
+    assert not password_needs_rehash(stored)
+    assert verify_password(PASSWORD, stored)
+
+
+def test_failed_login_keeps_legacy_hash(legacy_user):
+    response = _login('wrong password')
+    
+    assert response.status_code == 401
+    assert db.session.get(User, legacy_user).password_hash.startswith('pbkdf2:sha256')
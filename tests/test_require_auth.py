@@ -0,0 +1,71 @@
+"""
+Tests for @require_auth: the _auth_guard before_request hook and the placement check
+"""
+from functools import wraps
+
+import pytest
+
+import app as app_module
+from app import app, db, User, session_store, require_auth, check_require_auth_placement
+
+
+@pytest.fixture
+def user_id(app_db):
+    user = User(email='member@example.com', password_hash='x', status='approved')
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+
+def _login(client, user_id):
+    session_data = session_store.create_session(user_id)
+    with client.session_transaction() as sess:
+        sess['session_id'] = session_data['session_id']
+
+
+def test_protected_route_requires_session(user_id):
+    response = app.test_client().get('/api/profile')
+    
+    assert response.status_code == 401
+    assert response.get_json()['code'] == 'AUTH_REQUIRED'
+
+
+def test_protected_route_passes_with_session(user_id):
+    client = app.test_client()
+    _login(client, user_id)
+    
+    response = client.get('/api/profile')
+    
+    assert response.status_code == 200
+    assert response.get_json()['id'] == user_id
+
+
+@pytest.mark.parametrize('path', ['/me/resonance', '/api/me/resonance'])
+def test_resonance_alias_requires_session(user_id, path):
+    client = app.test_client()
+    assert client.get(path).status_code == 401
+    
+    _login(client, user_id)
+    assert client.get(path).status_code == 200
+
+
+def test_placement_check_rejects_wrapped_marker(monkeypatch):
+    monkeypatch.setattr(app_module, '_auth_required_views', [])
+    
+    def outer(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs)
+        return wrapper
+    
+    @outer
+    @require_auth
+    def misplaced_view():
+        return ''
+    
+    with pytest.raises(RuntimeError, match='misplaced_view'):
+        check_require_auth_placement()
+
+
+def test_placement_check_accepts_registered_views():
+    check_require_auth_placement()
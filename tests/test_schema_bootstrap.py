@@ -0,0 +1,80 @@
+"""
+Tests for the import-time schema bootstrap claim shared between workers through Redis
+"""
+import pytest
+
+import app as app_module
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+    
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value.encode()
+        return True
+    
+    def get(self, key):
+        return self.values.get(key)
+    
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(app_module, 'cache_redis', fake)
+    monkeypatch.setattr(app_module, '_database_ready', app_module.threading.Event())
+    return fake
+
+
+def test_first_process_claims_bootstrap(fake_redis):
+    assert app_module._claim_schema_bootstrap()
+    assert fake_redis.get(app_module._schema_bootstrap_key()) == b'running'
+
+
+def test_other_process_waits_for_done(fake_redis, monkeypatch):
+    key = app_module._schema_bootstrap_key()
+    fake_redis.set(key, 'running')
+    polls = []
+    
+    def bootstrap_finishes(seconds):
+        polls.append(seconds)
+        fake_redis.set(key, 'done')
+    
+    monkeypatch.setattr(app_module.time_module, 'sleep', bootstrap_finishes)
+    
+    assert not app_module._claim_schema_bootstrap()
+    assert len(polls) == 1
+
+
+def test_other_process_takes_over_after_failed_bootstrap(fake_redis, monkeypatch):
+    key = app_module._schema_bootstrap_key()
+    fake_redis.set(key, 'running')
+    # The claiming process fails, so _finish_schema_bootstrap releases the key
+    monkeypatch.setattr(app_module.time_module, 'sleep', lambda seconds: app_module._finish_schema_bootstrap())
+    
+    assert app_module._claim_schema_bootstrap()
+
+
+def test_finish_marks_done_only_after_success(fake_redis):
+    key = app_module._schema_bootstrap_key()
+    fake_redis.set(key, 'running')
+    app_module._database_ready.set()
+    
+    app_module._finish_schema_bootstrap()
+    
+    assert fake_redis.get(key) == b'done'
+
+
+def test_done_flag_is_confirmed_against_the_database(fake_redis, monkeypatch):
+    bootstraps = []
+    monkeypatch.setattr(app_module, 'bootstrap_database', lambda: bootstraps.append(1))
+    
+    # An empty in-memory database: the flag outlived the schema, so bootstrap again
+    app_module._confirm_schema_bootstrapped()
+    
+    assert bootstraps == [1]
@@ -0,0 +1,71 @@
+"""
+Tests for send_email_task retry scheduling (retries are timed, never slept on a pool thread)
+"""
+import pytest
+
+import app as app_module
+from app import EmailNotification, send_email_task
+
+RETRYABLE_FAILURE = {'status': 'failed', 'message': 'Email service unavailable', 'retryable': True}
+
+
+class FakeTimer:
+    started = []
+    
+    def __init__(self, interval, function, args=None, kwargs=None):
+        self.interval, self.function, self.args, self.kwargs = interval, function, args, kwargs
+        self.daemon = False
+    
+    def start(self):
+        FakeTimer.started.append(self)
+
+
+@pytest.fixture
+def mailgun(monkeypatch):
+    FakeTimer.started = []
+    monkeypatch.setattr(app_module.threading, 'Timer', FakeTimer)
+    monkeypatch.setattr(app_module.time_module, 'sleep', lambda seconds: pytest.fail('slept on a pool thread'))
+    
+    results = []
+    monkeypatch.setattr(app_module, 'send_email_via_mailgun', lambda *args: results.pop(0))
+    return results
+
+
+def _send(attempt=0):
+    return send_email_task('member@example.com', 'Hi', 'body', 'welcome', None, attempt=attempt)
+
+
+def test_retryable_failure_schedules_next_attempt(app_db, mailgun):
+    mailgun.append(RETRYABLE_FAILURE)
+    
+    assert _send(attempt=2)['status'] == 'failed'
+    
+    (timer,) = FakeTimer.started
+    assert timer.daemon
+    assert 0 <= timer.interval <= app_module.EMAIL_RETRY_BACKOFF_SECONDS * 2 ** 2
+    assert timer.function is app_module.run_in_background
+    assert timer.args[0] is send_email_task
+    assert timer.kwargs == {'attempt': 3}
+    assert EmailNotification.query.count() == 0
+
+
+def test_last_attempt_logs_failure_without_retry(app_db, mailgun):
+    mailgun.append(RETRYABLE_FAILURE)
+    
+    _send(attempt=app_module.EMAIL_MAX_RETRIES)
+    
+    assert FakeTimer.started == []
+    assert EmailNotification.query.one().delivery_status == 'failed'
+
+
+@pytest.mark.parametrize('result', [
+    {'status': 'sent', 'message': 'Email sent successfully'},
+    {'status': 'failed', 'message': 'Email sending failed'},
+])
+def test_success_or_permanent_failure_is_final(app_db, mailgun, result):
+    mailgun.append(result)
+    
+    _send()
+    
+    assert FakeTimer.started == []
+    assert EmailNotification.query.one().delivery_status == result['status']